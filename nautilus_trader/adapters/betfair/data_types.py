@@ -18,6 +18,7 @@ from typing import Dict
 
 import pyarrow as pa
 
+from nautilus_trader.adapters.betfair.util import parse_instrument_id
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.data import Data
 from nautilus_trader.model.data.ticker import Ticker
@@ -80,7 +81,7 @@ class BSPOrderBookDelta(OrderBookDelta):
             else None
         )
         return BSPOrderBookDelta(
-            instrument_id=InstrumentId.from_str(values["instrument_id"][:32]),
+            instrument_id=parse_instrument_id(values["instrument_id"][:32]),
             book_type=BookTypeParser.from_str_py(values["book_type"]),
             action=action,
             order=order,
@@ -128,7 +129,7 @@ class BetfairTicker(Ticker):
 
 def betfair_ticker_from_dict(values: Dict):
     return BetfairTicker(
-        instrument_id=InstrumentId.from_str(values["instrument_id"]),
+        instrument_id=parse_instrument_id(values["instrument_id"]),
         ts_event=values["ts_event"],
         ts_init=values["ts_init"],
         last_traded_price=Price.from_str(values["last_traded_price"])
@@ -14,7 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import time
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
@@ -29,7 +29,6 @@ from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.logging import Logger
 from nautilus_trader.common.providers import InstrumentProvider
 from nautilus_trader.config import InstrumentProviderConfig
-from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.instruments.betting import BettingInstrument
 
 
@@ -67,9 +66,10 @@ class BetfairInstrumentProvider(InstrumentProvider):
         )
 
         self._client = client
-        self._cache: Dict[InstrumentId, BettingInstrument] = {}
         self._account_currency = None
-        self._missing_instruments: Set[BettingInstrument] = set()
+        self._missing_instruments: Set[Tuple[str, str, str]] = set()
+        # Index of (market_id, selection_id, handicap) -> instrument, kept in sync by `add`
+        self._betting_index: Dict[Tuple[str, str, str], BettingInstrument] = {}
 
     @classmethod
     def from_instruments(cls, instruments, logger=None):
@@ -94,11 +94,25 @@ class BetfairInstrumentProvider(InstrumentProvider):
             for metadata in market_metadata.values()
             for instrument in make_instruments(metadata, currency=currency)
         ]
-        for instrument in instruments:
-            self.add(instrument=instrument)
+        self.add_bulk(instruments)
 
         self._log.info(f"{len(instruments)} Instruments created")
 
+    def add(self, instrument: BettingInstrument) -> None:
+        """
+        Add the given instrument to the provider, indexing it for betting lookups.
+
+        Parameters
+        ----------
+        instrument : BettingInstrument
+            The instrument to add.
+
+        """
+        super().add(instrument)
+        key = (instrument.market_id, instrument.selection_id, instrument.selection_handicap)
+        self._betting_index[key] = instrument
+        self._missing_instruments.discard(key)
+
     def load_markets(self, market_filter=None):
         """Search for betfair markets. Useful for debugging / interactive use"""
         return load_markets(client=self._client, market_filter=market_filter)
@@ -121,24 +135,17 @@ class BetfairInstrumentProvider(InstrumentProvider):
         handicap: str,
     ) -> BettingInstrument:
         """Return a betting instrument with performance friendly lookup."""
-        key = (market_id, selection_id, handicap)
-        if key not in self._cache:
+        key = (market_id, selection_id, parse_handicap(handicap))
+        instrument = self._betting_index.get(key)
+        if instrument is None and key not in self._missing_instruments:
             instrument_filter = {
                 "market_id": market_id,
                 "selection_id": selection_id,
-                "selection_handicap": parse_handicap(handicap),
+                "selection_handicap": key[2],
             }
-            instruments = self.search_instruments(instrument_filter=instrument_filter)
-            count = len(instruments)
-            if count < 1:
-                key = (market_id, selection_id, parse_handicap(handicap))
-                if key not in self._missing_instruments:
-                    self._log.warning(f"Found 0 instrument for filter: {instrument_filter}")
-                    self._missing_instruments.add(key)
-                return
-            # assert count == 1, f"Wrong number of instruments: {len(instruments)} for filter: {instrument_filter}"
-            self._cache[key] = instruments[0]
-        return self._cache[key]
+            self._log.warning(f"Found 0 instrument for filter: {instrument_filter}")
+            self._missing_instruments.add(key)
+        return instrument
 
     async def get_account_currency(self) -> str:
         if self._account_currency is None:
@@ -13,11 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from functools import lru_cache
 from functools import partial
 from typing import Dict
 
 import orjson
 
+from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.persistence.external.readers import TextReader
 
 
@@ -87,6 +89,15 @@ def one(iterable):
     return first_value
 
 
+@lru_cache(maxsize=16_384)
+def parse_instrument_id(value: str) -> InstrumentId:
+    """
+    Parse an `InstrumentId` from its string value, memoizing the most recently
+    used results (bounded, as long-running sessions see many markets).
+    """
+    return InstrumentId.from_str(value)
+
+
 def historical_instrument_provider_loader(instrument_provider, line):
     from nautilus_trader.adapters.betfair.providers import make_instruments
 
@@ -26,7 +26,6 @@ import pandas as pd
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport as_utc_index
-from nautilus_trader.core.datetime cimport secs_to_nanos
 from nautilus_trader.model.c_enums.aggressor_side cimport AggressorSide
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.bar cimport BarType
@@ -37,6 +36,14 @@ from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
 
 
+cdef object _index_to_nanos(index):
+    # Convert the index to UNIX nanoseconds in a single vectorized operation
+    if isinstance(index, pd.DatetimeIndex):
+        # The int64 view is always UTC (tz-naive timestamps are taken as UTC)
+        return np.ascontiguousarray(index.asi8, dtype=np.uint64)
+    return np.ascontiguousarray(index, dtype=np.uint64)  # Already nanoseconds
+
+
 cdef class QuoteTickDataWrangler:
     """
     Provides a means of building lists of Nautilus `QuoteTick` objects.
@@ -60,6 +67,7 @@ cdef class QuoteTickDataWrangler:
         Process the give tick dataset into Nautilus `QuoteTick` objects.
 
         Expects columns ['bid', 'ask'] with 'timestamp' index.
+        The index can be a `DatetimeIndex` or int64 UNIX nanoseconds.
         Note: The 'bid_size' and 'ask_size' columns are optional, will then use
         the `default_volume`.
 
@@ -82,15 +90,14 @@ cdef class QuoteTickDataWrangler:
         Condition.false(data.empty, "data.empty")
         Condition.not_none(default_volume, "default_volume")
 
-        as_utc_index(data)
-
         if "bid_size" not in data.columns:
             data["bid_size"] = float(default_volume)
         if "ask_size" not in data.columns:
             data["ask_size"] = float(default_volume)
 
-        cdef uint64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in data.index], dtype=np.uint64)  # noqa
-        cdef uint64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.uint64)  # noqa
+        ts_events_arr = _index_to_nanos(data.index)
+        cdef uint64_t[:] ts_events = ts_events_arr
+        cdef uint64_t[:] ts_inits = ts_events_arr + np.uint64(ts_init_delta)
 
         return list(map(
             self._build_tick,
@@ -207,8 +214,9 @@ cdef class QuoteTickDataWrangler:
                     df_ticks_final.iloc[i + 1] = low
                     df_ticks_final.iloc[i + 2] = high
 
-        cdef uint64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in df_ticks_final.index], dtype=np.uint64)  # noqa
-        cdef uint64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.uint64)  # noqa
+        ts_events_arr = _index_to_nanos(df_ticks_final.index)
+        cdef uint64_t[:] ts_events = ts_events_arr
+        cdef uint64_t[:] ts_inits = ts_events_arr + np.uint64(ts_init_delta)
 
         if is_raw:
             return list(map(
@@ -295,6 +303,8 @@ cdef class TradeTickDataWrangler:
         """
         Process the given trade tick dataset into Nautilus `TradeTick` objects.
 
+        The index can be a `DatetimeIndex` or int64 UNIX nanoseconds.
+
         Parameters
         ----------
         data : pd.DataFrame
@@ -315,10 +325,9 @@ cdef class TradeTickDataWrangler:
         Condition.not_none(data, "data")
         Condition.false(data.empty, "data.empty")
 
-        data = as_utc_index(data)
-
-        cdef uint64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in data.index], dtype=np.uint64)  # noqa
-        cdef uint64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.uint64)  # noqa
+        ts_events_arr = _index_to_nanos(data.index)
+        cdef uint64_t[:] ts_events = ts_events_arr
+        cdef uint64_t[:] ts_inits = ts_events_arr + np.uint64(ts_init_delta)
 
         if is_raw:
             return list(map(
@@ -427,6 +436,7 @@ cdef class BarDataWrangler:
         Process the given bar dataset into Nautilus `Bar` objects.
 
         Expects columns ['open', 'high', 'low', 'close', 'volume'] with 'timestamp' index.
+        The index can be a `DatetimeIndex` or int64 UNIX nanoseconds.
         Note: The 'volume' column is optional, will then use the `default_volume`.
 
         Parameters
@@ -454,13 +464,12 @@ cdef class BarDataWrangler:
         Condition.false(data.empty, "data.empty")
         Condition.not_none(default_volume, "default_volume")
 
-        data = as_utc_index(data)
-
         if "volume" not in data:
             data["volume"] = float(default_volume)
 
-        cdef uint64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in data.index], dtype=np.uint64)  # noqa
-        cdef uint64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.uint64)  # noqa
+        ts_events_arr = _index_to_nanos(data.index)
+        cdef uint64_t[:] ts_events = ts_events_arr
+        cdef uint64_t[:] ts_inits = ts_events_arr + np.uint64(ts_init_delta)
 
         return list(map(
             self._build_bar,
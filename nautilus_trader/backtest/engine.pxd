@@ -33,6 +33,10 @@ cdef class BacktestEngine:
 
     cdef dict _exchanges
     cdef list _data
+    cdef list _data_pending
+    cdef list _data_iterators
+    cdef object _data_stream
+    cdef Data _data_stream_head
     cdef uint64_t _data_len
     cdef uint64_t _index
 
@@ -53,5 +57,7 @@ cdef class BacktestEngine:
     cdef readonly datetime backtest_end
     """The last backtest run time range end (if run).\n\n:returns: `datetime` or ``None``"""
 
+    cdef void _merge_pending_data(self) except *
+    cdef void _build_data_stream(self) except *
     cdef Data _next(self)
     cdef void _advance_time(self, uint64_t now_ns) except *
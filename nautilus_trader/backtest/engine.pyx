@@ -13,9 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import heapq
 import pickle
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Union
 
 import pandas as pd
 
@@ -29,6 +31,7 @@ from nautilus_trader.config import ExecEngineConfig
 from nautilus_trader.config import RiskEngineConfig
 
 from cpython.datetime cimport datetime
+from libc.stdint cimport UINT64_MAX
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.backtest.data_client cimport BacktestDataClient
@@ -71,6 +74,9 @@ from nautilus_trader.trading.strategy cimport Strategy
 from nautilus_trader.trading.trader cimport Trader
 
 
+_ts_init_key = attrgetter("ts_init")
+
+
 cdef class BacktestEngine:
     """
     Provides a backtest engine to run a portfolio of strategies over historical
@@ -105,6 +111,10 @@ cdef class BacktestEngine:
         # Exchanges and data
         self._exchanges = {}
         self._data = []
+        self._data_pending = []
+        self._data_iterators = []
+        self._data_stream = None
+        self._data_stream_head = None
         self._data_len = 0
         self._index = 0
 
@@ -210,6 +220,7 @@ cdef class BacktestEngine:
         """
         The engines internal data stream.
         """
+        self._merge_pending_data()
         return self._data.copy()
 
     @property
@@ -280,49 +291,68 @@ cdef class BacktestEngine:
         Assumes all data elements are of the same type. Adding lists of varying
         data types could result in incorrect backtest logic.
 
+        Notes
+        -----
+        The given data is sorted by `ts_init` and registered as a separate
+        stream. All registered streams are then merged into the internal data
+        stream in a single k-way merge on the next run (or access of `data`),
+        so adding many streams does not re-sort the accumulated data.
+
         """
         Condition.not_empty(data, "data")
 
         first = data[0]
 
-        cdef str data_prepend_str = ""
-        if hasattr(first, "instrument_id"):
-            Condition.true(
-                first.instrument_id in self.kernel.cache.instrument_ids(),
-                f"Instrument {first.instrument_id} for the given data not found in the cache. "
-                "Please add the instrument through `add_instrument()` prior to adding related data.",
-            )
-            # Check client has been registered
-            self._add_market_data_client_if_not_exists(first.instrument_id.venue)
-            data_prepend_str = f"{first.instrument_id} "
-        elif isinstance(first, Bar):
-            Condition.true(
-                first.type.instrument_id in self.kernel.cache.instrument_ids(),
-                f"Instrument {first.type.instrument_id} for the given data not found in the cache. "
-                "Please add the instrument through `add_instrument()` prior to adding related data.",
-            )
-            Condition.equal(
-                first.type.aggregation_source,
-                AggregationSource.EXTERNAL,
-                "bar_type.aggregation_source",
-                "required source",
-            )
-            data_prepend_str = f"{first.type} "
-        else:
-            Condition.not_none(client_id, "client_id")
-            # Check client has been registered
-            self._add_data_client_if_not_exists(client_id)
-            if isinstance(first, GenericData):
-                data_prepend_str = f"{type(data[0].data).__name__} "
+        cdef str data_prepend_str = self._check_data(first, client_id)
 
-        # Add data
-        self._data = sorted(self._data + data, key=lambda x: x.ts_init)
+        # Register data stream (merged on next run)
+        self._data_pending.append(sorted(data, key=_ts_init_key))
 
         self._log.info(
             f"Added {len(data):,} {data_prepend_str}"
             f"{type(first).__name__} element{'' if len(data) == 1 else 's'}.",
         )
 
+    def add_data_iterator(self, data: Iterable[Data], ClientId client_id=None) -> None:
+        """
+        Add the given data iterator to the backtest engine.
+
+        Data elements are pulled lazily from the iterator during the run and
+        merged with all other added data by `ts_init`, so memory use is bounded
+        by the iterators rather than the full data stream. Each iterator is
+        consumed by a single run.
+
+        Parameters
+        ----------
+        data : Iterable[Data]
+            The data iterator (or generator) to add.
+        client_id : ClientId, optional
+            The data client ID to associate with generic data.
+
+        Raises
+        ------
+        ValueError
+            If `instrument_id` for a pulled data element is not found in the cache.
+        ValueError
+            If a pulled data element does not have an `instrument_id` and `client_id` is ``None``.
+
+        Warnings
+        --------
+        This method assumes the iterator yields data elements sorted by `ts_init`.
+        Elements are checked as for `add_data` as they are pulled during the run,
+        so invalid data raises from `run()` rather than from this method.
+
+        """
+        Condition.not_none(data, "data")
+
+        if client_id is not None:
+            # Check client has been registered
+            self._add_data_client_if_not_exists(client_id)
+
+        self._data_iterators.append(self._checked_data(iter(data), client_id))
+
+        self._log.info(f"Added {type(data).__name__} data iterator.")
+
     def dump_pickled_data(self) -> bytes:
         """
         Return the internal data stream pickled.
@@ -332,6 +362,7 @@ cdef class BacktestEngine:
         bytes
 
         """
+        self._merge_pending_data()
         return pickle.dumps(self._data)
 
     def load_pickled_data(self, bytes data) -> None:
@@ -353,6 +384,7 @@ cdef class BacktestEngine:
         Condition.not_none(data, "data")
 
         self._data = pickle.loads(data)
+        self._data_pending.clear()
 
         self._log.info(
             f"Loaded {len(self._data):,} data "
@@ -559,6 +591,10 @@ cdef class BacktestEngine:
         Clear the engines internal data stream.
         """
         self._data.clear()
+        self._data_pending.clear()
+        self._data_iterators.clear()
+        self._data_stream = None
+        self._data_stream_head = None
         self._data_len = 0
         self._index = 0
 
@@ -585,6 +621,9 @@ cdef class BacktestEngine:
         if self.kernel.writer is not None:
             self.kernel.writer.close()
 
+        if self.kernel.cache_db is not None:
+            self.kernel.cache_db.close()
+
     def run(
         self,
         start: Union[datetime, str, int]=None,
@@ -712,23 +751,37 @@ cdef class BacktestEngine:
     ):
         cdef uint64_t start_ns
         cdef uint64_t end_ns
+        # Merge any pending data streams
+        self._merge_pending_data()
+        if self._data_iterators:
+            self._build_data_stream()
+
         # Time range check and set
         if start is None:
             # Set `start` to start of data
-            start_ns = self._data[0].ts_init
+            if self._data_stream is not None:
+                Condition.not_none(self._data_stream_head, "data")
+                start_ns = self._data_stream_head.ts_init
+            else:
+                start_ns = self._data[0].ts_init
             start = unix_nanos_to_dt(start_ns)
         else:
             start = pd.to_datetime(start, utc=True)
             start_ns = int(start.to_datetime64())
         if end is None:
-            # Set `end` to end of data
-            end_ns = self._data[-1].ts_init
-            end = unix_nanos_to_dt(end_ns)
+            if self._data_stream is not None:
+                # Run until the data stream is exhausted
+                end_ns = UINT64_MAX
+            else:
+                # Set `end` to end of data
+                end_ns = self._data[-1].ts_init
+                end = unix_nanos_to_dt(end_ns)
         else:
             end = pd.to_datetime(end, utc=True)
             end_ns = int(end.to_datetime64())
         Condition.true(start_ns < end_ns, "start was >= end")
-        Condition.not_empty(self._data, "data")
+        if self._data_stream is None:
+            Condition.not_empty(self._data, "data")
 
         # Set clocks
         self.kernel.clock.set_time(start_ns)
@@ -755,15 +808,20 @@ cdef class BacktestEngine:
 
         self._log_run(start, end)
 
-        # Set data stream length
-        self._data_len = len(self._data)
-
-        # Set starting index
         cdef uint64_t i
-        for i in range(self._data_len):
-            if start_ns <= self._data[i].ts_init:
-                self._index = i
-                break
+        if self._data_stream is not None:
+            # Skip to start of data stream
+            while self._data_stream_head is not None and self._data_stream_head.ts_init < start_ns:
+                self._data_stream_head = next(self._data_stream, None)
+        else:
+            # Set data stream length
+            self._data_len = len(self._data)
+
+            # Set starting index
+            for i in range(self._data_len):
+                if start_ns <= self._data[i].ts_init:
+                    self._index = i
+                    break
 
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
         cdef Data data = self._next()
@@ -790,6 +848,10 @@ cdef class BacktestEngine:
             exchange.process(self.kernel.clock.timestamp_ns())
         # ---------------------------------------------------------------------#
 
+        # Iterators are consumed by a single run
+        self._data_stream = None
+        self._data_stream_head = None
+
     def _end(self):
         self.kernel.trader.stop()
         # Process remaining messages
@@ -801,7 +863,46 @@ cdef class BacktestEngine:
 
         self._log_post_run()
 
+    cdef void _merge_pending_data(self) except *:
+        if not self._data_pending:
+            return
+
+        cdef list streams = self._data_pending
+        if self._data:
+            streams.insert(0, self._data)
+
+        if len(streams) == 1:
+            self._data = streams[0]
+        else:
+            # Streams are individually sorted, heapq.merge is stable so elements
+            # with equal `ts_init` retain the order in which they were added.
+            self._data = list(heapq.merge(*streams, key=_ts_init_key))
+
+        self._data_pending = []
+
+    cdef void _build_data_stream(self) except *:
+        cdef list sources = self._data_iterators
+        if self._data:
+            # Merge with any data already added to the engine
+            sources.insert(0, iter(self._data))
+
+        if len(sources) == 1:
+            self._data_stream = sources[0]
+        else:
+            self._data_stream = heapq.merge(*sources, key=_ts_init_key)
+
+        self._data_iterators = []
+        self._data_stream_head = next(self._data_stream, None)
+
     cdef Data _next(self):
+        cdef Data data
+        if self._data_stream is not None:
+            # Pull from lazy data stream (single element lookahead)
+            data = self._data_stream_head
+            if data is not None:
+                self._data_stream_head = next(self._data_stream, None)
+            return data
+
         cdef uint64_t cursor = self._index
         self._index += 1
         if cursor < self._data_len:
@@ -848,7 +949,7 @@ cdef class BacktestEngine:
         self._log.info(f"Run started:    {self.run_started}")
         self._log.info(f"Backtest start: {self.backtest_start}")
         self._log.info(f"Batch start:    {start}")
-        self._log.info(f"Batch end:      {end}")
+        self._log.info(f"Batch end:      {end if end is not None else 'until data exhausted'}")
         self._log.info("\033[36m-----------------------------------------------------------------")
 
     def _log_post_run(self):
@@ -946,6 +1047,53 @@ cdef class BacktestEngine:
                 self._log.info(stat)
             self._log.info("\033[36m-----------------------------------------------------------------")
 
+    def _check_data(self, first, ClientId client_id) -> str:
+        # Check the instrument or data client for `first` (registering clients
+        # if needed), returning the description prefix for logging.
+        data_prepend_str = ""
+        if hasattr(first, "instrument_id"):
+            Condition.true(
+                first.instrument_id in self.kernel.cache.instrument_ids(),
+                f"Instrument {first.instrument_id} for the given data not found in the cache. "
+                "Please add the instrument through `add_instrument()` prior to adding related data.",
+            )
+            # Check client has been registered
+            self._add_market_data_client_if_not_exists(first.instrument_id.venue)
+            data_prepend_str = f"{first.instrument_id} "
+        elif isinstance(first, Bar):
+            Condition.true(
+                first.type.instrument_id in self.kernel.cache.instrument_ids(),
+                f"Instrument {first.type.instrument_id} for the given data not found in the cache. "
+                "Please add the instrument through `add_instrument()` prior to adding related data.",
+            )
+            Condition.equal(
+                first.type.aggregation_source,
+                AggregationSource.EXTERNAL,
+                "bar_type.aggregation_source",
+                "required source",
+            )
+            data_prepend_str = f"{first.type} "
+        else:
+            Condition.not_none(client_id, "client_id")
+            # Check client has been registered
+            self._add_data_client_if_not_exists(client_id)
+            if isinstance(first, GenericData):
+                data_prepend_str = f"{type(first.data).__name__} "
+
+        return data_prepend_str
+
+    def _checked_data(self, iterator, ClientId client_id):
+        # Check each instrument, bar type or data type as it is first pulled
+        checked = set()
+        for data in iterator:
+            key = getattr(data, "instrument_id", None)
+            if key is None:
+                key = data.type if isinstance(data, Bar) else type(data)
+            if key not in checked:
+                self._check_data(data, client_id)
+                checked.add(key)
+            yield data
+
     def _add_data_client_if_not_exists(self, ClientId client_id) -> None:
         if client_id not in self.kernel.data_engine.registered_clients:
             client = BacktestDataClient(
@@ -99,8 +99,7 @@ cdef class SimulatedExchange:
     cdef dict _last_bid_bars
     cdef dict _last_ask_bars
     cdef dict _order_index
-    cdef dict _orders_bid
-    cdef dict _orders_ask
+    cdef dict _matching_cores
     cdef dict _oto_orders
     cdef bint _bar_execution
 
@@ -109,7 +108,7 @@ cdef class SimulatedExchange:
     cdef int _executions_count
     cdef Queue _message_queue
     cdef list _inflight_queue
-    cdef dict _inflight_counter
+    cdef uint64_t _inflight_seq
 
     cpdef Price best_bid_price(self, InstrumentId instrument_id)
     cpdef Price best_ask_price(self, InstrumentId instrument_id)
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from decimal import Decimal
+from heapq import heappop
 from heapq import heappush
 from typing import Dict
 
@@ -24,6 +25,7 @@ from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.backtest.execution_client cimport BacktestExecClient
+from nautilus_trader.backtest.matching_core cimport MatchingCore
 from nautilus_trader.backtest.models cimport FillModel
 from nautilus_trader.backtest.models cimport LatencyModel
 from nautilus_trader.backtest.modules cimport SimulationModule
@@ -215,16 +217,15 @@ cdef class SimulatedExchange:
         self._last_bid_bars = {}  # type: dict[InstrumentId, Bar]
         self._last_ask_bars = {}  # type: dict[InstrumentId, Bar]
         self._order_index = {}    # type: dict[ClientOrderId, Order]
-        self._orders_bid = {}     # type: dict[InstrumentId, list[Order]]
-        self._orders_ask = {}     # type: dict[InstrumentId, list[Order]]
+        self._matching_cores = {}  # type: dict[InstrumentId, MatchingCore]
         self._oto_orders = {}     # type: dict[ClientOrderId]
 
         self._symbol_pos_count = {}  # type: dict[InstrumentId, int]
         self._symbol_ord_count = {}  # type: dict[InstrumentId, int]
         self._executions_count = 0
         self._message_queue = Queue()
-        self._inflight_queue = []
-        self._inflight_counter = {}
+        self._inflight_queue = []  # Heap of ((ts, seq), command)
+        self._inflight_seq = 0
 
     def __repr__(self) -> str:
         return (
@@ -362,13 +363,14 @@ cdef class SimulatedExchange:
 
         """
         cdef list bids = []
+        cdef MatchingCore core
         if instrument_id is None:
-            for orders in self._orders_bid.values():
-                for o in orders:
-                    bids.append(o)
+            for core in self._matching_cores.values():
+                bids.extend(core.get_bid_orders())
             return bids
         else:
-            return [o for o in self._orders_bid.get(instrument_id, [])]
+            core = self._matching_cores.get(instrument_id)
+            return core.get_bid_orders() if core is not None else bids
 
     cpdef list get_open_ask_orders(self, InstrumentId instrument_id=None):
         """
@@ -385,13 +387,14 @@ cdef class SimulatedExchange:
 
         """
         cdef list asks = []
+        cdef MatchingCore core
         if instrument_id is None:
-            for orders in self._orders_ask.values():
-                for o in orders:
-                    asks.append(o)
+            for core in self._matching_cores.values():
+                asks.extend(core.get_ask_orders())
             return asks
         else:
-            return [o for o in self._orders_ask.get(instrument_id, [])]
+            core = self._matching_cores.get(instrument_id)
+            return core.get_ask_orders() if core is not None else asks
 
     cpdef Account get_account(self):
         """
@@ -532,10 +535,9 @@ cdef class SimulatedExchange:
             ts = command.ts_init + self.latency_model.cancel_latency_nanos
         else:  # pragma: no cover (design-time error)
             raise ValueError(f"invalid command, was {command}")
-        if ts not in self._inflight_counter:
-            self._inflight_counter[ts] = 0
-        self._inflight_counter[ts] += 1
-        cdef (int64_t, int64_t) key = (ts, self._inflight_counter[ts])
+        # Monotonic sequence ensures FIFO ordering for identical timestamps
+        self._inflight_seq += 1
+        cdef (int64_t, uint64_t) key = (ts, self._inflight_seq)
         return key, command
 
     cpdef void process_order_book(self, OrderBookData data) except *:
@@ -656,6 +658,17 @@ cdef class SimulatedExchange:
             self._log.debug(f"Processed {bar}")
 
     cdef void _process_trade_ticks_from_bar(self, OrderBook book, Bar bar) except *:
+        # The book is always updated through the bar, however the matching engine
+        # only needs iterating if a resting order could be touched by the bars range.
+        cdef MatchingCore core = self._matching_cores.get(book.instrument_id)
+        cdef bint iterate = core is not None and core.is_touched(
+            bar.low,
+            bar.high,
+            bar.low,
+            bar.high,
+            bar.ts_event,
+        )
+
         cdef Quantity size = Quantity(bar.volume.as_f64_c() / 4.0, bar.volume._mem.precision)
         cdef Price last = self._last.get(book.instrument_id)
 
@@ -673,10 +686,11 @@ cdef class SimulatedExchange:
         # Open
         if last is None or bar.open._mem.raw != last._mem.raw:  # Direct memory comparison
             book.update_trade_tick(tick)
-            self._iterate_matching_engine(
-                tick.instrument_id,
-                tick.ts_init,
-            )
+            if iterate:
+                self._iterate_matching_engine(
+                    tick.instrument_id,
+                    tick.ts_init,
+                )
             last = bar.open
 
         # High
@@ -685,10 +699,11 @@ cdef class SimulatedExchange:
             tick._mem.aggressor_side = <OrderSide>AggressorSide.BUY  # Direct memory assignment
             tick._mem.trade_id = self._generate_trade_id()._mem
             book.update_trade_tick(tick)
-            self._iterate_matching_engine(
-                tick.instrument_id,
-                tick.ts_init,
-            )
+            if iterate:
+                self._iterate_matching_engine(
+                    tick.instrument_id,
+                    tick.ts_init,
+                )
             last = bar.high
 
         # Low
@@ -697,10 +712,11 @@ cdef class SimulatedExchange:
             tick._mem.aggressor_side = <OrderSide>AggressorSide.SELL
             tick._mem.trade_id = self._generate_trade_id()._mem
             book.update_trade_tick(tick)
-            self._iterate_matching_engine(
-                tick.instrument_id,
-                tick.ts_init,
-            )
+            if iterate:
+                self._iterate_matching_engine(
+                    tick.instrument_id,
+                    tick.ts_init,
+                )
             last = bar.low
 
         # Close
@@ -709,10 +725,11 @@ cdef class SimulatedExchange:
             tick._mem.aggressor_side = <OrderSide>AggressorSide.BUY if bar.close._mem.raw > last._mem.raw else <OrderSide>AggressorSide.SELL
             tick._mem.trade_id = self._generate_trade_id()._mem
             book.update_trade_tick(tick)
-            self._iterate_matching_engine(
-                tick.instrument_id,
-                tick.ts_init,
-            )
+            if iterate:
+                self._iterate_matching_engine(
+                    tick.instrument_id,
+                    tick.ts_init,
+                )
             last = bar.close
 
         self._last[book.instrument_id] = last
@@ -727,6 +744,17 @@ cdef class SimulatedExchange:
         if last_bid_bar.ts_event != last_ask_bar.ts_event:
             return  # Wait for next bar
 
+        # The book is always updated through the bars, however the matching engine
+        # only needs iterating if a resting order could be touched by the bars ranges.
+        cdef MatchingCore core = self._matching_cores.get(book.instrument_id)
+        cdef bint iterate = core is not None and core.is_touched(
+            last_bid_bar.low,
+            last_bid_bar.high,
+            last_ask_bar.low,
+            last_ask_bar.high,
+            last_ask_bar.ts_init,
+        )
+
         cdef Quantity bid_size = Quantity(last_bid_bar.volume.as_f64_c() / 4.0, last_bid_bar.volume._mem.precision)
         cdef Quantity ask_size = Quantity(last_ask_bar.volume.as_f64_c() / 4.0, last_ask_bar.volume._mem.precision)
 
@@ -743,37 +771,41 @@ cdef class SimulatedExchange:
 
         # Open
         book.update_quote_tick(tick)
-        self._iterate_matching_engine(
-            tick.instrument_id,
-            tick.ts_init,
-        )
+        if iterate:
+            self._iterate_matching_engine(
+                tick.instrument_id,
+                tick.ts_init,
+            )
 
         # High
         tick._mem.bid = last_bid_bar.high._mem  # Direct memory assignment
         tick._mem.ask = last_ask_bar.high._mem  # Direct memory assignment
         book.update_quote_tick(tick)
-        self._iterate_matching_engine(
-            tick.instrument_id,
-            tick.ts_init,
-        )
+        if iterate:
+            self._iterate_matching_engine(
+                tick.instrument_id,
+                tick.ts_init,
+            )
 
         # Low
         tick._mem.bid = last_bid_bar.low._mem  # Assigning memory directly
         tick._mem.ask = last_ask_bar.low._mem  # Assigning memory directly
         book.update_quote_tick(tick)
-        self._iterate_matching_engine(
-            tick.instrument_id,
-            tick.ts_init,
-        )
+        if iterate:
+            self._iterate_matching_engine(
+                tick.instrument_id,
+                tick.ts_init,
+            )
 
         # Close
         tick._mem.bid = last_bid_bar.close._mem  # Assigning memory directly
         tick._mem.ask = last_ask_bar.close._mem  # Assigning memory directly
         book.update_quote_tick(tick)
-        self._iterate_matching_engine(
-            tick.instrument_id,
-            tick.ts_init,
-        )
+        if iterate:
+            self._iterate_matching_engine(
+                tick.instrument_id,
+                tick.ts_init,
+            )
 
     cpdef void process(self, uint64_t now_ns) except *:
         """
@@ -796,8 +828,7 @@ cdef class SimulatedExchange:
             ts = self._inflight_queue[0][0][0]
             if ts <= now_ns:
                 # Place message on queue to be processed
-                self._message_queue.put_nowait(self._inflight_queue.pop(0)[1])
-                self._inflight_counter.pop(ts, None)
+                self._message_queue.put_nowait(heappop(self._inflight_queue)[1])
             else:
                 break
 
@@ -846,8 +877,8 @@ cdef class SimulatedExchange:
                     self._cancel_order(order)
             elif isinstance(command, CancelAllOrders):
                 orders = (
-                    self._orders_bid.get(command.instrument_id, [])
-                    + self._orders_ask.get(command.instrument_id, [])
+                    self.get_open_bid_orders(command.instrument_id)
+                    + self.get_open_ask_orders(command.instrument_id)
                 )
                 for order in orders:
                     if order.is_inflight_c() or order.is_open_c():
@@ -882,15 +913,14 @@ cdef class SimulatedExchange:
         self._last_bid_bars.clear()
         self._last_ask_bars.clear()
         self._order_index.clear()
-        self._orders_bid.clear()
-        self._orders_ask.clear()
+        self._matching_cores.clear()
 
         self._symbol_pos_count.clear()
         self._symbol_ord_count.clear()
         self._executions_count = 0
         self._message_queue = Queue()
         self._inflight_queue.clear()
-        self._inflight_counter.clear()
+        self._inflight_seq = 0
 
         self._log.info("Reset.")
 
@@ -1163,17 +1193,9 @@ cdef class SimulatedExchange:
         if order.venue_order_id is None:
             order.venue_order_id = self._generate_venue_order_id(order.instrument_id)
 
-        cdef:
-            list orders_bid
-            list orders_ask
-        if order.is_buy_c():
-            orders_bid = self._orders_bid.get(order.instrument_id)
-            if orders_bid and order in orders_bid:
-                orders_bid.remove(order)
-        elif order.is_sell_c():
-            orders_ask = self._orders_ask.get(order.instrument_id)
-            if orders_ask and order in orders_ask:
-                orders_ask.remove(order)
+        cdef MatchingCore core = self._matching_cores.get(order.instrument_id)
+        if core is not None:
+            core.delete(order)
 
         self._generate_order_canceled(order)
 
@@ -1203,46 +1225,36 @@ cdef class SimulatedExchange:
         # Index order
         self._order_index[order.client_order_id] = order
 
-        if order.is_buy_c():
-            orders_bid = self._orders_bid.get(order.instrument_id)
-            if orders_bid is None:
-                orders_bid = []
-                self._orders_bid[order.instrument_id] = orders_bid
-            orders_bid.append(order)
-            orders_bid.sort(key=lambda o: o.price if o.type == OrderType.LIMIT or (o.type == OrderType.STOP_LIMIT and o.is_triggered) else o.trigger_price, reverse=True)  # noqa  TODO(cs): Will refactor!
-        elif order.is_sell_c():
-            orders_ask = self._orders_ask.get(order.instrument_id)
-            if orders_ask is None:
-                orders_ask = []
-                self._orders_ask[order.instrument_id] = orders_ask
-            orders_ask.append(order)
-            orders_ask.sort(key=lambda o: o.price if o.type == OrderType.LIMIT or (o.type == OrderType.STOP_LIMIT and o.is_triggered) else o.trigger_price)  # noqa  TODO(cs): Will refactor!
+        cdef MatchingCore core = self._matching_cores.get(order.instrument_id)
+        if core is None:
+            core = MatchingCore(order.instrument_id)
+            self._matching_cores[order.instrument_id] = core
+        core.add(order)
 
     cdef void _delete_order(self, Order order) except *:
         self._order_index.pop(order.client_order_id, None)
 
-        if order.is_buy_c():
-            orders_bid = self._orders_bid.get(order.instrument_id)
-            if orders_bid is not None:
-                orders_bid.remove(order)
-        elif order.is_sell_c():
-            orders_ask = self._orders_ask.get(order.instrument_id)
-            if orders_ask is not None:
-                orders_ask.remove(order)
+        cdef MatchingCore core = self._matching_cores.get(order.instrument_id)
+        if core is not None:
+            core.delete(order)
 
     cdef void _iterate_matching_engine(
         self, InstrumentId instrument_id,
         uint64_t timestamp_ns,
     ) except *:
-        # Iterate bids
-        cdef list orders_bid = self._orders_bid.get(instrument_id)
-        if orders_bid is not None:
-            self._iterate_side(orders_bid.copy(), timestamp_ns)  # Copy list for safe loop
-
-        # Iterate asks
-        cdef list orders_ask = self._orders_ask.get(instrument_id)
-        if orders_ask is not None:
-            self._iterate_side(orders_ask.copy(), timestamp_ns)  # Copy list for safe loop
+        cdef MatchingCore core = self._matching_cores.get(instrument_id)
+        if core is None or len(core) == 0:
+            return  # No resting orders
+
+        # Only visit the orders crossed by the market (or expired)
+        self._iterate_side(
+            core.orders_to_match(
+                self.best_bid_price(instrument_id),
+                self.best_ask_price(instrument_id),
+                timestamp_ns,
+            ),
+            timestamp_ns,
+        )
 
     cdef void _iterate_side(self, list orders, uint64_t timestamp_ns) except *:
         cdef Order order
@@ -1809,6 +1821,10 @@ cdef class SimulatedExchange:
             venue_order_id = self._generate_venue_order_id(order.instrument_id)
             venue_order_id_modified = True
 
+        # Resting orders are re-indexed once the update has been applied
+        cdef MatchingCore core = self._matching_cores.get(order.instrument_id)
+        cdef bint is_resting = core is not None and core.delete(order)
+
         self.exec_client.generate_order_updated(
             strategy_id=order.strategy_id,
             instrument_id=order.instrument_id,
@@ -1821,6 +1837,9 @@ cdef class SimulatedExchange:
             venue_order_id_modified=venue_order_id_modified,
         )
 
+        if is_resting:
+            core.add(order)
+
     cdef void _generate_order_canceled(self, Order order) except *:
         self.exec_client.generate_order_canceled(
             strategy_id=order.strategy_id,
@@ -1831,6 +1850,10 @@ cdef class SimulatedExchange:
         )
 
     cdef void _generate_order_triggered(self, Order order) except *:
+        # Triggered orders are re-indexed on their limit price
+        cdef MatchingCore core = self._matching_cores.get(order.instrument_id)
+        cdef bint is_resting = core is not None and core.delete(order)
+
         self.exec_client.generate_order_triggered(
             strategy_id=order.strategy_id,
             instrument_id=order.instrument_id,
@@ -1839,6 +1862,9 @@ cdef class SimulatedExchange:
             ts_event=self._clock.timestamp_ns(),
         )
 
+        if is_resting:
+            core.add(order)
+
     cdef void _generate_order_expired(self, Order order) except *:
         self.exec_client.generate_order_expired(
             strategy_id=order.strategy_id,
@@ -13,10 +13,18 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from nautilus_trader.backtest.node import BacktestNode
+from nautilus_trader.backtest.node import init_worker_logging
+from nautilus_trader.backtest.results import BacktestResult
 
 
 try:
@@ -29,11 +37,14 @@ from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.logging import Logger
 from nautilus_trader.common.logging import LoggerAdapter
 from nautilus_trader.common.logging import LogLevel
+from nautilus_trader.config import BacktestDataConfig
 from nautilus_trader.config import BacktestRunConfig
 from nautilus_trader.config import ImportableStrategyConfig
 from nautilus_trader.config import StrategyConfig
+from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.model.data.bar import BarType
 from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.persistence.funcs import tokenize
 
 
 class HyperoptBacktestNode(BacktestNode):
@@ -84,10 +95,20 @@ class HyperoptBacktestNode(BacktestNode):
         params: Dict[str, Any],
         minimum_positions: int = 50,
         max_evals: int = 50,
+        n_workers: Optional[int] = None,
+        log_dir: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Run with hyperopt to optimize strategy parameters.
 
+        If `n_workers` is greater than one then trials are suggested in batches
+        of `n_workers` and evaluated concurrently in a pool of spawned worker
+        processes, with each trial result logged as it completes. For one-shot
+        runs each worker loads the (read-only) catalog data once and reuses it
+        for all subsequent trials it evaluates. Streaming runs (configs with
+        `batch_size_bytes`) keep their bounded memory use, and so re-read the
+        catalog for every trial.
+
         Parameters
         ----------
         params : Dict[str, Any]
@@ -96,6 +117,11 @@ class HyperoptBacktestNode(BacktestNode):
             The minimum number of positions to accept a gradient.
         max_evals : int, default 50
             The maximum number of evaluations for the optimization problem.
+        n_workers : int, optional
+            The number of worker processes to evaluate trials with.
+        log_dir : str, optional
+            The directory to write per-worker log files to (when running with
+            worker processes). If ``None`` then workers log to stdout.
 
         Returns
         -------
@@ -106,6 +132,8 @@ class HyperoptBacktestNode(BacktestNode):
         ------
         ImportError
             If hyperopt is not available.
+        ValueError
+            If `n_workers` is not positive.
 
         """
         if hyperopt is None:
@@ -113,23 +141,26 @@ class HyperoptBacktestNode(BacktestNode):
                 "The hyperopt package is not installed. "
                 "Please install via pip or poetry install -E hyperopt",
             )
+        if n_workers is not None:
+            PyCondition.positive_int(n_workers, "n_workers")
 
         logger = Logger(clock=LiveClock(), level_stdout=LogLevel.INFO)
         logger_adapter = LoggerAdapter(component_name="HYPEROPT_LOGGER", logger=logger)
 
-        def objective(args):
-            logger_adapter.info(f"Searching with {args}")
-
-            config = ImportableStrategyConfig(
-                strategy_path=self.strategy_path,
-                config_path=self.config_path,
-                config=args,
+        if n_workers is not None and n_workers > 1:
+            return self._hyperopt_search_parallel(
+                params=params,
+                minimum_positions=minimum_positions,
+                max_evals=max_evals,
+                n_workers=n_workers,
+                log_dir=log_dir,
+                logger_adapter=logger_adapter,
             )
 
-            local_config: BacktestRunConfig = self.config
-            local_config.engine.strategies = [config]
+        def objective(args):
+            logger_adapter.info(f"Searching with {args}")
 
-            local_config.check()
+            local_config: BacktestRunConfig = self._trial_config(args)
 
             try:
                 result = self._run(
@@ -138,24 +169,9 @@ class HyperoptBacktestNode(BacktestNode):
                     venue_configs=local_config.venues,
                     data_configs=local_config.data,
                     batch_size_bytes=local_config.batch_size_bytes,
+                    prefetch_batches=local_config.prefetch_batches,
                 )
-
-                base_currency = self.config.venues[0].base_currency
-                # logger_adapter.info(f"{result.stats_pnls[base_currency]}")
-                pnl_pct = result.stats_pnls[base_currency]["PnL%"]
-                profit_factor = result.stats_returns["Profit Factor"]
-                logger_adapter.info(f"OBJECTIVE: {1/pnl_pct}")
-                # win_rate = result.stats_pnls['USDT']['Win Rate']
-
-                if (
-                    (1 / profit_factor) == 0
-                    or profit_factor <= 0
-                    or result.total_positions < minimum_positions
-                ):
-                    ret = {"status": hyperopt.STATUS_FAIL}
-                else:
-                    ret = {"status": hyperopt.STATUS_OK, "loss": (1 / profit_factor)}
-
+                ret = self._objective_result(result, minimum_positions, logger_adapter)
             except Exception as ex:
                 ret = {"status": hyperopt.STATUS_FAIL}
                 logger_adapter.error(f"Bankruptcy : {ex} ")
@@ -170,3 +186,125 @@ class HyperoptBacktestNode(BacktestNode):
             trials=trials,
             max_evals=max_evals,
         )
+
+    def _hyperopt_search_parallel(
+        self,
+        params: Dict[str, Any],
+        minimum_positions: int,
+        max_evals: int,
+        n_workers: int,
+        log_dir: Optional[str],
+        logger_adapter: LoggerAdapter,
+    ) -> Dict[str, Any]:
+        if log_dir is not None:
+            os.makedirs(log_dir, exist_ok=True)
+
+        domain = hyperopt.Domain(fn=None, expr=params)
+        trials = hyperopt.Trials()
+        rstate = np.random.default_rng()
+
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker_logging,
+            initargs=(log_dir,),
+        ) as executor:
+            while len(trials) < max_evals:
+                # Suggest the next batch of trials from all completed trials
+                n_trials = min(n_workers, max_evals - len(trials))
+                new_ids: List[int] = trials.new_trial_ids(n_trials)
+                trials.refresh()
+                docs: List[Dict] = hyperopt.tpe.suggest(
+                    new_ids,
+                    domain,
+                    trials,
+                    rstate.integers(2**31 - 1),
+                )
+
+                futures = {}
+                for doc in docs:
+                    args = hyperopt.space_eval(params, hyperopt.base.spec_from_misc(doc["misc"]))
+                    logger_adapter.info(f"Searching with {args}")
+                    future = executor.submit(_run_trial, self._trial_config(args))
+                    futures[future] = doc
+
+                for future in as_completed(futures):
+                    doc = futures[future]
+                    try:
+                        result = self._objective_result(
+                            future.result(),
+                            minimum_positions,
+                            logger_adapter,
+                        )
+                    except Exception as ex:
+                        result = {"status": hyperopt.STATUS_FAIL}
+                        logger_adapter.error(f"Bankruptcy : {ex} ")
+                    logger_adapter.info(f"Trial {doc['tid']} completed: {result}")
+                    doc["state"] = hyperopt.JOB_STATE_DONE
+                    doc["result"] = result
+
+                trials.insert_trial_docs(docs)
+                trials.refresh()
+
+        return trials.argmin
+
+    def _trial_config(self, args: Dict[str, Any]) -> BacktestRunConfig:
+        config = ImportableStrategyConfig(
+            strategy_path=self.strategy_path,
+            config_path=self.config_path,
+            config=args,
+        )
+
+        # Copied as the config is serialized for worker processes asynchronously
+        local_config: BacktestRunConfig = self.config.replace(
+            engine=self.config.engine.copy(update={"strategies": [config]}),
+        )
+
+        local_config.check()
+
+        return local_config
+
+    def _objective_result(
+        self,
+        result: BacktestResult,
+        minimum_positions: int,
+        logger_adapter: LoggerAdapter,
+    ) -> Dict[str, Any]:
+        base_currency = self.config.venues[0].base_currency
+        # logger_adapter.info(f"{result.stats_pnls[base_currency]}")
+        pnl_pct = result.stats_pnls[base_currency]["PnL%"]
+        profit_factor = result.stats_returns["Profit Factor"]
+        logger_adapter.info(f"OBJECTIVE: {1/pnl_pct}")
+        # win_rate = result.stats_pnls['USDT']['Win Rate']
+
+        if (
+            (1 / profit_factor) == 0
+            or profit_factor <= 0
+            or result.total_positions < minimum_positions
+        ):
+            return {"status": hyperopt.STATUS_FAIL}
+        else:
+            return {"status": hyperopt.STATUS_OK, "loss": (1 / profit_factor)}
+
+
+# Per worker process cache of loaded data (read-only, shared between trials)
+_WORKER_DATA_CACHE: Dict[str, Dict] = {}
+
+
+class _CachedDataBacktestNode(BacktestNode):
+    # Only one-shot runs load data through `_load_data`, streaming runs are not cached
+    def _load_data(self, config: BacktestDataConfig) -> Dict:
+        key = tokenize(config)
+        data = _WORKER_DATA_CACHE.get(key)
+        if data is None:
+            data = super()._load_data(config)
+            _WORKER_DATA_CACHE[key] = data
+        return data
+
+
+def _run_trial(config: BacktestRunConfig) -> BacktestResult:
+    node = _CachedDataBacktestNode(configs=[config])
+    try:
+        return node.run()[0]
+    finally:
+        node.dispose()
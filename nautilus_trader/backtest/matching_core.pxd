@@ -0,0 +1,44 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.orders.base cimport Order
+
+
+cdef class MatchingCore:
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the matching core.\n\n:returns: `InstrumentId`"""
+
+    cdef uint64_t _seq
+    cdef list _keys
+    cdef list _entries
+    cdef dict _index
+    cdef list _expiring
+
+    cpdef list get_bid_orders(self)
+    cpdef list get_ask_orders(self)
+    cpdef bint contains(self, Order order) except *
+    cpdef void add(self, Order order) except *
+    cpdef bint delete(self, Order order) except *
+    cpdef list orders_to_match(self, Price bid, Price ask, uint64_t timestamp_ns)
+    cpdef bint is_touched(self, Price bid_low, Price bid_high, Price ask_low, Price ask_high, uint64_t timestamp_ns) except *
+    cpdef void clear(self) except *
+
+    cdef bint _is_live(self, tuple entry) except *
+    cdef list _expired_entries(self, uint64_t timestamp_ns)
+    cdef list _sorted_orders(self, int limit_index, int stop_index)
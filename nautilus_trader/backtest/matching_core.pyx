@@ -0,0 +1,327 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.collections cimport bisect_left
+from nautilus_trader.core.collections cimport bisect_right
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.model.c_enums.order_type cimport OrderType
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.orders.base cimport Order
+
+
+# Indexes into the per-side sorted structures
+cdef int _BID_LIMIT = 0
+cdef int _BID_STOP = 1
+cdef int _ASK_LIMIT = 2
+cdef int _ASK_STOP = 3
+
+
+cdef class MatchingCore:
+    """
+    Provides a price-sorted index of the resting orders for a single instrument
+    within a simulated exchange.
+
+    Orders which match on their limit price (``LIMIT`` and triggered
+    ``STOP_LIMIT`` / ``LIMIT_IF_TOUCHED``) are indexed separately from orders
+    which match on their trigger price, so that on each market update only the
+    orders whose price is crossed by the best bid/ask need to be visited.
+    Orders at the same price are kept in time priority. Orders with an expire
+    time are also kept in a heap by expire time, so only the orders due to
+    expire are visited.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the matching core.
+    """
+
+    def __init__(self, InstrumentId instrument_id not None):
+        self.instrument_id = instrument_id
+
+        self._seq = 0
+        self._keys = [[], [], [], []]     # type: list[list[int]]
+        self._entries = [[], [], [], []]  # type: list[list[tuple]]
+        self._index = {}                  # type: dict[ClientOrderId, tuple]
+        self._expiring = []               # type: list[tuple] (heap by expire time)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    cpdef list get_bid_orders(self):
+        """
+        Return the resting bid orders in matching priority.
+
+        Returns
+        -------
+        list[Order]
+
+        """
+        return self._sorted_orders(_BID_LIMIT, _BID_STOP)
+
+    cpdef list get_ask_orders(self):
+        """
+        Return the resting ask orders in matching priority.
+
+        Returns
+        -------
+        list[Order]
+
+        """
+        return self._sorted_orders(_ASK_LIMIT, _ASK_STOP)
+
+    cpdef bint contains(self, Order order) except *:
+        """
+        Return a value indicating whether the given order is resting in the core.
+
+        Parameters
+        ----------
+        order : Order
+            The order to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        Condition.not_none(order, "order")
+
+        return order.client_order_id in self._index
+
+    cpdef void add(self, Order order) except *:
+        """
+        Add the given order to the core.
+
+        The order is indexed on its current limit or trigger price, and so
+        must be deleted and added again if those prices change.
+
+        Parameters
+        ----------
+        order : Order
+            The order to add.
+
+        """
+        Condition.not_none(order, "order")
+
+        cdef bint is_stop = not (
+            order.type == OrderType.LIMIT
+            or (
+                (order.type == OrderType.STOP_LIMIT or order.type == OrderType.LIMIT_IF_TOUCHED)
+                and order.is_triggered
+            )
+        )
+        cdef Price price = order.trigger_price if is_stop else order.price
+        cdef int64_t key
+        cdef int index
+        if order.is_buy_c():
+            key = -price._mem.raw  # Bids are kept in descending price order
+            index = _BID_STOP if is_stop else _BID_LIMIT
+        else:
+            key = price._mem.raw
+            index = _ASK_STOP if is_stop else _ASK_LIMIT
+
+        self._seq += 1
+        cdef tuple entry = (key, self._seq, order, index)
+
+        cdef list keys = self._keys[index]
+        cdef int i = bisect_right(keys, key)  # After existing orders at the same price
+        keys.insert(i, key)
+        self._entries[index].insert(i, entry)
+
+        self._index[order.client_order_id] = entry
+        if order.expire_time_ns > 0:
+            # Deleted orders are left in the heap and skipped (or compacted) lazily
+            if len(self._expiring) > 2 * len(self._index):
+                self._expiring = [e for e in self._expiring if self._is_live(e[2])]
+                heapify(self._expiring)
+            heappush(self._expiring, (order.expire_time_ns, self._seq, entry))
+
+    cpdef bint delete(self, Order order) except *:
+        """
+        Delete the given order from the core (if found).
+
+        Parameters
+        ----------
+        order : Order
+            The order to delete.
+
+        Returns
+        -------
+        bool
+            True if the order was found and deleted, else False.
+
+        """
+        Condition.not_none(order, "order")
+
+        cdef tuple entry = self._index.pop(order.client_order_id, None)
+        if entry is None:
+            return False
+
+        cdef list keys = self._keys[entry[3]]
+        cdef list entries = self._entries[entry[3]]
+        cdef int i = bisect_left(keys, entry[0])
+        while entries[i][1] != entry[1]:
+            i += 1  # Scan orders at the same price
+        del keys[i]
+        del entries[i]
+
+        return True
+
+    cpdef list orders_to_match(self, Price bid, Price ask, uint64_t timestamp_ns):
+        """
+        Return the resting orders which could match or expire given the market.
+
+        The orders are those whose limit or trigger price is crossed or touched
+        by the given best bid/ask, plus any orders expired at the given
+        timestamp. Bid orders are returned before ask orders, each side in
+        matching priority.
+
+        Parameters
+        ----------
+        bid : Price, optional
+            The best bid price (if ``None`` then no ask orders can match).
+        ask : Price, optional
+            The best ask price (if ``None`` then no bid orders can match).
+        timestamp_ns : uint64_t
+            The UNIX timestamp (nanoseconds) for the market update.
+
+        Returns
+        -------
+        list[Order]
+
+        """
+        cdef list bids = []
+        cdef list asks = []
+        cdef int64_t key
+        if ask is not None:
+            key = -ask._mem.raw
+            # Buy limits at or above the ask, buy stops at or below the ask
+            bids.extend(self._entries[_BID_LIMIT][:bisect_right(self._keys[_BID_LIMIT], key)])
+            bids.extend(self._entries[_BID_STOP][bisect_left(self._keys[_BID_STOP], key):])
+        if bid is not None:
+            key = bid._mem.raw
+            # Sell limits at or below the bid, sell stops at or above the bid
+            asks.extend(self._entries[_ASK_LIMIT][:bisect_right(self._keys[_ASK_LIMIT], key)])
+            asks.extend(self._entries[_ASK_STOP][bisect_left(self._keys[_ASK_STOP], key):])
+
+        cdef list expired = self._expired_entries(timestamp_ns)
+        cdef set seen
+        cdef tuple entry
+        if expired:
+            seen = {e[1] for e in bids}
+            seen.update(e[1] for e in asks)
+            for entry in expired:
+                if entry[1] not in seen:
+                    if entry[3] == _BID_LIMIT or entry[3] == _BID_STOP:
+                        bids.append(entry)
+                    else:
+                        asks.append(entry)
+
+        # Entries sort by (key, seq) which gives price then time priority
+        bids.sort()
+        asks.sort()
+
+        return [e[2] for e in bids] + [e[2] for e in asks]
+
+    cpdef bint is_touched(
+        self,
+        Price bid_low,
+        Price bid_high,
+        Price ask_low,
+        Price ask_high,
+        uint64_t timestamp_ns,
+    ) except *:
+        """
+        Return a value indicating whether any resting order could match or
+        expire given the best bid/ask moves within the given ranges.
+
+        Parameters
+        ----------
+        bid_low : Price
+            The lowest best bid price for the period.
+        bid_high : Price
+            The highest best bid price for the period.
+        ask_low : Price
+            The lowest best ask price for the period.
+        ask_high : Price
+            The highest best ask price for the period.
+        timestamp_ns : uint64_t
+            The UNIX timestamp (nanoseconds) for the end of the period.
+
+        Returns
+        -------
+        bool
+
+        """
+        Condition.not_none(bid_low, "bid_low")
+        Condition.not_none(bid_high, "bid_high")
+        Condition.not_none(ask_low, "ask_low")
+        Condition.not_none(ask_high, "ask_high")
+
+        cdef list keys = self._keys[_BID_LIMIT]
+        if keys and keys[0] <= -ask_low._mem.raw:
+            return True  # Highest buy limit at or above the lowest ask
+        keys = self._keys[_BID_STOP]
+        if keys and keys[-1] >= -ask_high._mem.raw:
+            return True  # Lowest buy stop at or below the highest ask
+        keys = self._keys[_ASK_LIMIT]
+        if keys and keys[0] <= bid_high._mem.raw:
+            return True  # Lowest sell limit at or below the highest bid
+        keys = self._keys[_ASK_STOP]
+        if keys and keys[-1] >= bid_low._mem.raw:
+            return True  # Highest sell stop at or above the lowest bid
+
+        # Discard deleted orders from the top of the heap, then peek the next expiry
+        while self._expiring and not self._is_live(self._expiring[0][2]):
+            heappop(self._expiring)
+        return len(self._expiring) > 0 and self._expiring[0][0] <= timestamp_ns
+
+    cpdef void clear(self) except *:
+        """
+        Clear all orders from the core.
+        """
+        self._seq = 0
+        self._keys = [[], [], [], []]
+        self._entries = [[], [], [], []]
+        self._index.clear()
+        self._expiring = []
+
+    cdef bint _is_live(self, tuple entry) except *:
+        return self._index.get(entry[2].client_order_id) is entry
+
+    cdef list _expired_entries(self, uint64_t timestamp_ns):
+        # Pop the entries due to expire, then push back those still resting (they
+        # are only removed from the heap when deleted from the core)
+        cdef list expired = []
+        cdef tuple item
+        while self._expiring and self._expiring[0][0] <= timestamp_ns:
+            item = heappop(self._expiring)
+            if self._is_live(item[2]):
+                expired.append(item)
+        for item in expired:
+            heappush(self._expiring, item)
+        return [item[2] for item in expired]
+
+    cdef list _sorted_orders(self, int limit_index, int stop_index):
+        cdef list entries = self._entries[limit_index] + self._entries[stop_index]
+        entries.sort()
+        return [e[2] for e in entries]
@@ -13,7 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from typing import Dict, List, Optional
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional
 
 import pandas as pd
 
@@ -24,6 +27,7 @@ from nautilus_trader.config import BacktestDataConfig
 from nautilus_trader.config import BacktestRunConfig
 from nautilus_trader.config import BacktestVenueConfig
 from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.data import Data
 from nautilus_trader.core.inspect import is_nautilus_class
 from nautilus_trader.model.currency import Currency
 from nautilus_trader.model.data.base import DataType
@@ -37,7 +41,7 @@ from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Money
 from nautilus_trader.persistence.batching import batch_files
 from nautilus_trader.persistence.batching import extract_generic_data_client_ids
-from nautilus_trader.persistence.batching import groupby_datatype
+from nautilus_trader.persistence.batching import prefetch
 from nautilus_trader.persistence.catalog import DataCatalog
 
 
@@ -109,30 +113,79 @@ class BacktestNode:
         """
         return list(self._engines.values())
 
-    def run(self) -> List[BacktestResult]:  # noqa (kwargs for extensibility)
+    def run(  # noqa (kwargs for extensibility)
+        self,
+        n_workers: Optional[int] = None,
+        log_dir: Optional[str] = None,
+    ) -> List[BacktestResult]:
         """
-        Execute a group of backtest run configs synchronously.
+        Execute a group of backtest run configs.
+
+        If `n_workers` is greater than one then each run config is built and
+        executed by its own engine in a pool of spawned worker processes,
+        otherwise the runs are executed synchronously in the current process.
+
+        Parameters
+        ----------
+        n_workers : int, optional
+            The number of worker processes to execute the runs with.
+        log_dir : str, optional
+            The directory to write per-worker log files to (when running with
+            worker processes). If ``None`` then workers log to stdout.
 
         Returns
         -------
         list[BacktestResult]
-            The results of the backtest runs.
+            The results of the backtest runs (in the order of the configs).
+
+        Raises
+        ------
+        ValueError
+            If `n_workers` is not positive.
+
+        Warnings
+        --------
+        When running with worker processes the engines are disposed within the
+        workers, and so will not be available from `get_engine()`. Data catalogs
+        must be accessible from the worker processes (i.e. not in-memory).
 
         """
-        results: List[BacktestResult] = []
+        if n_workers is not None:
+            PyCondition.positive_int(n_workers, "n_workers")
+
         for config in self._configs:
             config.check()  # Check all values set
+
+        if n_workers is not None and n_workers > 1:
+            return self._run_parallel(n_workers=n_workers, log_dir=log_dir)
+
+        results: List[BacktestResult] = []
+        for config in self._configs:
             result = self._run(
                 run_config_id=config.id,
                 engine_config=config.engine,
                 venue_configs=config.venues,
                 data_configs=config.data,
                 batch_size_bytes=config.batch_size_bytes,
+                prefetch_batches=config.prefetch_batches,
             )
             results.append(result)
 
         return results
 
+    def _run_parallel(self, n_workers: int, log_dir: Optional[str]) -> List[BacktestResult]:
+        if log_dir is not None:
+            os.makedirs(log_dir, exist_ok=True)
+
+        with ProcessPoolExecutor(
+            max_workers=min(n_workers, len(self._configs)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker_logging,
+            initargs=(log_dir,),
+        ) as executor:
+            futures = [executor.submit(_run_worker, config) for config in self._configs]
+            return [future.result() for future in futures]
+
     def _validate_configs(self, configs: List[BacktestRunConfig]):
         venue_ids: List[Venue] = []
         for config in configs:
@@ -185,6 +238,9 @@ class BacktestNode:
 
         return engine
 
+    def _load_data(self, config: BacktestDataConfig) -> Dict:
+        return config.load()
+
     def _load_engine_data(self, engine: BacktestEngine, data) -> None:
         if is_nautilus_class(data["type"]):
             engine.add_data(data=data["data"])
@@ -202,6 +258,7 @@ class BacktestNode:
         venue_configs: List[BacktestVenueConfig],
         data_configs: List[BacktestDataConfig],
         batch_size_bytes: Optional[int] = None,
+        prefetch_batches: Optional[int] = None,
     ) -> BacktestResult:
         engine: BacktestEngine = self._create_engine(
             run_config_id=run_config_id,
@@ -217,6 +274,7 @@ class BacktestNode:
                 engine=engine,
                 data_configs=data_configs,
                 batch_size_bytes=batch_size_bytes,
+                prefetch_batches=prefetch_batches,
             )
         else:
             self._run_oneshot(
@@ -233,30 +291,62 @@ class BacktestNode:
         engine: BacktestEngine,
         data_configs: List[BacktestDataConfig],
         batch_size_bytes: int,
+        prefetch_batches: Optional[int] = None,
     ) -> None:
         config = data_configs[0]
         catalog: DataCatalog = config.catalog()
 
         data_client_ids = extract_generic_data_client_ids(data_configs=data_configs)
 
-        for batch in batch_files(
+        # Stream the data of each generic data client separately, so the engine
+        # registers the client and checks its data
+        streams: Dict[Optional[str], List[BacktestDataConfig]] = {}
+        for data_config in data_configs:
+            client_id = data_client_ids.get(data_config.data_type)
+            streams.setdefault(client_id, []).append(data_config)
+
+        # Data is pulled lazily from the batches during a single engine run
+        for client_id, stream_configs in streams.items():
+            engine.add_data_iterator(
+                self._stream_data(
+                    catalog=catalog,
+                    data_configs=stream_configs,
+                    data_client_ids=data_client_ids,
+                    # Share the batch size between the streams by their configs
+                    batch_size_bytes=max(
+                        1, batch_size_bytes * len(stream_configs) // len(data_configs)
+                    ),
+                    prefetch_batches=prefetch_batches,
+                ),
+                client_id=ClientId(client_id) if client_id is not None else None,
+            )
+        engine.run(run_config_id=run_config_id)
+
+    def _stream_data(
+        self,
+        catalog: DataCatalog,
+        data_configs: List[BacktestDataConfig],
+        data_client_ids: Dict,
+        batch_size_bytes: int,
+        prefetch_batches: Optional[int] = None,
+    ) -> Iterator[Data]:
+        data_types: Dict[type, DataType] = {cls: DataType(cls) for cls in data_client_ids}
+        batches = batch_files(
             catalog=catalog,
             data_configs=data_configs,
             target_batch_size_bytes=batch_size_bytes,
-        ):
-            engine.clear_data()
-            grouped = groupby_datatype(batch)
-            for data in grouped:
-                if data["type"] in data_client_ids:
-                    # Generic data - manually re-add client_id as it gets lost in the streaming join
-                    data.update({"client_id": ClientId(data_client_ids[data["type"]])})
-                    data["data"] = [
-                        GenericData(data_type=DataType(data["type"]), data=d) for d in data["data"]
-                    ]
-                self._load_engine_data(engine=engine, data=data)
-            engine.run_streaming(run_config_id=run_config_id)
-
-        engine.end_streaming()
+        )
+        if prefetch_batches is not None:
+            # Read and deserialize the next batches while the engine runs the current one
+            batches = prefetch(batches, size=prefetch_batches)
+        for batch in batches:
+            for data in batch:
+                data_type = data_types.get(type(data))
+                if data_type is not None:
+                    # Generic data - manually re-wrap as the data type gets lost in the streaming join
+                    yield GenericData(data_type=data_type, data=data)
+                else:
+                    yield data
 
     def _run_oneshot(
         self,
@@ -270,7 +360,7 @@ class BacktestNode:
             engine._log.info(
                 f"Reading {config.data_type} data for instrument={config.instrument_id}."
             )
-            d = config.load()
+            d = self._load_data(config)
             if config.instrument_id and d["instrument"] is None:
                 print(
                     f"Requested instrument_id={d['instrument']} from data_config not found catalog"
@@ -293,3 +383,35 @@ class BacktestNode:
     def dispose(self):
         for engine in self.get_engines():
             engine.dispose()
+
+
+def init_worker_logging(log_dir: Optional[str]) -> None:
+    """
+    Initialize logging for a backtest worker process.
+
+    Redirects the stdout and stderr file descriptors of the process (including
+    output from the native logger) to a per-worker log file in `log_dir`.
+
+    Parameters
+    ----------
+    log_dir : str, optional
+        The directory to write the worker log file to. If ``None`` then the
+        worker logs to stdout.
+
+    """
+    if log_dir is None:
+        return
+
+    path = os.path.join(log_dir, f"backtest-worker-{os.getpid()}.log")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    os.dup2(fd, 1)
+    os.dup2(fd, 2)
+    os.close(fd)
+
+
+def _run_worker(config: BacktestRunConfig) -> BacktestResult:
+    node = BacktestNode(configs=[config])
+    try:
+        return node.run()[0]
+    finally:
+        node.dispose()
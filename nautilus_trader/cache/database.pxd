@@ -31,6 +31,7 @@ cdef class CacheDatabase:
     cdef LoggerAdapter _log
 
     cpdef void flush(self) except *
+    cpdef void close(self) except *
     cpdef dict load_currencies(self)
     cpdef dict load_instruments(self)
     cpdef dict load_accounts(self)
@@ -49,6 +49,13 @@ cdef class CacheDatabase:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
 
+    cpdef void close(self) except *:
+        """
+        Close the database, writing any pending operations.
+
+        """
+        pass  # Optionally override in subclass
+
     cpdef dict load_currencies(self):
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
@@ -274,13 +274,20 @@ class BacktestRunConfig(Partialable):
     data : List[BacktestDataConfig]
         The data configurations for the backtest run.
     batch_size_bytes : optional
-        The batch block size in bytes (will then run in streaming mode).
+        The batch block size in bytes (will then run in streaming mode). This is
+        measured as the Arrow (columnar) size of the rows read rather than the size
+        of the deserialized objects, so a given setting will batch more rows than
+        when measured by the object sizes (reduce older settings to compensate).
+    prefetch_batches : int, optional
+        The number of streaming batches (> 0) to read ahead on a background thread
+        while the current batch is being run (if None then read on demand).
     """
 
     engine: Optional[BacktestEngineConfig] = None
     venues: Optional[List[BacktestVenueConfig]] = None
     data: Optional[List[BacktestDataConfig]] = None
     batch_size_bytes: Optional[int] = None
+    prefetch_batches: Optional[int] = None
 
     @property
     def id(self):
@@ -89,12 +89,25 @@ class CacheDatabaseConfig(NautilusConfig):
         The database port (default for Redis).
     flush : bool, default False
         If database should be flushed before start.
+    write_behind : bool, default False
+        If write operations should be queued and written in batches on a
+        background thread (rather than synchronously by the caller).
+    write_behind_batch_size : int, default 1000
+        The maximum number of operations per write-behind batch.
+    write_behind_interval_ms : int, default 10
+        The maximum interval (milliseconds) to wait to fill a write-behind batch.
+    write_behind_queue_size : int, default 100_000
+        The maximum number of queued write-behind operations (callers block when full).
     """
 
     type: str = "in-memory"
     host: str = "localhost"
     port: int = 6379
     flush: bool = False
+    write_behind: bool = False
+    write_behind_batch_size: int = 1000
+    write_behind_interval_ms: int = 10
+    write_behind_queue_size: int = 100_000
 
 
 class InstrumentProviderConfig(NautilusConfig):
@@ -206,6 +219,8 @@ class StreamingConfig(NautilusConfig):
         The flush interval (milliseconds) for writing chunks.
     replace_existing: bool, default False
         If any existing feather files should be replaced.
+    batch_size : int, default 1000
+        The maximum number of rows buffered per table before a record batch is written.
     """
 
     catalog_path: str
@@ -214,6 +229,7 @@ class StreamingConfig(NautilusConfig):
     flush_interval_ms: Optional[int] = None
     replace_existing: bool = False
     include_types: Optional[Tuple[type]] = None
+    batch_size: int = 1000
 
     @property
     def fs(self):
@@ -47,6 +47,12 @@ cdef class DataEngine(Component):
     cdef dict _routing_map
     cdef dict _order_book_intervals
     cdef dict _bar_aggregators
+    cdef dict _instrument_topics
+    cdef dict _book_topics
+    cdef dict _ticker_topics
+    cdef dict _quote_topics
+    cdef dict _trade_topics
+    cdef dict _bar_topics
 
     cdef readonly bint debug
     """If debug mode is active (will provide extra debug logging).\n\n:returns: `bool`"""
@@ -147,3 +153,9 @@ cdef class DataEngine(Component):
     cpdef void _snapshot_order_book(self, TimeEvent snap_event) except *
     cdef void _start_bar_aggregator(self, MarketDataClient client, BarType bar_type) except *
     cdef void _stop_bar_aggregator(self, MarketDataClient client, BarType bar_type) except *
+    cdef str _get_instrument_topic(self, InstrumentId instrument_id)
+    cdef str _get_book_topic(self, InstrumentId instrument_id)
+    cdef str _get_ticker_topic(self, InstrumentId instrument_id)
+    cdef str _get_quote_topic(self, InstrumentId instrument_id)
+    cdef str _get_trade_topic(self, InstrumentId instrument_id)
+    cdef str _get_bar_topic(self, BarType bar_type)
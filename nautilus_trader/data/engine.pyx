@@ -123,6 +123,14 @@ cdef class DataEngine(Component):
         self._order_book_intervals = {}  # type: dict[(InstrumentId, int), list[Callable[[Bar], None]]]
         self._bar_aggregators = {}       # type: dict[BarType, BarAggregator]
 
+        # Cached topics (avoids formatting a new topic string for every message)
+        self._instrument_topics = {}     # type: dict[InstrumentId, str]
+        self._book_topics = {}           # type: dict[InstrumentId, str]
+        self._ticker_topics = {}         # type: dict[InstrumentId, str]
+        self._quote_topics = {}          # type: dict[InstrumentId, str]
+        self._trade_topics = {}          # type: dict[InstrumentId, str]
+        self._bar_topics = {}            # type: dict[BarType, str]
+
         # Settings
         self.debug = config.debug
 
@@ -473,6 +481,12 @@ cdef class DataEngine(Component):
 
         self._order_book_intervals.clear()
         self._bar_aggregators.clear()
+        self._instrument_topics.clear()
+        self._book_topics.clear()
+        self._ticker_topics.clear()
+        self._quote_topics.clear()
+        self._trade_topics.clear()
+        self._bar_topics.clear()
 
         self._clock.cancel_timers()
         self.command_count = 0
@@ -1073,51 +1087,41 @@ cdef class DataEngine(Component):
     cdef void _handle_instrument(self, Instrument instrument) except *:
         self._cache.add_instrument(instrument)
         self._msgbus.publish_c(
-            topic=f"data.instrument"
-                  f".{instrument.id.venue}"
-                  f".{instrument.id.symbol}",
+            topic=self._get_instrument_topic(instrument.id),
             msg=instrument,
         )
 
     cdef void _handle_order_book_data(self, OrderBookData data) except *:
         self._msgbus.publish_c(
-            topic=f"data.book.deltas"
-                  f".{data.instrument_id.venue}"
-                  f".{data.instrument_id.symbol}",
+            topic=self._get_book_topic(data.instrument_id),
             msg=data,
         )
 
     cdef void _handle_ticker(self, Ticker ticker) except *:
         self._cache.add_ticker(ticker)
         self._msgbus.publish_c(
-            topic=f"data.tickers"
-                  f".{ticker.instrument_id.venue}"
-                  f".{ticker.instrument_id.symbol}",
+            topic=self._get_ticker_topic(ticker.instrument_id),
             msg=ticker,
         )
 
     cdef void _handle_quote_tick(self, QuoteTick tick) except *:
         self._cache.add_quote_tick(tick)
         self._msgbus.publish_c(
-            topic=f"data.quotes"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=self._get_quote_topic(tick.instrument_id),
             msg=tick,
         )
 
     cdef void _handle_trade_tick(self, TradeTick tick) except *:
         self._cache.add_trade_tick(tick)
         self._msgbus.publish_c(
-            topic=f"data.trades"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=self._get_trade_topic(tick.instrument_id),
             msg=tick,
         )
 
     cdef void _handle_bar(self, Bar bar) except *:
         self._cache.add_bar(bar)
 
-        self._msgbus.publish_c(topic=f"data.bars.{bar.type}", msg=bar)
+        self._msgbus.publish_c(topic=self._get_bar_topic(bar.type), msg=bar)
 
     cdef void _handle_status_update(self, StatusUpdate data) except *:
         self._msgbus.publish_c(topic=f"data.venue.status", msg=data)
@@ -1320,3 +1324,45 @@ cdef class DataEngine(Component):
 
         # Remove from aggregators
         del self._bar_aggregators[bar_type]
+
+    cdef str _get_instrument_topic(self, InstrumentId instrument_id):
+        cdef str topic = self._instrument_topics.get(instrument_id)
+        if topic is None:
+            topic = f"data.instrument.{instrument_id.venue}.{instrument_id.symbol}"
+            self._instrument_topics[instrument_id] = topic
+        return topic
+
+    cdef str _get_book_topic(self, InstrumentId instrument_id):
+        cdef str topic = self._book_topics.get(instrument_id)
+        if topic is None:
+            topic = f"data.book.deltas.{instrument_id.venue}.{instrument_id.symbol}"
+            self._book_topics[instrument_id] = topic
+        return topic
+
+    cdef str _get_ticker_topic(self, InstrumentId instrument_id):
+        cdef str topic = self._ticker_topics.get(instrument_id)
+        if topic is None:
+            topic = f"data.tickers.{instrument_id.venue}.{instrument_id.symbol}"
+            self._ticker_topics[instrument_id] = topic
+        return topic
+
+    cdef str _get_quote_topic(self, InstrumentId instrument_id):
+        cdef str topic = self._quote_topics.get(instrument_id)
+        if topic is None:
+            topic = f"data.quotes.{instrument_id.venue}.{instrument_id.symbol}"
+            self._quote_topics[instrument_id] = topic
+        return topic
+
+    cdef str _get_trade_topic(self, InstrumentId instrument_id):
+        cdef str topic = self._trade_topics.get(instrument_id)
+        if topic is None:
+            topic = f"data.trades.{instrument_id.venue}.{instrument_id.symbol}"
+            self._trade_topics[instrument_id] = topic
+        return topic
+
+    cdef str _get_bar_topic(self, BarType bar_type):
+        cdef str topic = self._bar_topics.get(bar_type)
+        if topic is None:
+            topic = f"data.bars.{bar_type}"
+            self._bar_topics[bar_type] = topic
+        return topic
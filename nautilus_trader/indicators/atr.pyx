@@ -16,6 +16,8 @@
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
 from nautilus_trader.model.data.bar cimport Bar
@@ -78,6 +80,17 @@ cdef class AverageTrueRange(Indicator):
 
         self.update_raw(bar.high.as_double(), bar.low.as_double(), bar.close.as_double())
 
+    cpdef void _update_bar(
+        self,
+        double open,
+        double high,
+        double low,
+        double close,
+        double volume,
+        uint64_t ts_init,
+    ) except *:
+        self.update_raw(high, low, close)
+
     cpdef void update_raw(
         self,
         double high,
@@ -13,11 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport SingleInputIndicator
 from nautilus_trader.model.c_enums.price_type cimport PriceType
 
 
-cdef class MovingAverage(Indicator):
+cdef class MovingAverage(SingleInputIndicator):
     cdef readonly int period
     """The moving average period.\n\n:returns: `PriceType`"""
     cdef readonly PriceType price_type
@@ -27,6 +27,5 @@ cdef class MovingAverage(Indicator):
     cdef readonly double value
     """The current output value.\n\n:returns: `double`"""
 
-    cpdef void update_raw(self, double value) except *
     cpdef void _increment_count(self) except *
     cpdef void _reset_ma(self) except *
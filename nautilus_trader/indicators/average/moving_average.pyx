@@ -17,7 +17,7 @@ from enum import Enum
 from enum import unique
 
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport SingleInputIndicator
 from nautilus_trader.model.c_enums.price_type cimport PriceType
 
 
@@ -33,7 +33,7 @@ class MovingAverageType(Enum):
     ADAPTIVE = 4
 
 
-cdef class MovingAverage(Indicator):
+cdef class MovingAverage(SingleInputIndicator):
     """
     The abstract base class for all moving average type indicators.
 
@@ -65,18 +65,6 @@ cdef class MovingAverage(Indicator):
         self.value = 0
         self.count = 0
 
-    cpdef void update_raw(self, double value) except *:
-        """
-        Update the indicator with the given raw value.
-
-        Parameters
-        ----------
-        value : double
-            The update value.
-
-        """
-        raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
-
     cpdef void _increment_count(self) except *:
         self.count += 1
 
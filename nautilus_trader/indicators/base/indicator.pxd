@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.tick cimport QuoteTick
 from nautilus_trader.model.data.tick cimport TradeTick
@@ -33,8 +35,31 @@ cdef class Indicator:
     cpdef void handle_quote_tick(self, QuoteTick tick) except *
     cpdef void handle_trade_tick(self, TradeTick tick) except *
     cpdef void handle_bar(self, Bar bar) except *
+    cpdef void update_many_bars(
+        self,
+        const double[:] open,
+        const double[:] high,
+        const double[:] low,
+        const double[:] close,
+        const double[:] volume,
+        ts_init,
+    ) except *
     cpdef void reset(self) except *
 
     cpdef void _set_has_inputs(self, bint setting) except *
     cpdef void _set_initialized(self, bint setting) except *
+    cpdef void _update_bar(
+        self,
+        double open,
+        double high,
+        double low,
+        double close,
+        double volume,
+        uint64_t ts_init,
+    ) except *
     cpdef void _reset(self) except *
+
+
+cdef class SingleInputIndicator(Indicator):
+    cpdef void update_raw(self, double value) except *
+    cpdef void update_many(self, const double[:] values) except *
@@ -13,6 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import cython
+import numpy as np
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.tick cimport QuoteTick
 from nautilus_trader.model.data.tick cimport TradeTick
@@ -57,6 +64,69 @@ cdef class Indicator:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError(f"Cannot handle {repr(bar)}: method not implemented in subclass")  # pragma: no cover
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef void update_many_bars(
+        self,
+        const double[:] open,
+        const double[:] high,
+        const double[:] low,
+        const double[:] close,
+        const double[:] volume,
+        ts_init,
+    ) except *:
+        """
+        Update the indicator with the given arrays of bar values, in order.
+
+        The indicator is left in exactly the state that calling `handle_bar`
+        for each bar in sequence would produce, without the per-bar object
+        overhead. Read-only arrays are accepted.
+
+        Parameters
+        ----------
+        open : double[:]
+            The bar open prices.
+        high : double[:]
+            The bar high prices.
+        low : double[:]
+            The bar low prices.
+        close : double[:]
+            The bar close prices.
+        volume : double[:]
+            The bar volumes.
+        ts_init : array-like of int
+            The UNIX timestamps (nanoseconds) when the bars were initialized
+            (signed or unsigned 64-bit integers, or `datetime64[ns]` values
+            such as `DatetimeIndex.asi8`).
+
+        Raises
+        ------
+        ValueError
+            If the arrays are not all the same length.
+
+        """
+        cdef const int64_t[:] timestamps = np.asarray(ts_init, dtype=np.int64)
+        cdef Py_ssize_t length = close.shape[0]
+        Condition.true(
+            open.shape[0] == length
+            and high.shape[0] == length
+            and low.shape[0] == length
+            and volume.shape[0] == length
+            and timestamps.shape[0] == length,
+            "bar arrays were not all the same length",
+        )
+
+        cdef Py_ssize_t i
+        for i in range(length):
+            self._update_bar(
+                open[i],
+                high[i],
+                low[i],
+                close[i],
+                volume[i],
+                <uint64_t>timestamps[i],
+            )
+
     cpdef void reset(self) except *:
         """
         Reset the indicator.
@@ -73,6 +143,75 @@ cdef class Indicator:
     cpdef void _set_initialized(self, bint setting) except *:
         self.initialized = setting
 
+    cpdef void _update_bar(
+        self,
+        double open,
+        double high,
+        double low,
+        double close,
+        double volume,
+        uint64_t ts_init,
+    ) except *:
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
+
     cpdef void _reset(self) except *:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
+
+
+cdef class SingleInputIndicator(Indicator):
+    """
+    The abstract base class for indicators updated from a single raw value
+    (by default the bar close).
+
+    Parameters
+    ----------
+    params : list
+        The initialization parameters for the indicator.
+
+    Warnings
+    --------
+    This class should not be used directly, but through a concrete subclass.
+    """
+
+    cpdef void update_raw(self, double value) except *:
+        """
+        Update the indicator with the given raw value.
+
+        Parameters
+        ----------
+        value : double
+            The update value.
+
+        """
+        raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef void update_many(self, const double[:] values) except *:
+        """
+        Update the indicator with the given raw values, in order.
+
+        Read-only arrays are accepted.
+
+        Parameters
+        ----------
+        values : double[:]
+            The update values.
+
+        """
+        cdef Py_ssize_t i
+        for i in range(values.shape[0]):
+            self.update_raw(values[i])
+
+    cpdef void _update_bar(
+        self,
+        double open,
+        double high,
+        double low,
+        double close,
+        double volume,
+        uint64_t ts_init,
+    ) except *:
+        self.update_raw(close)
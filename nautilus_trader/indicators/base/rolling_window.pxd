@@ -0,0 +1,57 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+
+cimport numpy as np
+
+
+cdef class RollingWindow:
+    cdef double[::1] _values
+    cdef int64_t[::1] _max_seqs
+    cdef int64_t[::1] _min_seqs
+    cdef int _max_head
+    cdef int _max_len
+    cdef int _min_head
+    cdef int _min_len
+    cdef int64_t _seq
+    cdef int _evictions
+    cdef double _shift
+    cdef double _sum_d
+    cdef double _sum_d2
+    cdef double _sum_xd
+
+    cdef readonly int capacity
+    """The maximum number of values held in the window.\n\n:returns: `int`"""
+    cdef readonly int count
+    """The number of values currently held in the window.\n\n:returns: `int`"""
+    cdef readonly double sum
+    """The sum of the values in the window.\n\n:returns: `double`"""
+    cdef readonly double sum_xy
+    """The sum of the values weighted by their 1-based position in the window.\n\n:returns: `double`"""
+
+    cpdef void append(self, double value) except *
+    cpdef void clear(self) except *
+    cpdef double last(self) except *
+    cpdef double mean(self) except *
+    cpdef double max(self) except *
+    cpdef double min(self) except *
+    cpdef double variance(self, double mean) except *
+    cpdef double sum_sq_dev(self) except *
+    cpdef double mad(self, double mean) except *
+    cpdef double sum_sq_residuals(self, double slope, double intercept) except *
+    cpdef np.ndarray to_array(self)
+
+    cdef void _resync(self) except *
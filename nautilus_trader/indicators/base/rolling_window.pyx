@@ -0,0 +1,364 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import cython
+import numpy as np
+
+cimport numpy as np
+from libc.math cimport fabs
+from libc.stdint cimport int64_t
+
+from nautilus_trader.core.correctness cimport Condition
+
+
+cdef class RollingWindow:
+    """
+    Provides a fixed capacity window of values with O(1) rolling statistics.
+
+    Running sums (plain, and shifted about a reference value for the second
+    moments) are updated as values enter and leave the window, and monotonic
+    deques of window positions track the minimum and maximum. The sums are
+    recomputed from the window once every `capacity` evictions, bounding any
+    floating point drift at an amortized O(1) cost.
+
+    While the window is filling, `sum` and `sum_xy` accumulate in input order,
+    so they are identical to summing the window directly.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of values held in the window (> 0).
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+    """
+
+    def __init__(self, int capacity):
+        Condition.positive_int(capacity, "capacity")
+
+        self.capacity = capacity
+        self._values = np.zeros(capacity, dtype=np.float64)
+        self._max_seqs = np.zeros(capacity, dtype=np.int64)
+        self._min_seqs = np.zeros(capacity, dtype=np.int64)
+        self.clear()
+
+    def __len__(self) -> int:
+        return self.count
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef void append(self, double value) except *:
+        """
+        Append the given value, evicting the oldest value if the window is full.
+
+        Parameters
+        ----------
+        value : double
+            The value to append.
+
+        """
+        cdef int capacity = self.capacity
+        cdef int64_t seq = self._seq
+        cdef int idx = seq % capacity
+
+        # Drop the position about to be overwritten from the min/max deques
+        if self._max_len > 0 and self._max_seqs[self._max_head] <= seq - capacity:
+            self._max_head = (self._max_head + 1) % capacity
+            self._max_len -= 1
+        if self._min_len > 0 and self._min_seqs[self._min_head] <= seq - capacity:
+            self._min_head = (self._min_head + 1) % capacity
+            self._min_len -= 1
+
+        if self.count == 0:
+            self._shift = value
+
+        cdef double d = value - self._shift
+        cdef double old
+        cdef double old_d
+        if self.count < capacity:
+            self.count += 1
+            self.sum += value
+            self.sum_xy += self.count * value
+            self._sum_d += d
+            self._sum_d2 += d * d
+            self._sum_xd += self.count * d
+        else:
+            old = self._values[idx]
+            old_d = old - self._shift
+            # Every position shifts down by one, so sum_xy loses the previous sum
+            self.sum_xy = self.sum_xy - self.sum + capacity * value
+            self.sum = self.sum - old + value
+            self._sum_xd = self._sum_xd - self._sum_d + capacity * d
+            self._sum_d = self._sum_d - old_d + d
+            self._sum_d2 = self._sum_d2 - old_d * old_d + d * d
+            self._evictions += 1
+
+        self._values[idx] = value
+        self._seq = seq + 1
+
+        cdef int tail
+        while self._max_len > 0:
+            tail = (self._max_head + self._max_len - 1) % capacity
+            if self._values[self._max_seqs[tail] % capacity] > value:
+                break
+            self._max_len -= 1
+        self._max_seqs[(self._max_head + self._max_len) % capacity] = seq
+        self._max_len += 1
+
+        while self._min_len > 0:
+            tail = (self._min_head + self._min_len - 1) % capacity
+            if self._values[self._min_seqs[tail] % capacity] < value:
+                break
+            self._min_len -= 1
+        self._min_seqs[(self._min_head + self._min_len) % capacity] = seq
+        self._min_len += 1
+
+        if self._evictions >= capacity:
+            self._resync()
+
+    cpdef void clear(self) except *:
+        """
+        Clear all values from the window.
+
+        """
+        self.count = 0
+        self.sum = 0.0
+        self.sum_xy = 0.0
+        self._seq = 0
+        self._evictions = 0
+        self._shift = 0.0
+        self._sum_d = 0.0
+        self._sum_d2 = 0.0
+        self._sum_xd = 0.0
+        self._max_head = 0
+        self._max_len = 0
+        self._min_head = 0
+        self._min_len = 0
+
+    cpdef double last(self) except *:
+        """
+        Return the most recently appended value.
+
+        Returns
+        -------
+        double
+
+        Raises
+        ------
+        ValueError
+            If the window is empty.
+
+        """
+        Condition.positive_int(self.count, "count")
+
+        return self._values[(self._seq - 1) % self.capacity]
+
+    cpdef double mean(self) except *:
+        """
+        Return the mean of the values in the window (zero if empty).
+
+        Returns
+        -------
+        double
+
+        """
+        if self.count == 0:
+            return 0.0
+
+        return self.sum / self.count
+
+    cpdef double max(self) except *:
+        """
+        Return the maximum value in the window.
+
+        Returns
+        -------
+        double
+
+        Raises
+        ------
+        ValueError
+            If the window is empty.
+
+        """
+        Condition.positive_int(self.count, "count")
+
+        return self._values[self._max_seqs[self._max_head] % self.capacity]
+
+    cpdef double min(self) except *:
+        """
+        Return the minimum value in the window.
+
+        Returns
+        -------
+        double
+
+        Raises
+        ------
+        ValueError
+            If the window is empty.
+
+        """
+        Condition.positive_int(self.count, "count")
+
+        return self._values[self._min_seqs[self._min_head] % self.capacity]
+
+    cpdef double variance(self, double mean) except *:
+        """
+        Return the mean squared deviation of the window values from `mean`.
+
+        Parameters
+        ----------
+        mean : double
+            The value to measure deviations from (need not be the window mean).
+
+        Returns
+        -------
+        double
+
+        """
+        if self.count == 0:
+            return 0.0
+
+        cdef double c = mean - self._shift
+        cdef double variance = (
+            self._sum_d2 - 2.0 * c * self._sum_d + self.count * c * c
+        ) / self.count
+        return variance if variance > 0.0 else 0.0
+
+    cpdef double sum_sq_dev(self) except *:
+        """
+        Return the sum of squared deviations of the window values from their mean.
+
+        Returns
+        -------
+        double
+
+        """
+        if self.count == 0:
+            return 0.0
+
+        cdef double ss = self._sum_d2 - self._sum_d * self._sum_d / self.count
+        return ss if ss > 0.0 else 0.0
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef double mad(self, double mean) except *:
+        """
+        Return the mean absolute deviation of the window values from `mean`.
+
+        Parameters
+        ----------
+        mean : double
+            The value to measure deviations from.
+
+        Returns
+        -------
+        double
+
+        Notes
+        -----
+        Absolute deviations from a moving reference cannot be maintained
+        incrementally, so this is O(count), though without any allocation.
+
+        """
+        if self.count == 0:
+            return 0.0
+
+        cdef int capacity = self.capacity
+        cdef int64_t first = self._seq - self.count
+        cdef double total = 0.0
+        cdef int i
+        for i in range(self.count):
+            total += fabs(self._values[(first + i) % capacity] - mean)
+
+        return total / self.count
+
+    cpdef double sum_sq_residuals(self, double slope, double intercept) except *:
+        """
+        Return the sum of squared residuals of the line ``slope * x + intercept``
+        against the window values, where x is the 1-based position in the window.
+
+        Parameters
+        ----------
+        slope : double
+            The slope of the line.
+        intercept : double
+            The intercept of the line.
+
+        Returns
+        -------
+        double
+
+        """
+        cdef int n = self.count
+        cdef double a = intercept - self._shift
+        cdef double x_sum = 0.5 * n * (n + 1)
+        cdef double x2_sum = x_sum * (2 * n + 1) / 3
+        cdef double ss = (
+            slope * slope * x2_sum
+            + 2.0 * slope * a * x_sum
+            + n * a * a
+            - 2.0 * slope * self._sum_xd
+            - 2.0 * a * self._sum_d
+            + self._sum_d2
+        )
+        return ss if ss > 0.0 else 0.0
+
+    cpdef np.ndarray to_array(self):
+        """
+        Return the window values ordered from oldest to newest.
+
+        Returns
+        -------
+        np.ndarray
+
+        """
+        cdef int64_t first = self._seq - self.count
+        return np.roll(np.asarray(self._values), -(first % self.capacity))[:self.count].copy()
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _resync(self) except *:
+        # Recompute the running sums from the window, re-centering the shift
+        cdef int capacity = self.capacity
+        cdef int64_t first = self._seq - self.count
+        cdef double shift = self.sum / self.count
+        cdef double total = 0.0
+        cdef double total_xy = 0.0
+        cdef double sum_d = 0.0
+        cdef double sum_d2 = 0.0
+        cdef double sum_xd = 0.0
+        cdef double value
+        cdef double d
+        cdef int i
+        for i in range(self.count):
+            value = self._values[(first + i) % capacity]
+            d = value - shift
+            total += value
+            total_xy += (i + 1) * value
+            sum_d += d
+            sum_d2 += d * d
+            sum_xd += (i + 1) * d
+
+        self.sum = total
+        self.sum_xy = total_xy
+        self._shift = shift
+        self._sum_d = sum_d
+        self._sum_d2 = sum_d2
+        self._sum_xd = sum_xd
+        self._evictions = 0
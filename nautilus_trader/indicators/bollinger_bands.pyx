@@ -13,16 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
-import numpy as np
-
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
+from libc.math cimport sqrt
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.core.stats cimport fast_std_with_mean
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.tick cimport QuoteTick
 from nautilus_trader.model.data.tick cimport TradeTick
@@ -66,7 +65,7 @@ cdef class BollingerBands(Indicator):
         self.period = period
         self.k = k
         self._ma = MovingAverageFactory.create(period, ma_type)
-        self._prices = deque(maxlen=period)
+        self._prices = RollingWindow(period)
 
         self.upper = 0
         self.middle = 0
@@ -122,6 +121,17 @@ cdef class BollingerBands(Indicator):
             bar.close.as_double(),
         )
 
+    cpdef void _update_bar(
+        self,
+        double open,
+        double high,
+        double low,
+        double close,
+        double volume,
+        uint64_t ts_init,
+    ) except *:
+        self.update_raw(high, low, close)
+
     cpdef void update_raw(self, double high, double low, double close) except *:
         """
         Update the indicator with the given prices.
@@ -145,14 +155,11 @@ cdef class BollingerBands(Indicator):
         # Initialization logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._prices) >= self.period:
+            if self._prices.count >= self.period:
                 self._set_initialized(True)
 
         # Calculate values
-        cdef double std = fast_std_with_mean(
-            values=np.asarray(self._prices, dtype=np.float64),
-            mean=self._ma.value,
-        )
+        cdef double std = sqrt(self._prices.variance(self._ma.value))
 
         # Set values
         self.upper = self._ma.value + (self.k * std)
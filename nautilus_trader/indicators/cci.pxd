@@ -15,12 +15,13 @@
 
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 from nautilus_trader.model.data.bar cimport Bar
 
 
 cdef class CommodityChannelIndex(Indicator):
     cdef MovingAverage _ma
-    cdef object _prices
+    cdef RollingWindow _prices
 
     cdef readonly int period
     """The window period.\n\n:returns: `int`"""
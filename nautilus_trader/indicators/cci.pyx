@@ -13,17 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
-import numpy as np
-
-from nautilus_trader.core.stats cimport fast_mad_with_mean
-
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 from nautilus_trader.model.data.bar cimport Bar
 
 
@@ -63,7 +60,7 @@ cdef class CommodityChannelIndex(Indicator):
 
         self.period = period
         self.scalar = scalar
-        self._prices = deque(maxlen=period)
+        self._prices = RollingWindow(period)
         self._ma = MovingAverageFactory.create(period, MovingAverageType.SIMPLE)
         self._mad = 0.0
         self.value = 0.0
@@ -86,6 +83,17 @@ cdef class CommodityChannelIndex(Indicator):
             bar.close.as_double(),
         )
 
+    cpdef void _update_bar(
+        self,
+        double open,
+        double high,
+        double low,
+        double close,
+        double volume,
+        uint64_t ts_init,
+    ) except *:
+        self.update_raw(high, low, close)
+
     cpdef void update_raw(
         self,
         double high,
@@ -108,10 +116,7 @@ cdef class CommodityChannelIndex(Indicator):
         cdef double typical_price = (high + low + close) / 3.0
         self._prices.append(typical_price)
         self._ma.update_raw(typical_price)
-        self._mad = fast_mad_with_mean(
-            values=np.asarray(self._prices, dtype=np.float64),
-            mean=self._ma.value,
-        )
+        self._mad = self._prices.mad(self._ma.value)
         if self._ma.initialized:
             self.value = (typical_price - self._ma.value) / (self.scalar * self._mad)
 
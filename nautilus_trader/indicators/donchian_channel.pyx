@@ -13,10 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
+from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.tick cimport QuoteTick
 from nautilus_trader.model.data.tick cimport TradeTick
@@ -48,8 +49,8 @@ cdef class DonchianChannel(Indicator):
         super().__init__(params=[period])
 
         self.period = period
-        self._upper_prices = deque(maxlen=period)
-        self._lower_prices = deque(maxlen=period)
+        self._upper_prices = RollingWindow(period)
+        self._lower_prices = RollingWindow(period)
 
         self.upper = 0
         self.middle = 0
@@ -100,6 +101,17 @@ cdef class DonchianChannel(Indicator):
 
         self.update_raw(bar.high.as_double(), bar.low.as_double())
 
+    cpdef void _update_bar(
+        self,
+        double open,
+        double high,
+        double low,
+        double close,
+        double volume,
+        uint64_t ts_init,
+    ) except *:
+        self.update_raw(high, low)
+
     cpdef void update_raw(self, double high, double low) except *:
         """
         Update the indicator with the given prices.
@@ -119,12 +131,12 @@ cdef class DonchianChannel(Indicator):
         # Initialization logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._upper_prices) >= self.period and len(self._lower_prices) >= self.period:
+            if self._upper_prices.count >= self.period and self._lower_prices.count >= self.period:
                 self._set_initialized(True)
 
         # Set values
-        self.upper = max(self._upper_prices)
-        self.lower = min(self._lower_prices)
+        self.upper = self._upper_prices.max()
+        self.lower = self._lower_prices.min()
         self.middle = (self.upper + self.lower) / 2
 
     cpdef void _reset(self) except *:
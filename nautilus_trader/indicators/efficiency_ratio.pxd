@@ -13,10 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport SingleInputIndicator
 
 
-cdef class EfficiencyRatio(Indicator):
+cdef class EfficiencyRatio(SingleInputIndicator):
     cdef object _inputs
     cdef object _deltas
 
@@ -24,5 +24,3 @@ cdef class EfficiencyRatio(Indicator):
     """The window period.\n\n:returns: `int`"""
     cdef readonly double value
     """The current value.\n\n:returns: `double`"""
-
-    cpdef void update_raw(self, double price) except *
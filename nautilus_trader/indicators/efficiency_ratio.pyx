@@ -16,11 +16,11 @@
 from collections import deque
 
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport SingleInputIndicator
 from nautilus_trader.model.data.bar cimport Bar
 
 
-cdef class EfficiencyRatio(Indicator):
+cdef class EfficiencyRatio(SingleInputIndicator):
     """
     An indicator which calculates the efficiency ratio across a rolling window.
     The Kaufman Efficiency measures the ratio of the relative market speed in
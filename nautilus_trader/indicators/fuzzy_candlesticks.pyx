@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from libc.math cimport fabs
+from libc.stdint cimport uint64_t
 
 from collections import deque
 
@@ -154,6 +155,17 @@ cdef class FuzzyCandlesticks(Indicator):
             bar.close.as_double(),
         )
 
+    cpdef void _update_bar(
+        self,
+        double open,
+        double high,
+        double low,
+        double close,
+        double volume,
+        uint64_t ts_init,
+    ) except *:
+        self.update_raw(open, high, low, close)
+
     cpdef void update_raw(
         self,
         double open,
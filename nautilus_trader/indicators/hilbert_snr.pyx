@@ -17,6 +17,8 @@ from collections import deque
 
 import numpy as np
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
 
@@ -76,6 +78,17 @@ cdef class HilbertSignalNoiseRatio(Indicator):
 
         self.update_raw(bar.high.as_double(), bar.low.as_double())
 
+    cpdef void _update_bar(
+        self,
+        double open,
+        double high,
+        double low,
+        double close,
+        double volume,
+        uint64_t ts_init,
+    ) except *:
+        self.update_raw(high, low)
+
     cpdef void update_raw(self, double high, double low) except *:
         """
         Update the indicator with the given raw values.
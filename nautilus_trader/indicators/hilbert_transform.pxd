@@ -13,11 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport SingleInputIndicator
 from nautilus_trader.model.data.bar cimport Bar
 
 
-cdef class HilbertTransform(Indicator):
+cdef class HilbertTransform(SingleInputIndicator):
     cdef double _i_mult
     cdef double _q_mult
     cdef object _inputs
@@ -33,4 +33,3 @@ cdef class HilbertTransform(Indicator):
     """The last quadrature value (imaginary part of complex number).\n\n:returns: `double`"""
 
     cpdef void handle_bar(self, Bar bar) except *
-    cpdef void update_raw(self, double price) except *
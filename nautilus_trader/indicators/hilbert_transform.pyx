@@ -16,10 +16,10 @@
 from collections import deque
 
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport SingleInputIndicator
 
 
-cdef class HilbertTransform(Indicator):
+cdef class HilbertTransform(SingleInputIndicator):
     """
     An indicator which calculates a Hilbert Transform across a rolling window.
     The Hilbert Transform itself, is an all-pass filter used in digital signal
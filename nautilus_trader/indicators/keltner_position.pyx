@@ -16,6 +16,8 @@
 
 from nautilus_trader.indicators.average.moving_average import MovingAverageType
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
 from nautilus_trader.indicators.keltner_channel cimport KeltnerChannel
@@ -99,6 +101,17 @@ cdef class KeltnerPosition(Indicator):
             bar.close.as_double(),
         )
 
+    cpdef void _update_bar(
+        self,
+        double open,
+        double high,
+        double low,
+        double close,
+        double volume,
+        uint64_t ts_init,
+    ) except *:
+        self.update_raw(high, low, close)
+
     cpdef void update_raw(
         self,
         double high,
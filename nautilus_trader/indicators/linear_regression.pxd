@@ -13,11 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport SingleInputIndicator
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 
 
-cdef class LinearRegression(Indicator):
-    cdef object _inputs
+cdef class LinearRegression(SingleInputIndicator):
+    cdef RollingWindow _inputs
 
     cdef readonly int period
     """The window period.\n\n:returns: `int`"""
@@ -33,5 +34,3 @@ cdef class LinearRegression(Indicator):
     """The current R2 value.\n\n:returns: `double`"""
     cdef readonly double value
     """The current value.\n\n:returns: `double`"""
-
-    cpdef void update_raw(self, double close_price) except *
@@ -14,11 +14,11 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
-from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport SingleInputIndicator
 from nautilus_trader.model.c_enums.price_type cimport PriceType
 
 
-cdef class MovingAverageConvergenceDivergence(Indicator):
+cdef class MovingAverageConvergenceDivergence(SingleInputIndicator):
     cdef MovingAverage _fast_ma
     cdef MovingAverage _slow_ma
 
@@ -30,5 +30,3 @@ cdef class MovingAverageConvergenceDivergence(Indicator):
     """The slow moving average window period.\n\n:returns: `int`"""
     cdef readonly double value
     """The current value.\n\n:returns: `double`"""
-
-    cpdef void update_raw(self, double close) except *
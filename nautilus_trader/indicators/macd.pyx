@@ -17,7 +17,7 @@ from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.moving_average import MovingAverageType
 
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport SingleInputIndicator
 from nautilus_trader.model.c_enums.price_type cimport PriceType
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.tick cimport QuoteTick
@@ -25,7 +25,7 @@ from nautilus_trader.model.data.tick cimport TradeTick
 from nautilus_trader.model.objects cimport Price
 
 
-cdef class MovingAverageConvergenceDivergence(Indicator):
+cdef class MovingAverageConvergenceDivergence(SingleInputIndicator):
     """
     An indicator which calculates the difference between two moving averages.
     Different moving average types can be selected for the inner calculation.
@@ -15,6 +15,8 @@
 
 from collections import deque
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
 from nautilus_trader.model.data.bar cimport Bar
@@ -66,6 +68,17 @@ cdef class OnBalanceVolume(Indicator):
             bar.volume.as_double(),
         )
 
+    cpdef void _update_bar(
+        self,
+        double open,
+        double high,
+        double low,
+        double close,
+        double volume,
+        uint64_t ts_init,
+    ) except *:
+        self.update_raw(open, close, volume)
+
     cpdef void update_raw(
         self,
         double open,
@@ -13,10 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport SingleInputIndicator
 
 
-cdef class RateOfChange(Indicator):
+cdef class RateOfChange(SingleInputIndicator):
     cdef bint _use_log
     cdef object _prices
 
@@ -24,5 +24,3 @@ cdef class RateOfChange(Indicator):
     """The window period.\n\n:returns: `int`"""
     cdef readonly double value
     """The current value.\n\n:returns: `double`"""
-
-    cpdef void update_raw(self, double price) except *
@@ -17,11 +17,11 @@ from collections import deque
 from math import log
 
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport SingleInputIndicator
 from nautilus_trader.model.data.bar cimport Bar
 
 
-cdef class RateOfChange(Indicator):
+cdef class RateOfChange(SingleInputIndicator):
     """
     An indicator which calculates the rate of change of price over a defined period.
     The return output can be simple or log.
@@ -14,10 +14,10 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
-from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport SingleInputIndicator
 
 
-cdef class RelativeStrengthIndex(Indicator):
+cdef class RelativeStrengthIndex(SingleInputIndicator):
     cdef double _rsi_max
     cdef MovingAverage _average_gain
     cdef MovingAverage _average_loss
@@ -27,5 +27,3 @@ cdef class RelativeStrengthIndex(Indicator):
     """The window period.\n\n:returns: `int`"""
     cdef readonly double value
     """The current value.\n\n:returns: `double`"""
-
-    cpdef void update_raw(self, double value) except *
@@ -17,11 +17,11 @@ from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.moving_average import MovingAverageType
 
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport SingleInputIndicator
 from nautilus_trader.model.data.bar cimport Bar
 
 
-cdef class RelativeStrengthIndex(Indicator):
+cdef class RelativeStrengthIndex(SingleInputIndicator):
     """
     An indicator which calculates a relative strength index (RSI) across a rolling window.
     """
@@ -14,13 +14,14 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 
 
 cdef class Stochastics(Indicator):
-    cdef object _highs
-    cdef object _lows
-    cdef object _c_sub_l
-    cdef object _h_sub_l
+    cdef RollingWindow _highs
+    cdef RollingWindow _lows
+    cdef RollingWindow _c_sub_l
+    cdef RollingWindow _h_sub_l
 
     cdef readonly int period_k
     """The K window period.\n\n:returns: `int`"""
@@ -13,10 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
+from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.rolling_window cimport RollingWindow
 from nautilus_trader.model.data.bar cimport Bar
 
 
@@ -55,10 +56,10 @@ cdef class Stochastics(Indicator):
 
         self.period_k = period_k
         self.period_d = period_d
-        self._highs = deque(maxlen=period_k)
-        self._lows = deque(maxlen=period_k)
-        self._c_sub_l = deque(maxlen=period_d)
-        self._h_sub_l = deque(maxlen=period_d)
+        self._highs = RollingWindow(period_k)
+        self._lows = RollingWindow(period_k)
+        self._c_sub_l = RollingWindow(period_d)
+        self._h_sub_l = RollingWindow(period_d)
 
         self.value_k = 0
         self.value_d = 0
@@ -81,6 +82,17 @@ cdef class Stochastics(Indicator):
             bar.close.as_double(),
         )
 
+    cpdef void _update_bar(
+        self,
+        double open,
+        double high,
+        double low,
+        double close,
+        double volume,
+        uint64_t ts_init,
+    ) except *:
+        self.update_raw(high, low, close)
+
     cpdef void update_raw(
         self,
         double high,
@@ -109,11 +121,11 @@ cdef class Stochastics(Indicator):
 
         # Initialization logic
         if not self.initialized:
-            if len(self._highs) == self.period_k and len(self._lows) == self.period_k:
+            if self._highs.count == self.period_k and self._lows.count == self.period_k:
                 self._set_initialized(True)
 
-        cdef double k_max_high = max(self._highs)
-        cdef double k_min_low = min(self._lows)
+        cdef double k_max_high = self._highs.max()
+        cdef double k_min_low = self._lows.min()
 
         self._c_sub_l.append(close - k_min_low)
         self._h_sub_l.append(k_max_high - k_min_low)
@@ -122,7 +134,7 @@ cdef class Stochastics(Indicator):
             return  # Divide by zero guard
 
         self.value_k = 100 * ((close - k_min_low) / (k_max_high - k_min_low))
-        self.value_d = 100 * (sum(self._c_sub_l) / sum(self._h_sub_l))
+        self.value_d = 100 * (self._c_sub_l.sum / self._h_sub_l.sum)
 
     cpdef void _reset(self) except *:
         self._highs.clear()
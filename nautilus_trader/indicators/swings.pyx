@@ -17,6 +17,7 @@ from collections import deque
 
 import pandas as pd
 from cpython.datetime cimport datetime
+from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
@@ -74,6 +75,17 @@ cdef class Swings(Indicator):
             pd.Timestamp(bar.ts_init, tz="UTC"),
         )
 
+    cpdef void _update_bar(
+        self,
+        double open,
+        double high,
+        double low,
+        double close,
+        double volume,
+        uint64_t ts_init,
+    ) except *:
+        self.update_raw(high, low, pd.Timestamp(ts_init, tz="UTC"))
+
     cpdef void update_raw(
         self,
         double high,
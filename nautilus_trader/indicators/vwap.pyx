@@ -15,6 +15,7 @@
 
 import pandas as pd
 from cpython.datetime cimport datetime
+from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
@@ -52,6 +53,17 @@ cdef class VolumeWeightedAveragePrice(Indicator):
             pd.Timestamp(bar.ts_init, tz="UTC"),
         )
 
+    cpdef void _update_bar(
+        self,
+        double open,
+        double high,
+        double low,
+        double close,
+        double volume,
+        uint64_t ts_init,
+    ) except *:
+        self.update_raw(close, volume, pd.Timestamp(ts_init, tz="UTC"))
+
     cpdef void update_raw(
         self,
         double price,
@@ -13,7 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.cache.database cimport CacheDatabase
+from nautilus_trader.model.orders.base cimport Order
+from nautilus_trader.model.position cimport Position
 from nautilus_trader.serialization.base cimport Serializer
 
 
@@ -28,3 +33,21 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
     cdef Serializer _serializer
     cdef object _redis
+    cdef int _write_batch_size
+    cdef double _write_interval_secs
+    cdef object _write_queue
+    cdef object _write_thread
+    cdef list _write_errors
+
+    cdef readonly uint64_t write_lag_ns
+    """The lag (nanoseconds) from queuing to writing of the last write-behind batch.\n\n:returns: `uint64_t`"""
+
+    cpdef void flush_writes(self) except *
+    cdef void _check_write_error(self) except *
+    cdef object _execute(self, str name, tuple args)
+    cdef list _execute_many(self, list commands)
+
+    cdef list _scan_keys(self, str prefix)
+    cdef Account _account_from_events(self, list events)
+    cdef Order _order_from_events(self, list events)
+    cdef Position _position_from_events(self, list events, dict instruments)
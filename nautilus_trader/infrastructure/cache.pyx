@@ -13,7 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import queue
+import threading
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 from nautilus_trader.config import CacheDatabaseConfig
 
@@ -47,6 +51,8 @@ except ImportError:  # pragma: no cover
 
 
 cdef str _UTF8 = 'utf-8'
+cdef int _LOAD_BATCH_SIZE = 1000
+cdef int _MAX_LOGGED_KEYS = 10
 cdef str _CURRENCIES = 'Currencies'
 cdef str _INSTRUMENTS = 'Instruments'
 cdef str _ACCOUNTS = 'Accounts'
@@ -85,6 +91,11 @@ cdef class RedisCacheDatabase(CacheDatabase):
     timestamp strings back to int64's on the way out. One way to achieve this is
     to set the `timestamps_as_str` flag to true for the `MsgPackSerializer`, as
     per the default implementations for both `TradingNode` and `BacktestEngine`.
+
+    When `config.write_behind` is set, write operations are queued and written
+    to Redis in pipelined batches on a background thread. Data integrity checks
+    on the replies are then not performed, and `flush_writes()` or `close()`
+    should be called to ensure all queued operations are written.
     """
 
     def __init__(
@@ -117,6 +128,231 @@ cdef class RedisCacheDatabase(CacheDatabase):
         # Redis client
         self._redis = redis.Redis(host=config.host, port=config.port, db=0)
 
+        # Write-behind
+        self._write_batch_size = config.write_behind_batch_size
+        self._write_interval_secs = config.write_behind_interval_ms / 1000
+        self._write_queue = None
+        self._write_thread = None
+        self._write_errors = []
+        self.write_lag_ns = 0
+        if config.write_behind:
+            self._write_queue = queue.Queue(maxsize=config.write_behind_queue_size)
+            self._write_thread = threading.Thread(
+                target=self._run_write_behind,
+                name=f"{type(self).__name__}-write-behind",
+                daemon=True,
+            )
+            self._write_thread.start()
+
+    @property
+    def pending_writes(self):
+        """
+        The count of queued write-behind operations not yet written.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._write_queue.qsize() if self._write_queue is not None else 0
+
+# -- WRITE-BEHIND ---------------------------------------------------------------------------------
+
+    cpdef void flush_writes(self) except *:
+        """
+        Block until all queued write-behind operations have been written.
+
+        """
+        if self._write_queue is None:
+            return
+        self._write_queue.join()
+        self._check_write_error()
+
+    cpdef void close(self) except *:
+        """
+        Write all queued write-behind operations, then stop the background writer.
+
+        Any later operations are written synchronously.
+
+        """
+        if self._write_thread is None:
+            return
+        self._write_queue.put(None)  # Sentinel to stop the writer
+        self._write_thread.join()
+        self._write_thread = None
+        self._write_queue = None
+        self._check_write_error()
+        self._log.debug("Closed write-behind.")
+
+    cdef void _check_write_error(self) except *:
+        cdef list errors
+        cdef list batch
+        cdef list keys
+        if not self._write_errors:
+            return
+        errors, self._write_errors = self._write_errors, []
+        for ex, batch in errors:
+            keys = sorted({str(command[1][0]) for command in batch if command[1]})
+            self._log.error(
+                f"Write-behind batch failed, may be partially applied "
+                f"({len(batch):,} operation(s) for keys {keys[:_MAX_LOGGED_KEYS]}"
+                f"{' ...' if len(keys) > _MAX_LOGGED_KEYS else ''}): {repr(ex)}",
+            )
+
+    cdef object _execute(self, str name, tuple args):
+        # Execute the Redis command (or queue it when write-behind)
+        if self._write_queue is None:
+            return getattr(self._redis, name)(*args)
+        self._check_write_error()
+        self._write_queue.put((name, args, time.monotonic_ns()))  # Blocks when full
+        return None
+
+    cdef list _execute_many(self, list commands):
+        # Execute the Redis commands in a pipeline (or queue them when write-behind)
+        cdef tuple command
+        if self._write_queue is None:
+            pipe = self._redis.pipeline()
+            for command in commands:
+                getattr(pipe, command[0])(*command[1])
+            return pipe.execute()
+        self._check_write_error()
+        for command in commands:
+            self._write_queue.put((command[0], command[1], time.monotonic_ns()))
+        return None
+
+    def _run_write_behind(self):
+        cdef list batch
+        cdef bint stop = False
+        while not stop:
+            batch = []
+            try:
+                stop = self._collect_write_batch(batch)
+                if batch:
+                    self._write_batch(batch)
+            except BaseException as ex:
+                self._write_errors.append((ex, batch))  # Logged from the calling thread
+            finally:
+                # Every dequeued item (including the sentinel) must be marked done,
+                # otherwise `flush_writes()` and `close()` block forever
+                for _ in range(len(batch) + stop):
+                    self._write_queue.task_done()
+
+    def _collect_write_batch(self, list batch):
+        # Fill the batch by count or time, whichever is reached first.
+        # Returns True when the stop sentinel was dequeued.
+        command = self._write_queue.get()
+        if command is None:
+            return True
+        batch.append(command)
+        deadline = time.monotonic() + self._write_interval_secs
+        while len(batch) < self._write_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                command = self._write_queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if command is None:
+                return True
+            batch.append(command)
+        return False
+
+    def _write_batch(self, list batch):
+        # Not retried: a connection error or timeout can occur after EXEC
+        # reached the server, and replaying the batch would duplicate events
+        pipe = self._redis.pipeline(transaction=True)
+        for name, args, _ in batch:
+            getattr(pipe, name)(*args)
+        pipe.execute()
+        self.write_lag_ns = time.monotonic_ns() - batch[0][2]
+
+# -- BULK LOADING ---------------------------------------------------------------------------------
+
+    cdef list _scan_keys(self, str prefix):
+        # SCAN iterates incrementally rather than blocking the server like KEYS
+        return list(self._redis.scan_iter(match=f"{prefix}*", count=_LOAD_BATCH_SIZE))
+
+    def _fetch_batch(self, list keys, bint lists):
+        pipe = self._redis.pipeline(transaction=False)
+        for key in keys:
+            if lists:
+                pipe.lrange(key, 0, -1)
+            else:
+                pipe.get(key)
+        return pipe.execute()
+
+    def _iter_batches(self, list keys, str name, bint lists):
+        # Yield the values for `keys` in pipelined batches, fetching the next
+        # batch on a thread while the current batch is being deserialized.
+        cdef int total = len(keys)
+        cdef list batches = [
+            keys[i:i + _LOAD_BATCH_SIZE] for i in range(0, total, _LOAD_BATCH_SIZE)
+        ]
+        if not batches:
+            return
+
+        cdef int loaded = 0
+        cdef int i
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self._fetch_batch, batches[0], lists)
+            for i in range(len(batches)):
+                values = future.result()
+                if i + 1 < len(batches):
+                    future = executor.submit(self._fetch_batch, batches[i + 1], lists)
+                yield values
+                loaded += len(batches[i])
+                if total > _LOAD_BATCH_SIZE:
+                    self._log.info(f"Loaded {loaded:,}/{total:,} {name}...")
+
+    cdef Account _account_from_events(self, list events):
+        if not events:
+            return None
+
+        cdef Account account = AccountFactory.create_c(self._serializer.deserialize(events[0]))
+
+        cdef bytes event_bytes
+        for event_bytes in events[1:]:
+            account.apply(event=self._serializer.deserialize(event_bytes))
+
+        return account
+
+    cdef Order _order_from_events(self, list events):
+        if not events:
+            return None
+
+        cdef OrderInitialized init = self._serializer.deserialize(events[0])
+        cdef Order order = OrderUnpacker.from_init_c(init)
+
+        cdef bytes event_bytes
+        for event_bytes in events[1:]:
+            order.apply(self._serializer.deserialize(event_bytes))
+
+        return order
+
+    cdef Position _position_from_events(self, list events, dict instruments):
+        if not events:
+            return None
+
+        cdef OrderFilled initial_fill = self._serializer.deserialize(events[0])
+        if initial_fill.instrument_id not in instruments:
+            instruments[initial_fill.instrument_id] = self.load_instrument(initial_fill.instrument_id)
+        cdef Instrument instrument = instruments[initial_fill.instrument_id]
+        if instrument is None:
+            self._log.error(
+                f"Cannot load position: "
+                f"no instrument found for {initial_fill.instrument_id}",
+            )
+            return None
+
+        cdef Position position = Position(instrument, initial_fill)
+
+        cdef bytes event_bytes
+        for event_bytes in events[1:]:
+            position.apply(self._serializer.deserialize(event_bytes))
+
+        return position
+
 # -- COMMANDS -------------------------------------------------------------------------------------
 
     cpdef void flush(self) except *:
@@ -125,6 +361,7 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
         """
         self._log.debug("Flushing database....")
+        self.flush_writes()
         self._redis.flushdb()
         self._log.info("Flushed database.")
 
@@ -137,16 +374,14 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[str, Currency]
 
         """
-        cdef dict currencies = {}
+        self.flush_writes()
 
-        cdef list currency_keys = self._redis.keys(f"{self._key_currencies}*")
-        if not currency_keys:
-            return currencies
+        cdef dict currencies = {}
 
         cdef bytes key_bytes
         cdef str currency_code
         cdef Currency currency
-        for key_bytes in currency_keys:
+        for key_bytes in self._scan_keys(self._key_currencies):
             currency_code = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
             currency = self.load_currency(currency_code)
 
@@ -164,22 +399,19 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[InstrumentId, Instrument]
 
         """
-        cdef dict instruments = {}
+        self.flush_writes()
 
-        cdef list instrument_keys = self._redis.keys(f"{self._key_instruments}*")
-        if not instrument_keys:
-            return instruments
+        cdef dict instruments = {}
 
-        cdef bytes key_bytes
-        cdef str key_str
-        cdef InstrumentId instrument_id
+        cdef list keys = self._scan_keys(self._key_instruments)
+        cdef list values
+        cdef bytes instrument_bytes
         cdef Instrument instrument
-        for key_bytes in instrument_keys:
-            key_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            instrument_id = InstrumentId.from_str_c(key_str)
-            instrument = self.load_instrument(instrument_id)
-
-            if instrument is not None:
+        for values in self._iter_batches(keys, "instruments", False):
+            for instrument_bytes in values:
+                if not instrument_bytes:
+                    continue
+                instrument = self._serializer.deserialize(instrument_bytes)
                 instruments[instrument.id] = instrument
 
         return instruments
@@ -193,23 +425,19 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[AccountId, Account]
 
         """
-        cdef dict accounts = {}
+        self.flush_writes()
 
-        cdef list account_keys = self._redis.keys(f"{self._key_accounts}*")
-        if not account_keys:
-            return accounts
+        cdef dict accounts = {}
 
-        cdef bytes key_bytes
-        cdef str account_str
-        cdef AccountId account_id
+        cdef list keys = self._scan_keys(self._key_accounts)
+        cdef list values
+        cdef list events
         cdef Account account
-        for key_bytes in account_keys:
-            account_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            account_id = AccountId(account_str)
-            account = self.load_account(account_id)
-
-            if account is not None:
-                accounts[account.id] = account
+        for values in self._iter_batches(keys, "accounts", True):
+            for events in values:
+                account = self._account_from_events(events)
+                if account is not None:
+                    accounts[account.id] = account
 
         return accounts
 
@@ -222,23 +450,19 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[ClientOrderId, Order]
 
         """
-        cdef dict orders = {}
+        self.flush_writes()
 
-        cdef list order_keys = self._redis.keys(f"{self._key_orders}*")
-        if not order_keys:
-            return orders
+        cdef dict orders = {}
 
-        cdef bytes key_bytes
-        cdef str key_str
-        cdef ClientOrderId client_order_id
+        cdef list keys = self._scan_keys(self._key_orders)
+        cdef list values
+        cdef list events
         cdef Order order
-        for key_bytes in order_keys:
-            key_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            client_order_id = ClientOrderId(key_str)
-            order = self.load_order(client_order_id)
-
-            if order is not None:
-                orders[order.client_order_id] = order
+        for values in self._iter_batches(keys, "orders", True):
+            for events in values:
+                order = self._order_from_events(events)
+                if order is not None:
+                    orders[order.client_order_id] = order
 
         return orders
 
@@ -251,23 +475,20 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[PositionId, Position]
 
         """
-        cdef dict positions = {}
+        self.flush_writes()
 
-        cdef list position_keys = self._redis.keys(f"{self._key_positions}*")
-        if not position_keys:
-            return positions
+        cdef dict positions = {}
 
-        cdef bytes key_bytes
-        cdef str key_str
-        cdef PositionId position_id
+        cdef list keys = self._scan_keys(self._key_positions)
+        cdef dict instruments = {}  # Loaded once per instrument
+        cdef list values
+        cdef list events
         cdef Position position
-        for key_bytes in position_keys:
-            key_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            position_id = PositionId(key_str)
-            position = self.load_position(position_id)
-
-            if position is not None:
-                positions[position.id] = position
+        for values in self._iter_batches(keys, "positions", True):
+            for events in values:
+                position = self._position_from_events(events, instruments)
+                if position is not None:
+                    positions[position.id] = position
 
         return positions
 
@@ -287,6 +508,8 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(code, "code")
 
+        self.flush_writes()
+
         cdef dict c_hash = self._redis.hgetall(name=self._key_currencies + code)
         cdef dict c_map = {k.decode('utf-8'): v for k, v in c_hash.items()}
         if not c_map:
@@ -317,6 +540,8 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(instrument_id, "instrument_id")
 
+        self.flush_writes()
+
         cdef str key = self._key_instruments + instrument_id.to_str()
         cdef bytes instrument_bytes = self._redis.get(name=key)
         if not instrument_bytes:
@@ -340,22 +565,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(account_id, "account_id")
 
+        self.flush_writes()
+
         cdef list events = self._redis.lrange(
             name=self._key_accounts + account_id.to_str(),
             start=0,
             end=-1,
         )
 
-        # Check there is at least one event to pop
-        if not events:
-            return None
-
-        cdef bytes event
-        cdef Account account = AccountFactory.create_c(self._serializer.deserialize(events[0]))
-        for event in events[1:]:
-            account.apply(event=self._serializer.deserialize(event))
-
-        return account
+        return self._account_from_events(events)
 
     cpdef Order load_order(self, ClientOrderId client_order_id):
         """
@@ -373,24 +591,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(client_order_id, "client_order_id")
 
+        self.flush_writes()
+
         cdef list events = self._redis.lrange(
             name=self._key_orders + client_order_id.to_str(),
             start=0,
             end=-1,
         )
 
-        # Check there is at least one event to pop
-        if not events:
-            return None
-
-        cdef OrderInitialized init = self._serializer.deserialize(events.pop(0))
-        cdef Order order = OrderUnpacker.from_init_c(init)
-
-        cdef bytes event_bytes
-        for event_bytes in events:
-            order.apply(self._serializer.deserialize(event_bytes))
-
-        return order
+        return self._order_from_events(events)
 
     cpdef Position load_position(self, PositionId position_id):
         """
@@ -408,32 +617,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(position_id, "position_id")
 
+        self.flush_writes()
+
         cdef list events = self._redis.lrange(
             name=self._key_positions + position_id.to_str(),
             start=0,
             end=-1,
         )
 
-        # Check there is at least one event to pop
-        if not events:
-            return None
-
-        cdef OrderFilled initial_fill = self._serializer.deserialize(events.pop(0))
-        cdef Instrument instrument = self.load_instrument(initial_fill.instrument_id)
-        if instrument is None:
-            self._log.error(
-                f"Cannot load position: "
-                f"no instrument found for {initial_fill.instrument_id}",
-            )
-            return
-
-        cdef Position position = Position(instrument, initial_fill)
-
-        cdef bytes event_bytes
-        for event_bytes in events:
-            position.apply(self._serializer.deserialize(event_bytes))
-
-        return position
+        return self._position_from_events(events, {})
 
     cpdef dict load_strategy(self, StrategyId strategy_id):
         """
@@ -451,6 +643,8 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(strategy_id, "strategy_id")
 
+        self.flush_writes()
+
         cdef dict user_state = self._redis.hgetall(
             name=self._key_strategies + strategy_id.to_str() + ":State",
         )
@@ -468,7 +662,7 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(strategy_id, "strategy_id")
 
-        self._redis.delete(self._key_strategies + strategy_id.to_str())
+        self._execute("delete", (self._key_strategies + strategy_id.to_str(),))
 
         self._log.info(f"Deleted {repr(strategy_id)}.")
 
@@ -492,10 +686,10 @@ cdef class RedisCacheDatabase(CacheDatabase):
         }
 
         # Command pipeline
-        pipe = self._redis.pipeline()
-        for key, value in currency_map.items():
-            pipe.hset(name=self._key_currencies + currency.code, key=key, value=value)
-        pipe.execute()
+        self._execute_many([
+            ("hset", (self._key_currencies + currency.code, key, value))
+            for key, value in currency_map.items()
+        ])
 
         self._log.debug(f"Added currency {currency.code}.")
 
@@ -512,7 +706,7 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(instrument, "instrument")
 
         cdef str key = self._key_instruments + instrument.id.to_str()
-        self._redis.set(name=key, value=self._serializer.serialize(instrument))
+        self._execute("set", (key, self._serializer.serialize(instrument)))
 
         self._log.debug(f"Added instrument {instrument.id}.")
 
@@ -529,12 +723,12 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(account, "account")
 
         # Command pipeline
-        pipe = self._redis.pipeline()
-        pipe.rpush(self._key_accounts + account.id.to_str(), self._serializer.serialize(account.last_event_c()))
-        cdef list reply = pipe.execute()
+        cdef list reply = self._execute_many([
+            ("rpush", (self._key_accounts + account.id.to_str(), self._serializer.serialize(account.last_event_c()))),
+        ])
 
         # Check data integrity of reply
-        if len(reply) > 1:  # Reply = The length of the list after the push operation
+        if reply is not None and len(reply) > 1:  # Reply = The length of the list after the push operation
             self._log.error(
                 f"The {repr(account.id)} already existed and was appended to.",
             )
@@ -554,10 +748,10 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(order, "order")
 
         cdef bytes last_event = self._serializer.serialize(order.last_event_c())
-        cdef int reply = self._redis.rpush(self._key_orders + order.client_order_id.to_str(), last_event)
+        reply = self._execute("rpush", (self._key_orders + order.client_order_id.to_str(), last_event))
 
         # Check data integrity of reply
-        if reply > 1:  # Reply = The length of the list after the push operation
+        if reply is not None and reply > 1:  # Reply = The length of the list after the push operation
             self._log.warning(
                 f"The {repr(order.client_order_id)} already existed and was appended to.",
             )
@@ -577,10 +771,10 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(position, "position")
 
         cdef bytes last_event = self._serializer.serialize(position.last_event_c())
-        cdef int reply = self._redis.rpush(self._key_positions + position.id.to_str(), last_event)
+        reply = self._execute("rpush", (self._key_positions + position.id.to_str(), last_event))
 
         # Check data integrity of reply
-        if reply > 1:  # Reply = The length of the list after the push operation
+        if reply is not None and reply > 1:  # Reply = The length of the list after the push operation
             self._log.warning(
                 f"The {repr(position.id)} already existed and was appended to.",
             )
@@ -602,15 +796,11 @@ cdef class RedisCacheDatabase(CacheDatabase):
         cdef dict state = strategy.save()  # Extract state dictionary from strategy
 
         # Command pipeline
-        pipe = self._redis.pipeline()
+        cdef list commands = []
         for key, value in state.items():
-            pipe.hset(
-                name=self._key_strategies + strategy.id.value + ":State",
-                key=key,
-                value=value,
-            )
+            commands.append(("hset", (self._key_strategies + strategy.id.value + ":State", key, value)))
             self._log.debug(f"Saving {strategy.id} state {{ {key}: {value} }}")
-        pipe.execute()
+        self._execute_many(commands)
 
         self._log.debug(f"Saved strategy state for {strategy.id.value}.")
 
@@ -626,7 +816,7 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(account, "account")
 
         cdef bytes serialized_event = self._serializer.serialize(account.last_event_c())
-        self._redis.rpush(self._key_accounts + account.id.to_str(), serialized_event)
+        self._execute("rpush", (self._key_accounts + account.id.to_str(), serialized_event))
 
         self._log.debug(f"Updated {account}.")
 
@@ -643,10 +833,10 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(order, "order")
 
         cdef bytes serialized_event = self._serializer.serialize(order.last_event_c())
-        cdef int reply = self._redis.rpush(self._key_orders + order.client_order_id.to_str(), serialized_event)
+        reply = self._execute("rpush", (self._key_orders + order.client_order_id.to_str(), serialized_event))
 
         # Check data integrity of reply
-        if reply == 1:  # Reply = The length of the list after the push operation
+        if reply is not None and reply == 1:  # Reply = The length of the list after the push operation
             self._log.error(f"The updated Order(id={order.client_order_id.to_str()}) did not already exist.")
 
         self._log.debug(f"Updated {order}.")
@@ -664,6 +854,6 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(position, "position")
 
         cdef bytes serialized_event = self._serializer.serialize(position.last_event_c())
-        cdef int reply = self._redis.rpush(self._key_positions + position.id.to_str(), serialized_event)
+        self._execute("rpush", (self._key_positions + position.id.to_str(), serialized_event))
 
         self._log.debug(f"Updated {position}.")
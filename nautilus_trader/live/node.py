@@ -353,6 +353,10 @@ class TradingNode:
             if self.kernel.writer is not None:
                 self.kernel.writer.close()
 
+            # Write any pending cache database operations
+            if self.kernel.cache_db is not None:
+                self.kernel.cache_db.close()
+
             self.kernel.log.info("Shutting down executor...")
             if sys.version_info >= (3, 9):
                 # cancel_futures added in Python 3.9
@@ -31,6 +31,7 @@ from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.model cimport FIXED_PRECISION
 from nautilus_trader.core.rust.model cimport FIXED_SCALAR
 from nautilus_trader.core.rust.model cimport Currency_t
 from nautilus_trader.core.rust.model cimport money_free
@@ -47,6 +48,10 @@ from nautilus_trader.model.currency cimport Currency
 from nautilus_trader.model.identifiers cimport InstrumentId
 
 
+# The decimal precision of the raw fixed-point values (available from Python)
+RAW_PRECISION = FIXED_PRECISION
+
+
 @cython.auto_pickle(True)
 cdef class Quantity:
     """
@@ -208,6 +213,18 @@ cdef class Quantity:
         """
         return self._mem.precision
 
+    @property
+    def raw(self) -> int:
+        """
+        The raw fixed-point value for the quantity.
+
+        Returns
+        -------
+        uint64
+
+        """
+        return self._mem.raw
+
     cdef bint eq(self, Quantity other) except *:
         return self._mem.raw == other._mem.raw
 
@@ -574,6 +591,18 @@ cdef class Price:
         """
         return self._mem.precision
 
+    @property
+    def raw(self) -> int:
+        """
+        The raw fixed-point value for the price.
+
+        Returns
+        -------
+        int64
+
+        """
+        return self._mem.raw
+
     cdef bint eq(self, Price other) except *:
         return self._mem.raw == other._mem.raw
 
@@ -62,6 +62,8 @@ cdef class OrderBook:
     cdef void _update(self, Order order, int update_id) except *
     cdef void _delete(self, Order order, int update_id) except *
     cdef void _apply_delta(self, OrderBookDelta delta) except *
+    cdef void _add_bulk(self, list orders) except *
+    cdef void _apply_snapshot_orders(self, list orders, uint64_t update_id) except *
     cdef void _apply_update_id(self, int update_id) except *
     cdef void _check_integrity(self) except *
 
@@ -97,6 +99,7 @@ cdef class L3OrderBook(OrderBook):
 
 cdef class L2OrderBook(OrderBook):
     cdef void _process_order(self, Order order) except *
+    cdef list _dedupe_levels(self, list orders)
     cdef void _remove_if_exists(self, Order order, int update_id) except *
 
 
@@ -213,6 +213,9 @@ cdef class OrderBook:
         """
         Apply the bulk deltas to the order book.
 
+        Consecutive ``ADD`` deltas are grouped and added to each side in bulk,
+        other deltas are applied individually in sequence.
+
         Parameters
         ----------
         deltas : OrderBookDeltas
@@ -227,14 +230,28 @@ cdef class OrderBook:
         Condition.not_none(deltas, "deltas")
         Condition.equal(deltas.book_type, self.type, "deltas.book_type", "self.type")
 
+        cdef list adds = []
         cdef OrderBookDelta delta
         for delta in deltas.deltas:
+            if delta.action == BookAction.ADD:
+                adds.append(delta.order)
+                self._apply_update_id(delta.update_id)
+                self.ts_last = delta.ts_init
+                continue
+            if adds:
+                self._add_bulk(adds)
+                adds = []
             self._apply_delta(delta)
 
+        if adds:
+            self._add_bulk(adds)
+
     cpdef void apply_snapshot(self, OrderBookSnapshot snapshot) except *:
         """
         Apply the bulk snapshot to the order book.
 
+        The book is cleared and then rebuilt with each level created once.
+
         Parameters
         ----------
         snapshot : OrderBookSnapshot
@@ -250,23 +267,14 @@ cdef class OrderBook:
         Condition.equal(snapshot.book_type, self.type, "snapshot.book_type", "self.type")
 
         self.clear()
-        # Use `update` instead of `add` (when book has been cleared they're
-        # equivalent) to make work for L1_TBBO Orderbook.
-        cdef Order order
-        for bid in snapshot.bids:
-            order = Order(
-                price=bid[0],
-                size=bid[1],
-                side=OrderSide.BUY
-            )
-            self.update(order=order, update_id=snapshot.update_id)
-        for ask in snapshot.asks:
-            order = Order(
-                price=ask[0],
-                size=ask[1],
-                side=OrderSide.SELL
-            )
-            self.update(order=order, update_id=snapshot.update_id)
+
+        cdef list orders = [
+            Order(price=bid[0], size=bid[1], side=OrderSide.BUY) for bid in snapshot.bids
+        ]
+        orders.extend([
+            Order(price=ask[0], size=ask[1], side=OrderSide.SELL) for ask in snapshot.asks
+        ])
+        self._apply_snapshot_orders(orders, snapshot.update_id)
 
         self.ts_last = snapshot.ts_init
 
@@ -367,6 +375,33 @@ cdef class OrderBook:
 
         self.ts_last = delta.ts_init
 
+    cdef void _add_bulk(self, list orders) except *:
+        cdef list bids = []
+        cdef list asks = []
+        cdef Order order
+        for order in orders:
+            if order.side == OrderSide.BUY:
+                bids.append(order)
+            elif order.side == OrderSide.SELL:
+                asks.append(order)
+
+        if bids:
+            self.bids.bulk_add(bids)
+        if asks:
+            self.asks.bulk_add(asks)
+
+    cdef void _apply_snapshot_orders(self, list orders, uint64_t update_id) except *:
+        # The book has been cleared, so each order is equivalent to an `add`
+        if not orders:
+            return
+
+        self._add_bulk(orders)
+
+        if update_id == 0:
+            self.last_update_id += len(orders)
+        else:
+            self.last_update_id = update_id
+
     cdef void _apply_update_id(self, int update_id) except *:
         if update_id == 0:
             self.last_update_id += 1
@@ -844,6 +879,37 @@ cdef class L2OrderBook(OrderBook):
             if num_orders != 1:
                 raise BookIntegrityError(f"Number of orders on {level} != 1, was {num_orders}")
 
+    cdef void _add_bulk(self, list orders) except *:
+        cdef Order order
+        for order in orders:
+            self._process_order(order=order)
+
+        OrderBook._add_bulk(self, orders)
+
+    cdef void _apply_snapshot_orders(self, list orders, uint64_t update_id) except *:
+        if not orders:
+            return
+
+        cdef Order order
+        for order in orders:
+            self._process_order(order=order)
+
+        # Each order is an update of a whole level, so only the last order for
+        # each level is applied.
+        OrderBook._add_bulk(self, self._dedupe_levels(orders))
+
+        if update_id == 0:
+            self.last_update_id += len(orders)
+        else:
+            self.last_update_id = update_id
+
+    cdef list _dedupe_levels(self, list orders):
+        cdef dict last_orders = {}  # type: dict[tuple[OrderSide, str], Order]
+        cdef Order order
+        for order in orders:
+            last_orders[(order.side, order.id)] = order
+        return list(last_orders.values())
+
     cdef void _process_order(self, Order order) except *:
         # Because a L2OrderBook only has one order per level, we replace the
         # order.id with a price level, which will let us easily process the
@@ -853,9 +919,9 @@ cdef class L2OrderBook(OrderBook):
     cdef void _remove_if_exists(self, Order order, int update_id) except *:
         # For a L2OrderBook, an order update means a whole level update. If this
         # level exists, remove it so that we can insert the new level.
-        if order.side == OrderSide.BUY and order.price in self.bids.prices():
+        if order.side == OrderSide.BUY and self.bids.get_level(order.price) is not None:
             self._delete(order, update_id=update_id)
-        elif order.side == OrderSide.SELL and order.price in self.asks.prices():
+        elif order.side == OrderSide.SELL and self.asks.get_level(order.price) is not None:
             self._delete(order, update_id=update_id)
 
 
@@ -974,6 +1040,18 @@ cdef class L1OrderBook(OrderBook):
         if ask_levels > 1:
             raise BookIntegrityError(f"Number of ask levels > 1, was {ask_levels}")
 
+    cdef void _add_bulk(self, list orders) except *:
+        cdef Order order
+        for order in orders:
+            self.add(order=order)  # Raises for L1 books
+
+    cdef void _apply_snapshot_orders(self, list orders, uint64_t update_id) except *:
+        # Use `update` instead of `add` (when book has been cleared they're
+        # equivalent) to make work for L1_TBBO Orderbook.
+        cdef Order order
+        for order in orders:
+            self.update(order=order, update_id=update_id)
+
     cdef Order _process_order(self, Order order):
         # Because an `L1OrderBook` only has one level per side, we replace the
         # `order.id` with the name of the side, which will let us easily process
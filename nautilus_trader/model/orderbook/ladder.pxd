@@ -22,6 +22,8 @@ from nautilus_trader.model.orderbook.level cimport Level
 
 cdef class Ladder:
     cdef dict _order_id_level_index
+    cdef dict _price_levels
+    cdef list _sort_keys
 
     cdef readonly list levels
     """The ladders levels.\n\n:returns: `list[Level]`"""
@@ -34,6 +36,7 @@ cdef class Ladder:
 
     cpdef bint reverse(self) except *
     cpdef void add(self, Order order) except *
+    cpdef void bulk_add(self, list orders) except *
     cpdef void update(self, Order order) except *
     cpdef void delete(self, Order order) except *
     cpdef list depth(self, int n=*)
@@ -41,4 +44,9 @@ cdef class Ladder:
     cpdef list volumes(self)
     cpdef list exposures(self)
     cpdef Level top(self)
+    cpdef Level get_level(self, double price)
     cpdef list simulate_order_fills(self, Order order, DepthType depth_type=*)
+
+    cdef double _sort_key(self, double price) except *
+    cdef void _insert_level(self, Level level) except *
+    cdef void _remove_level(self, Level level) except *
@@ -13,10 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import heapq
-
 from libc.stdint cimport uint8_t
 
+from nautilus_trader.core.collections cimport bisect_left
 from nautilus_trader.core.collections cimport bisect_right
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.model.c_enums.depth_type cimport DepthType
@@ -30,7 +29,10 @@ cdef class Ladder:
     """
     Represents a ladder of price levels in a book.
 
-    A ladder is on one side of the book, either bid or ask/offer.
+    A ladder is on one side of the book, either bid or ask/offer. Levels are
+    indexed by price and held in sorted order (best price first), so that
+    levels are located with a hash lookup and inserted/removed with a binary
+    search.
 
     Parameters
     ----------
@@ -59,6 +61,8 @@ cdef class Ladder:
         Condition.not_negative_int(size_precision, "size_precision")
 
         self._order_id_level_index = {}  # type: dict[str, Level]
+        self._price_levels = {}  # type: dict[float, Level]
+        self._sort_keys = []  # type: list[float]  # Ascending, aligned with levels
 
         self.levels = []  # type: list[Level]  # TODO: Make levels private??
         self.reverse = reverse
@@ -80,30 +84,53 @@ cdef class Ladder:
         """
         Condition.not_none(order, "order")
 
-        cdef list existing_prices = self.prices()
-
-        cdef int price_idx
-        cdef Level level
-        if order.price in existing_prices:
+        cdef Level level = self._price_levels.get(order.price)
+        if level is not None:
             # Level exists, add new order
-            price_idx = existing_prices.index(order.price)
-            level = self.levels[price_idx]
             level.add(order=order)
         else:
             # New price, create Level
             level = Level(price=order.price)
             level.add(order)
-
-            if self.reverse:
-                self.levels.append(level)
-                # TODO: heapq._siftdown_max is temporary before custom data structure
-                heapq._siftdown_max(self.levels, 0, len(self.levels) - 1)
-            else:
-                price_idx = bisect_right(existing_prices, level.price)
-                self.levels.insert(price_idx, level)
+            self._insert_level(level)
 
         self._order_id_level_index[order.id] = level
 
+    cpdef void bulk_add(self, list orders) except *:
+        """
+        Add the given orders to the ladder in bulk.
+
+        Orders are grouped by price, with all new levels merged into the sorted
+        levels once (rather than being inserted one at a time).
+
+        Parameters
+        ----------
+        orders : list[Order]
+            The orders to add.
+
+        """
+        Condition.not_none(orders, "orders")
+
+        cdef dict new_levels = {}  # type: dict[float, Level]
+        cdef Order order
+        cdef Level level
+        for order in orders:
+            level = self._price_levels.get(order.price)
+            if level is None:
+                level = new_levels.get(order.price)
+                if level is None:
+                    level = Level(price=order.price)
+                    new_levels[order.price] = level
+            level.add(order)
+            self._order_id_level_index[order.id] = level
+
+        if not new_levels:
+            return
+
+        self._price_levels.update(new_levels)
+        self.levels = sorted(self.levels + list(new_levels.values()), reverse=self.reverse)
+        self._sort_keys = [self._sort_key(level.price) for level in self.levels]
+
     cpdef void update(self, Order order) except *:
         """
         Update the given order in the ladder.
@@ -125,8 +152,10 @@ cdef class Ladder:
         if order.price == level.price:
             # This update contains a volume update
             level.update(order=order)
+            if order.size == 0:
+                self._order_id_level_index.pop(order.id, None)
             if not level.orders:
-                self.levels.remove(level)
+                self._remove_level(level)
         else:
             # New price for this order, delete and insert
             self.delete(order=order)
@@ -152,11 +181,10 @@ cdef class Ladder:
         if level is None:
             return
             # TODO: raise KeyError("Cannot delete order: not found at level.")
-        cdef int price_idx = self.prices().index(level.price)
         level.delete(order=order)
         self._order_id_level_index.pop(order.id)
         if not level.orders:
-            del self.levels[price_idx]
+            self._remove_level(level)
 
     cpdef list depth(self, int n=1):
         """
@@ -219,12 +247,27 @@ cdef class Ladder:
         Level or ``None``
 
         """
-        cdef list top = self.depth(1)
-        if top:
-            return top[0]
+        if self.levels:
+            return self.levels[0]
         else:
             return None
 
+    cpdef Level get_level(self, double price):
+        """
+        Return the `Level` at the given price (if found).
+
+        Parameters
+        ----------
+        price : double
+            The price for the level.
+
+        Returns
+        -------
+        Level or ``None``
+
+        """
+        return self._price_levels.get(price)
+
     cpdef list simulate_order_fills(self, Order order, DepthType depth_type=DepthType.VOLUME):
         """
         Return a simulation of where this order would be filled in the ladder.
@@ -276,3 +319,21 @@ cdef class Ladder:
                     cumulative_denominator += current
 
         return fills
+
+    cdef double _sort_key(self, double price) except *:
+        # Keys are held ascending, so reverse ladders (bids) negate the price
+        return -price if self.reverse else price
+
+    cdef void _insert_level(self, Level level) except *:
+        cdef double key = self._sort_key(level.price)
+        cdef int idx = bisect_right(self._sort_keys, key)
+        self._sort_keys.insert(idx, key)
+        self.levels.insert(idx, level)
+        self._price_levels[level.price] = level
+
+    cdef void _remove_level(self, Level level) except *:
+        if self._price_levels.pop(level.price, None) is None:
+            return  # Level already removed
+        cdef int idx = bisect_left(self._sort_keys, self._sort_key(level.price))
+        del self._sort_keys[idx]
+        del self.levels[idx]
@@ -13,20 +13,23 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import heapq
 import itertools
-import sys
+import queue
+import threading
 from collections import namedtuple
-from typing import Dict, Iterator, List, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Set
 
 import fsspec
-import pandas as pd
+import numpy as np
+import pyarrow as pa
 import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 from pyarrow.lib import ArrowInvalid
 
 from nautilus_trader.config import BacktestDataConfig
+from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.persistence.catalog import DataCatalog
+from nautilus_trader.persistence.external.metadata import ts_index_row_groups
 from nautilus_trader.persistence.funcs import parse_bytes
 from nautilus_trader.serialization.arrow.serializer import ParquetSerializer
 from nautilus_trader.serialization.arrow.util import clean_key
@@ -39,23 +42,65 @@ def dataset_batches(
     file_meta: FileMeta,
     fs: fsspec.AbstractFileSystem,
     n_rows: int,
-) -> Iterator[pd.DataFrame]:
+) -> Iterator[pa.Table]:
     try:
         d: ds.Dataset = ds.dataset(file_meta.filename, filesystem=fs)
     except ArrowInvalid:
         return
+    cache: Dict[str, Dict] = {}
     for fn in sorted(map(str, d.files)):
+        row_groups = ts_index_row_groups(
+            fs=fs,
+            fn=fn,
+            start=file_meta.start,
+            end=file_meta.end,
+            cache=cache,
+        )
+        if row_groups == []:
+            continue  # Indexed with no data in the time range, skip opening the file
         f = pq.ParquetFile(fs.open(fn))
-        for batch in f.iter_batches(batch_size=n_rows):
+        if row_groups is None:
+            row_groups = _row_groups_in_range(f.metadata, start=file_meta.start, end=file_meta.end)
+            if not row_groups:
+                continue
+        for batch in f.iter_batches(batch_size=n_rows, row_groups=row_groups):
             if batch.num_rows == 0:
                 break
-            df = batch.to_pandas()
-            df = df[(df["ts_init"] >= file_meta.start) & (df["ts_init"] <= file_meta.end)]
-            if df.empty:
-                continue
-            if file_meta.instrument_id:
-                df.loc[:, "instrument_id"] = file_meta.instrument_id
-            yield df
+            table = _prepare_batch(batch=batch, file_meta=file_meta)
+            if table is not None:
+                yield table
+
+
+def _prepare_batch(batch: pa.RecordBatch, file_meta: FileMeta) -> Optional[pa.Table]:
+    # Filter the batch to the time range (None if empty) and set the instrument ID
+    table = pa.Table.from_batches([batch])
+    ts_init = table.column("ts_init").to_numpy()
+    mask = (ts_init >= file_meta.start) & (ts_init <= file_meta.end)
+    if not mask.any():
+        return None
+    if not mask.all():
+        table = table.filter(pa.array(mask))
+    if file_meta.instrument_id:
+        instrument_ids = pa.array([file_meta.instrument_id] * table.num_rows, pa.string())
+        if "instrument_id" in table.column_names:
+            index = table.column_names.index("instrument_id")
+            table = table.set_column(index, "instrument_id", instrument_ids)
+        else:
+            table = table.append_column("instrument_id", instrument_ids)
+    return table
+
+
+def _row_groups_in_range(metadata: pq.FileMetaData, start: int, end: int) -> List[int]:
+    # Fall back to the row group statistics for files without a `ts_init` index
+    if "ts_init" not in metadata.schema.names:
+        return list(range(metadata.num_row_groups))
+    column = metadata.schema.names.index("ts_init")
+    row_groups = []
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(column).statistics
+        if stats is None or not stats.has_min_max or (stats.min <= end and stats.max >= start):
+            row_groups.append(i)
+    return row_groups
 
 
 def build_filenames(
@@ -82,62 +127,63 @@ def build_filenames(
     return files
 
 
-def frame_to_nautilus(df: pd.DataFrame, cls: type):
-    return ParquetSerializer.deserialize(cls=cls, chunk=df.to_dict("records"))
+def _merge_pending(files: List[FileMeta], pending: Dict[str, List[pa.Table]]) -> List:
+    # Convert each file's pending rows in one columnar pass, then merge all files by `ts_init`
+    objs: List = []
+    timestamps = []
+    for f in files:
+        tables = pending[f.filename]
+        pending[f.filename] = []
+        if not tables:
+            continue
+        table = pa.concat_tables(tables, promote=True)
+        file_objs = ParquetSerializer.deserialize_table(cls=f.datatype, table=table)
+        objs.extend(file_objs)
+        timestamps.append(
+            np.fromiter((o.ts_init for o in file_objs), dtype=np.uint64, count=len(file_objs)),
+        )
+    if not objs:
+        return []
+    order = np.argsort(np.concatenate(timestamps), kind="stable")
+    return [objs[i] for i in order]
 
 
-def batch_files(  # noqa: C901
+def batch_files(
     catalog: DataCatalog,
     data_configs: List[BacktestDataConfig],
     read_num_rows: int = 10000,
     target_batch_size_bytes: int = parse_bytes("100mb"),  # noqa: B008,
 ):
     files = build_filenames(catalog=catalog, data_configs=data_configs)
-    buffer = {fn.filename: pd.DataFrame() for fn in files}
+    buffer: Dict[str, Optional[pa.Table]] = {fn.filename: None for fn in files}
+    pending: Dict[str, List[pa.Table]] = {fn.filename: [] for fn in files}
     datasets = {
         f.filename: dataset_batches(file_meta=f, fs=catalog.fs, n_rows=read_num_rows) for f in files
     }
     completed: Set[str] = set()
     bytes_read = 0
-    values = []
     sent_count = 0
     while set([f.filename for f in files]) != completed:
-        # Fill buffer (if required)
-        for fn in buffer:
-            if len(buffer[fn]) < read_num_rows:
-                next_buf = next(datasets[fn], None)
-                if next_buf is None:
-                    completed.add(fn)
-                    continue
-                buffer[fn] = pd.concat([buffer[fn], next_buf])
-
-        # Determine minimum timestamp
-        max_ts_per_frame = {fn: df["ts_init"].max() for fn, df in buffer.items() if not df.empty}
-        if not max_ts_per_frame:
-            continue
-        min_ts = min(max_ts_per_frame.values())
+        _fill_buffer(
+            buffer=buffer,
+            datasets=datasets,
+            completed=completed,
+            read_num_rows=read_num_rows,
+        )
+        bytes_read += _move_ready_rows(buffer=buffer, pending=pending)
 
-        # Filter buffer dataframes based on min_timestamp
-        batches = []
-        for f in files:
-            df = buffer[f.filename]
-            if df.empty:
-                continue
-            ts_filter = df["ts_init"] <= min_ts  # min of max timestamps
-            batch = df[ts_filter]
-            buffer[f.filename] = df[~ts_filter]
-            objs = frame_to_nautilus(df=batch, cls=f.datatype)
-            batches.append(objs)
-            bytes_read += sum([sys.getsizeof(x) for x in objs])
-
-        # Merge ticks
-        values.extend(list(heapq.merge(*batches, key=lambda x: x.ts_init)))
         if bytes_read > target_batch_size_bytes:
+            values = _merge_pending(files=files, pending=pending)
             yield values
             sent_count += len(values)
             bytes_read = 0
-            values = []
 
+    # Every file is exhausted, so the rows still buffered past the min timestamp are ready too
+    for fn, table in buffer.items():
+        if table is not None and table.num_rows:
+            pending[fn].append(table)
+
+    values = _merge_pending(files=files, pending=pending)
     if values:
         yield values
         sent_count += len(values)
@@ -146,6 +192,132 @@ def batch_files(  # noqa: C901
         raise ValueError("No data found, check data_configs")
 
 
+def _fill_buffer(
+    buffer: Dict[str, Optional[pa.Table]],
+    datasets: Dict[str, Iterator[pa.Table]],
+    completed: Set[str],
+    read_num_rows: int,
+) -> None:
+    # Top up each buffer holding fewer than `read_num_rows` rows with its next batch
+    for fn, table in buffer.items():
+        if table is not None and table.num_rows >= read_num_rows:
+            continue
+        next_buf = next(datasets[fn], None)
+        if next_buf is None:
+            completed.add(fn)
+            continue
+        buffer[fn] = (
+            next_buf if table is None else pa.concat_tables([table, next_buf], promote=True)
+        )
+
+
+def _move_ready_rows(
+    buffer: Dict[str, Optional[pa.Table]],
+    pending: Dict[str, List[pa.Table]],
+) -> int:
+    # Move the rows up to the min of the max buffered timestamps to pending (these
+    # can be merged without any later row sorting before them), returning the
+    # Arrow size of the rows moved.
+    ts_init_per_table = {
+        fn: table.column("ts_init").to_numpy()
+        for fn, table in buffer.items()
+        if table is not None and table.num_rows
+    }
+    if not ts_init_per_table:
+        return 0
+    min_ts = min(ts_init.max() for ts_init in ts_init_per_table.values())
+
+    nbytes = 0
+    for fn, ts_init in ts_init_per_table.items():
+        table = buffer[fn]
+        ts_filter = ts_init <= min_ts
+        if ts_filter.all():
+            ready, buffer[fn] = table, None
+        else:
+            ready = table.filter(pa.array(ts_filter))
+            buffer[fn] = table.filter(pa.array(~ts_filter))
+        pending[fn].append(ready)
+        nbytes += ready.nbytes
+    return nbytes
+
+
+def prefetch(iterable: Iterable, size: int) -> Iterator:
+    """
+    Return an iterator over `iterable`, producing up to `size` items ahead on a
+    background thread.
+
+    Parquet reads and decompression release the GIL, so the next batches can be
+    read while the current one is being consumed. Exceptions raised producing
+    items are re-raised from the returned iterator.
+
+    Parameters
+    ----------
+    iterable : Iterable
+        The items to produce.
+    size : int
+        The maximum number of items to produce ahead of the consumer (> 0).
+
+    Returns
+    -------
+    Iterator
+
+    Raises
+    ------
+    ValueError
+        If `size` is not positive (> 0).
+
+    """
+    PyCondition.positive_int(size, "size")
+
+    items: queue.Queue = queue.Queue(maxsize=size)
+    stopped = threading.Event()
+    thread = threading.Thread(
+        target=_prefetch_produce,
+        args=(iterable, items, stopped),
+        name="prefetch",
+        daemon=True,
+    )
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _PREFETCH_DONE:
+                return
+            if isinstance(item, _PrefetchError):
+                raise item.exception
+            yield item
+    finally:
+        stopped.set()
+
+
+_PREFETCH_DONE = object()
+_PrefetchError = namedtuple("_PrefetchError", "exception")
+
+
+def _prefetch_produce(iterable: Iterable, items: queue.Queue, stopped: threading.Event) -> None:
+    # Always queue a terminal item (done or the error), so the consumer never blocks
+    terminal = _PREFETCH_DONE
+    try:
+        for item in iterable:
+            if not _prefetch_put(items, stopped, item):
+                return  # Consumer has stopped
+    except BaseException as ex:
+        # Re-raised by the consumer
+        terminal = _PrefetchError(ex)
+    finally:
+        _prefetch_put(items, stopped, terminal)
+
+
+def _prefetch_put(items: queue.Queue, stopped: threading.Event, item) -> bool:
+    while not stopped.is_set():
+        try:
+            items.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
 def groupby_datatype(data):
     def _groupby_key(x):
         return type(x).__name__
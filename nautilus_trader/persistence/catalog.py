@@ -16,6 +16,7 @@
 import os
 import pathlib
 import platform
+import sys
 from typing import Callable, Dict, List, Optional, Union
 
 import fsspec
@@ -38,13 +39,14 @@ from nautilus_trader.model.instruments.base import Instrument
 from nautilus_trader.model.orderbook.data import OrderBookData
 from nautilus_trader.persistence.base import Singleton
 from nautilus_trader.persistence.external.metadata import load_mappings
+from nautilus_trader.persistence.external.metadata import ts_index_row_groups
 from nautilus_trader.serialization.arrow.serializer import ParquetSerializer
 from nautilus_trader.serialization.arrow.serializer import list_schemas
 from nautilus_trader.serialization.arrow.util import GENERIC_DATA_PREFIX
 from nautilus_trader.serialization.arrow.util import camel_to_snake_case
 from nautilus_trader.serialization.arrow.util import class_to_filename
 from nautilus_trader.serialization.arrow.util import clean_key
-from nautilus_trader.serialization.arrow.util import dict_of_lists_to_list_of_dicts
+from nautilus_trader.serialization.arrow.util import fixed_columns_to_str
 
 
 class DataCatalog(metaclass=Singleton):
@@ -114,10 +116,6 @@ class DataCatalog(metaclass=Singleton):
             if clean_instrument_keys:
                 instrument_ids = list(set(map(clean_key, instrument_ids)))
             filters.append(ds.field(instrument_id_column).cast("string").isin(instrument_ids))
-        if start is not None:
-            filters.append(ds.field(ts_column) >= int(pd.Timestamp(start).to_datetime64()))
-        if end is not None:
-            filters.append(ds.field(ts_column) <= int(pd.Timestamp(end).to_datetime64()))
 
         full_path = str(self._make_path(cls=cls))
         if not (self.fs.exists(full_path) or self.fs.isdir(full_path)):
@@ -126,7 +124,13 @@ class DataCatalog(metaclass=Singleton):
             else:
                 return pd.DataFrame() if as_dataframe else None
 
-        dataset = ds.dataset(full_path, partitioning="hive", filesystem=self.fs)
+        dataset = self._time_bounded_dataset(
+            path=full_path,
+            filters=filters,
+            ts_column=ts_column,
+            start=start,
+            end=end,
+        )
         table_kwargs = table_kwargs or {}
         if projections:
             projected = {**{c: ds.field(c) for c in dataset.schema.names}, **projections}
@@ -140,6 +144,51 @@ class DataCatalog(metaclass=Singleton):
         else:
             return self._handle_table_nautilus(table=table, cls=cls, mappings=mappings)
 
+    def _time_bounded_dataset(
+        self,
+        path: str,
+        filters: List,
+        ts_column: str,
+        start=None,
+        end=None,
+    ) -> ds.Dataset:
+        # Appends the time range filters to `filters`, returning the dataset at
+        # `path` pruned to the files which may have rows in the time range.
+        start_ns = int(pd.Timestamp(start).to_datetime64()) if start is not None else None
+        end_ns = int(pd.Timestamp(end).to_datetime64()) if end is not None else None
+        if start_ns is not None:
+            filters.append(ds.field(ts_column) >= start_ns)
+        if end_ns is not None:
+            filters.append(ds.field(ts_column) <= end_ns)
+
+        dataset = ds.dataset(path, partitioning="hive", filesystem=self.fs)
+        if ts_column != "ts_init" or (start_ns is None and end_ns is None):
+            return dataset
+        return self._prune_dataset(
+            dataset=dataset,
+            start=start_ns if start_ns is not None else 0,
+            end=end_ns if end_ns is not None else sys.maxsize,
+        )
+
+    def _prune_dataset(self, dataset: ds.FileSystemDataset, start: int, end: int):
+        # Drop files with no row groups in the `ts_init` range (per the partition
+        # indexes), the scan then only has to open the remaining files.
+        cache: Dict[str, Dict] = {}
+        fragments = [
+            fragment
+            for fragment in dataset.get_fragments()
+            if ts_index_row_groups(fs=self.fs, fn=fragment.path, start=start, end=end, cache=cache)
+            != []
+        ]
+        if len(fragments) == len(dataset.files):
+            return dataset
+        return ds.FileSystemDataset(
+            fragments,
+            schema=dataset.schema,
+            format=dataset.format,
+            filesystem=dataset.filesystem,
+        )
+
     def load_inverse_mappings(self, path):
         mappings = load_mappings(fs=self.fs, path=path)
         for key in mappings:
@@ -154,7 +203,7 @@ class DataCatalog(metaclass=Singleton):
         sort_columns: Optional[List] = None,
         as_type: Optional[Dict] = None,
     ):
-        df = table.to_pandas().drop_duplicates()
+        df = fixed_columns_to_str(table.to_pandas()).drop_duplicates()
         for col in mappings:
             df.loc[:, col] = df[col].map(mappings[col])
 
@@ -172,22 +221,39 @@ class DataCatalog(metaclass=Singleton):
     def _handle_table_nautilus(
         table: Union[pa.Table, pd.DataFrame], cls: type, mappings: Optional[Dict]
     ):
-        if isinstance(table, pa.Table):
-            dicts = dict_of_lists_to_list_of_dicts(table.to_pydict())
-        elif isinstance(table, pd.DataFrame):
+        if isinstance(table, pd.DataFrame):
+            # Deserialize rows as dicts, as converting to Arrow would null NaN floats
+            # (and fail on mixed type object columns)
             dicts = table.to_dict("records")
-        else:
+            if not dicts:
+                return []
+            for key, maps in (mappings or {}).items():
+                for d in dicts:
+                    if d[key] in maps:
+                        d[key] = maps[d[key]]
+            return ParquetSerializer.deserialize(cls=cls, chunk=dicts)
+        elif not isinstance(table, pa.Table):
             raise TypeError(
                 f"`table` was {type(table)}, expected `pyarrow.Table` or `pandas.DataFrame`"
             )
-        if not dicts:
+        if table.num_rows == 0:
             return []
-        for key, maps in mappings.items():
-            for d in dicts:
-                if d[key] in maps:
-                    d[key] = maps[d[key]]
-        data = ParquetSerializer.deserialize(cls=cls, chunk=dicts)
-        return data
+        for key, maps in (mappings or {}).items():
+            # Remap the (small) dictionary of unique values rather than every row
+            column = table.column(key).combine_chunks()
+            if not pa.types.is_dictionary(column.type):
+                column = column.dictionary_encode()
+            dictionary = pa.array(
+                [maps.get(value, value) for value in column.dictionary.to_pylist()],
+                type=column.dictionary.type,
+            )
+            mapped = pa.DictionaryArray.from_arrays(column.indices, dictionary)
+            table = table.set_column(
+                table.schema.get_field_index(key),
+                key,
+                mapped,
+            )
+        return ParquetSerializer.deserialize_table(cls=cls, table=table)
 
     def _make_path(self, cls: type) -> str:
         path: pathlib.Path = self.path / "data" / f"{class_to_filename(cls=cls)}.parquet"
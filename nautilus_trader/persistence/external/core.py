@@ -13,14 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import logging
 import pathlib
+import posixpath
 import re
 from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures import ThreadPoolExecutor
-from io import BytesIO
+from concurrent.futures import as_completed
 from itertools import groupby
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import fsspec
 import pandas as pd
@@ -28,7 +29,6 @@ import pyarrow as pa
 import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 from fsspec.core import OpenFile
-from pyarrow import ArrowInvalid
 from tqdm import tqdm
 
 from nautilus_trader.core.correctness import PyCondition
@@ -36,7 +36,10 @@ from nautilus_trader.model.data.base import GenericData
 from nautilus_trader.model.instruments.base import Instrument
 from nautilus_trader.persistence.catalog import DataCatalog
 from nautilus_trader.persistence.catalog import resolve_path
+from nautilus_trader.persistence.external.metadata import load_compacted
 from nautilus_trader.persistence.external.metadata import load_mappings
+from nautilus_trader.persistence.external.metadata import update_ts_index
+from nautilus_trader.persistence.external.metadata import write_compacted
 from nautilus_trader.persistence.external.metadata import write_partition_column_mappings
 from nautilus_trader.persistence.external.readers import Reader
 from nautilus_trader.persistence.funcs import parse_bytes
@@ -50,6 +53,10 @@ from nautilus_trader.serialization.arrow.util import clean_partition_cols
 from nautilus_trader.serialization.arrow.util import maybe_list
 
 
+ROW_GROUP_SIZE = 100_000
+NANOSECONDS_IN_DAY = 86_400_000_000_000
+
+
 class RawFile:
     """
     Provides a wrapper of fsspec.OpenFile that processes a raw file and writes to parquet.
@@ -94,17 +101,33 @@ class RawFile:
                 yield raw
 
 
-def process_raw_file(catalog: DataCatalog, raw_file: RawFile, reader: Reader):
+def process_raw_file(
+    catalog: DataCatalog,
+    raw_file: RawFile,
+    reader: Reader,
+    metadata: Optional[List[Dict[str, Any]]] = None,
+):
     n_rows = 0
     for block in raw_file.iter():
         objs = [x for x in reader.parse(block) if x is not None]
         dicts = split_and_serialize(objs)
         dataframes = dicts_to_dataframes(dicts)
-        n_rows += write_tables(catalog=catalog, tables=dataframes)
+        n_rows += write_tables(catalog=catalog, tables=dataframes, metadata=metadata)
     reader.on_file_complete()
     return n_rows
 
 
+def _process_raw_file_deferred(
+    catalog: DataCatalog,
+    raw_file: RawFile,
+    reader: Reader,
+) -> Tuple[int, List[Dict[str, Any]]]:
+    # Process pool worker: write data files only, returning the metadata for the parent to merge
+    metadata: List[Dict[str, Any]] = []
+    n_rows = process_raw_file(catalog=catalog, raw_file=raw_file, reader=reader, metadata=metadata)
+    return n_rows, metadata
+
+
 def process_files(
     glob_path,
     reader: Reader,
@@ -114,9 +137,26 @@ def process_files(
     executor: Optional[Executor] = None,
     **kwargs,
 ):
+    """
+    Process the raw files matching `glob_path` with `reader`, writing the data to `catalog`.
+
+    If `executor` is a ``ProcessPoolExecutor``, each file is parsed in a worker
+    process with its own copy of `reader`. Workers write their own parquet
+    files, and the dataset metadata (partition mappings, `ts_init` index and
+    ``_common_metadata``) is merged and written once by the parent when all
+    files are complete. The reader and the catalog must then be picklable, and
+    any custom data types must be registered when their module is imported.
+
+    Returns
+    -------
+    dict[str, int]
+        The number of rows written per file path.
+
+    """
     PyCondition.type_or_none(executor, Executor, "executor")
 
     executor = executor or ThreadPoolExecutor()
+    deferred = isinstance(executor, ProcessPoolExecutor)
 
     raw_files = make_raw_files(
         glob_path=glob_path,
@@ -127,15 +167,35 @@ def process_files(
 
     futures = {}
     for rf in raw_files:
-        futures[rf] = executor.submit(process_raw_file, catalog=catalog, raw_file=rf, reader=reader)
+        if deferred:
+            futures[rf] = executor.submit(
+                _process_raw_file_deferred,
+                catalog=catalog,
+                raw_file=rf,
+                reader=reader,
+            )
+        else:
+            futures[rf] = executor.submit(
+                process_raw_file,
+                catalog=catalog,
+                raw_file=rf,
+                reader=reader,
+            )
 
     # Show progress
-    for _ in tqdm(list(futures.values())):
+    for _ in tqdm(as_completed(futures.values()), total=len(futures)):
         pass
 
     results = {rf.open_file.path: f.result() for rf, f in futures.items()}
     executor.shutdown()
 
+    if deferred:
+        merge_parquet_metadata(
+            fs=catalog.fs,
+            metadata=[md for _, file_metadata in results.values() for md in file_metadata],
+        )
+        results = {path: n_rows for path, (n_rows, _) in results.items()}
+
     return results
 
 
@@ -219,9 +279,17 @@ def merge_existing_data(catalog: DataCatalog, cls: type, df: pd.DataFrame) -> pd
             return df
 
 
-def write_tables(catalog: DataCatalog, tables: Dict[type, Dict[str, pd.DataFrame]], **kwargs):
+def write_tables(
+    catalog: DataCatalog,
+    tables: Dict[type, Dict[str, pd.DataFrame]],
+    metadata: Optional[List[Dict[str, Any]]] = None,
+    **kwargs,
+):
     """
     Write tables to catalog.
+
+    If a `metadata` list is passed, the dataset metadata of each write is
+    appended to it instead of being written (see `merge_parquet_metadata`).
     """
     rows_written = 0
 
@@ -241,14 +309,17 @@ def write_tables(catalog: DataCatalog, tables: Dict[type, Dict[str, pd.DataFrame
         name = f"{class_to_filename(cls)}.parquet"
         path = catalog.path / "data" / name
         merged = merge_existing_data(catalog=catalog, cls=cls, df=df)
-        write_parquet(
+        written = write_parquet(
             fs=catalog.fs,
             path=path,
             df=merged,
             partition_cols=partition_cols,
             schema=schema,
+            write_metadata=metadata is None,
             **kwargs,
         )
+        if metadata is not None:
+            metadata.append(written)
         rows_written += len(df)
 
     return rows_written
@@ -260,10 +331,15 @@ def write_parquet(
     df: pd.DataFrame,
     partition_cols: Optional[List[str]],
     schema: pa.Schema,
+    write_metadata: bool = True,
     **kwargs,
-):
+) -> Dict[str, Any]:
     """
     Write a single dataframe to parquet.
+
+    Returns the dataset metadata of the write (the dataset `path`, `schema`,
+    `ts_ranges` of the written files and partition `mappings`), which is also
+    written to the dataset unless `write_metadata` is False.
     """
     # Check partition values are valid before writing to parquet
     mappings = check_partition_columns(df=df, partition_columns=partition_cols)
@@ -294,44 +370,118 @@ def write_parquet(
     )
     if pa.__version__ >= "6.0.0":
         kwargs.update(existing_data_behavior="overwrite_or_ignore")
-    files = set(fs.glob(resolve_path(path / "**", fs=fs)))
+
+    # Sort once in Arrow; the sort is stable and partitioning preserves row order
+    # when writing single threaded, so each file is written exactly once, sorted.
+    if "ts_init" in table.column_names:
+        table = table.sort_by("ts_init")
+    kwargs.setdefault("use_threads", False)
+    kwargs.setdefault("min_rows_per_group", ROW_GROUP_SIZE)
+    kwargs.setdefault("max_rows_per_group", ROW_GROUP_SIZE)
+
+    # Index the `ts_init` range of each row group from the written file metadata
+    ts_ranges: Dict[str, List] = {}
+
+    def file_visitor(written_file):
+        ranges = _ts_init_ranges_from_metadata(written_file.metadata)
+        if ranges is not None:
+            ts_ranges[written_file.path] = ranges
+
     path = str(resolve_path(path=path, fs=fs))  # type: ignore
+    _check_dataset_schema(fs=fs, path=path, schema=schema)
     ds.write_dataset(
         data=table,
         base_dir=path,
         filesystem=fs,
         partitioning=partitions,
         format="parquet",
+        file_visitor=file_visitor,
         **kwargs,
     )
-
-    # Ensure data written by write_dataset is sorted
-    new_files = set(fs.glob(f"{path}/**/*.parquet")) - files
     del df
-    for fn in new_files:
-        try:
-            ndf = pd.read_parquet(BytesIO(fs.open(fn).read()))
-        except ArrowInvalid:
-            logging.error(f"Failed to read {fn}")
-            continue
-        # assert ndf.shape[0] == shape
-        if "ts_init" in ndf.columns:
-            ndf = ndf.sort_values("ts_init").reset_index(drop=True)
-        pq.write_table(
-            table=pa.Table.from_pandas(ndf),
-            where=fn,
-            filesystem=fs,
+
+    metadata = {
+        "path": path,
+        "schema": table.schema,
+        "ts_ranges": ts_ranges,
+        "mappings": mappings,
+    }
+    if write_metadata:
+        merge_parquet_metadata(fs=fs, metadata=[metadata])
+    return metadata
+
+
+def _check_dataset_schema(fs: fsspec.AbstractFileSystem, path: str, schema: pa.Schema):
+    # Files of a dataset are scanned together, so they must share a storage format
+    fn = f"{path}/_common_metadata"
+    if not fs.exists(fn):
+        return
+    with fs.open(fn, "rb") as f:
+        existing = pq.read_schema(f)
+    existing_precision = (existing.metadata or {}).get(b"fixed_precision")
+    precision = (schema.metadata or {}).get(b"fixed_precision")
+    if existing_precision != precision:
+        raise ValueError(
+            f"Cannot write data with fixed precision {precision!r} to the dataset at {path}, "
+            f"which has fixed precision {existing_precision!r} (a `None` precision is the "
+            "decimal string format). Run the 1.148.0 catalog migration before writing new data.",
         )
 
-    # Write the ``_common_metadata`` parquet file without row groups statistics
-    pq.write_metadata(table.schema, f"{path}/_common_metadata", version="2.6", filesystem=fs)
+
+def merge_parquet_metadata(fs: fsspec.AbstractFileSystem, metadata: List[Dict[str, Any]]):
+    """
+    Write the dataset metadata collected from one or more `write_parquet` calls.
+
+    Each dataset has its metadata files written once, however many writes
+    it received.
+    """
+    # Index the `ts_init` range of each row group, so time bounded reads can skip files
+    ts_ranges: Dict[str, List] = {}
+    for md in metadata:
+        ts_ranges.update(md["ts_ranges"])
+    update_ts_index(fs=fs, ranges=ts_ranges)
+
+    schemas: Dict[str, pa.Schema] = {}
+    mappings: Dict[str, Dict] = {}
+    for md in metadata:
+        schemas[md["path"]] = md["schema"]
+        for column, values in md["mappings"].items():
+            mappings.setdefault(md["path"], {}).setdefault(column, {}).update(values)
+
+    for path, schema in schemas.items():
+        # Write the ``_common_metadata`` parquet file without row groups statistics
+        pq.write_metadata(schema, f"{path}/_common_metadata", version="2.6", filesystem=fs)
 
     # Write out any partition columns we had to modify due to filesystem requirements
-    if mappings:
+    for path, path_mappings in mappings.items():
         existing = load_mappings(fs=fs, path=path)
         if existing:
-            mappings["instrument_id"].update(existing["instrument_id"])
-        write_partition_column_mappings(fs=fs, path=path, mappings=mappings)
+            path_mappings["instrument_id"].update(existing["instrument_id"])
+        write_partition_column_mappings(fs=fs, path=path, mappings=path_mappings)
+
+
+def _ts_init_ranges_from_metadata(metadata: pq.FileMetaData) -> Optional[List[List[int]]]:
+    # The [min, max] `ts_init` of each row group, from the parquet column statistics
+    if metadata is None or "ts_init" not in metadata.schema.names:
+        return None
+    column = metadata.schema.names.index("ts_init")
+    ranges = []
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(column).statistics
+        if stats is None or not stats.has_min_max:
+            return None
+        ranges.append([int(stats.min), int(stats.max)])
+    return ranges
+
+
+def _ts_init_ranges(ts_init: pd.Series) -> List[List[int]]:
+    # The [min, max] `ts_init` of each row group written with `ROW_GROUP_SIZE`
+    return [
+        [int(group.min()), int(group.max())]
+        for group in (
+            ts_init.iloc[i : i + ROW_GROUP_SIZE] for i in range(0, len(ts_init), ROW_GROUP_SIZE)
+        )
+    ]
 
 
 def write_objects(catalog: DataCatalog, chunk: List, **kwargs):
@@ -401,14 +551,172 @@ def _validate_dataset(catalog: DataCatalog, path: str, new_partition_format="%Y%
         # Write new file
         table = pa.Table.from_pandas(df, schema=dataset.schema)
         new_fn = filenames[0].replace(pathlib.Path(filenames[0]).stem, part[1])
-        pq.write_table(table=table, where=fs.open(new_fn, "wb"))
+        pq.write_table(table=table, where=fs.open(new_fn, "wb"), row_group_size=ROW_GROUP_SIZE)
 
         # Remove old files
         for fn in filenames:
             fs.rm(fn)
 
+        # Re-index the `ts_init` row group ranges
+        ts_ranges = {new_fn: _ts_init_ranges(df["ts_init"])} if "ts_init" in df.columns else {}
+        update_ts_index(fs=fs, ranges=ts_ranges, removed=[fn for fn in filenames if fn != new_fn])
+
 
 def validate_data_catalog(catalog: DataCatalog, **kwargs):
     for cls in catalog.list_data_types():
         path = resolve_path(catalog.path / "data" / f"{cls}.parquet", fs=catalog.fs)
         _validate_dataset(catalog=catalog, path=path, **kwargs)
+
+
+def compact_dataset(
+    catalog: DataCatalog,
+    path: str,
+    partition_format: str = "%Y%m%d",
+    target_file_size: Union[int, str] = "128mb",
+    dedup_cols: Optional[List[str]] = None,
+):
+    """
+    Incrementally compact the dataset at `path` into sorted, time partitioned files.
+
+    In each partition directory, the files not yet compacted are merged with the
+    compacted files of the time partitions (dates by default) their rows fall in.
+    The merged rows are deduplicated on `ts_init` and `dedup_cols`, sorted by
+    `ts_init`, and written as files of roughly `target_file_size`. Compacted
+    files are recorded, so later runs only touch partitions with new data.
+
+    Replacement files are written under hidden names and renamed into place
+    before the files they replace are removed. Concurrent readers therefore
+    never see partially written files or missing rows, although they may
+    briefly see rows from both the old and new files.
+
+    Parameters
+    ----------
+    catalog : DataCatalog
+        The data catalog of the dataset.
+    path : str
+        The resolved path of the dataset.
+    partition_format : str, default "%Y%m%d"
+        The `strftime` format naming each time partition, no finer than a day.
+    target_file_size : int or str, default "128mb"
+        The approximate size of each compacted file.
+    dedup_cols : list[str], optional
+        The key columns identifying duplicate rows along with `ts_init`. If
+        None then rows are only duplicates if all columns are equal.
+
+    """
+    fs = catalog.fs
+    target_file_size = parse_bytes(target_file_size)
+
+    part_files: Dict[str, List[str]] = {}
+    for fn in sorted(fs.find(path)):
+        if fn.endswith(".parquet") and not posixpath.basename(fn).startswith((".", "_")):
+            part_files.setdefault(posixpath.dirname(fn), []).append(fn)
+
+    for part_path, filenames in part_files.items():
+        _compact_partition(
+            fs=fs,
+            path=part_path,
+            filenames=filenames,
+            partition_format=partition_format,
+            target_file_size=target_file_size,
+            dedup_cols=dedup_cols,
+        )
+
+
+def _compact_partition(
+    fs: fsspec.AbstractFileSystem,
+    path: str,
+    filenames: List[str],
+    partition_format: str,
+    target_file_size: int,
+    dedup_cols: Optional[List[str]],
+):
+    compacted = load_compacted(fs=fs, path=path)
+    pending = [fn for fn in filenames if posixpath.basename(fn) not in compacted]
+    if not pending:
+        return
+
+    # Only the `ts_init` column is needed to find the time partitions to rewrite
+    pending_dataset = ds.dataset(pending, filesystem=fs)
+    if "ts_init" not in pending_dataset.schema.names:
+        return
+    ts_init = pending_dataset.to_table(columns=["ts_init"]).column("ts_init").to_pandas()
+    touched = set(_time_partitions(ts_init=ts_init, partition_format=partition_format))
+    existing = [fn for fn in filenames if compacted.get(posixpath.basename(fn)) in touched]
+
+    # Read compacted files first, so rows of new files win on duplicates
+    sources = existing + pending
+    table = ds.dataset(sources, filesystem=fs).to_table()
+    df = table.to_pandas()
+    subset = ["ts_init", *dedup_cols] if dedup_cols else None
+    df = df.drop_duplicates(subset=subset, keep="last", ignore_index=True)
+    df = df.sort_values("ts_init", kind="stable", ignore_index=True)
+
+    # Estimate the rows per file from the compressed size of the source files
+    source_size = sum(fs.size(fn) for fn in sources)
+    rows_per_file = max(1, int(target_file_size * table.num_rows / max(source_size, 1)))
+
+    # Write every file under a hidden name first (ignored by dataset discovery)
+    written: Dict[str, str] = {}
+    ts_ranges: Dict[str, List] = {}
+    parts = _time_partitions(ts_init=df["ts_init"], partition_format=partition_format)
+    for part, part_df in df.groupby(parts, sort=True):
+        for i, start in enumerate(range(0, len(part_df), rows_per_file)):
+            chunk = part_df.iloc[start : start + rows_per_file]
+            fn = f"{path}/{part}.parquet" if i == 0 else f"{path}/{part}-{i}.parquet"
+            with fs.open(_hidden_path(fn), "wb") as f:
+                pq.write_table(
+                    table=pa.Table.from_pandas(chunk, schema=table.schema, preserve_index=False),
+                    where=f,
+                    row_group_size=ROW_GROUP_SIZE,
+                )
+            written[fn] = part
+            ts_ranges[fn] = _ts_init_ranges(chunk["ts_init"])
+
+    # Swap the new files in, then drop the files they replace
+    for fn in written:
+        fs.mv(_hidden_path(fn), fn)
+    removed = [fn for fn in sources if fn not in written]
+    update_ts_index(fs=fs, ranges=ts_ranges, removed=removed)
+    for fn in removed:
+        compacted.pop(posixpath.basename(fn), None)
+    compacted.update({posixpath.basename(fn): part for fn, part in written.items()})
+    write_compacted(fs=fs, path=path, compacted=compacted)
+    for fn in removed:
+        fs.rm(fn)
+
+
+def _hidden_path(fn: str) -> str:
+    return f"{posixpath.dirname(fn)}/.{posixpath.basename(fn)}.tmp"
+
+
+def _time_partitions(ts_init: pd.Series, partition_format: str) -> pd.Series:
+    # Format each distinct day once rather than every row
+    days = ts_init.astype("int64") // NANOSECONDS_IN_DAY
+    labels = {
+        day: pd.Timestamp(day * NANOSECONDS_IN_DAY).strftime(partition_format)
+        for day in days.unique()
+    }
+    return days.map(labels)
+
+
+def compact_data_catalog(catalog: DataCatalog, executor: Optional[Executor] = None, **kwargs):
+    """
+    Incrementally compact every dataset of the catalog, see `compact_dataset`.
+
+    If an `executor` is given, the datasets are compacted concurrently on it.
+    """
+    paths = [
+        resolve_path(catalog.path / "data" / f"{cls}.parquet", fs=catalog.fs)
+        for cls in catalog.list_data_types()
+    ]
+    if executor is None:
+        for path in paths:
+            compact_dataset(catalog=catalog, path=path, **kwargs)
+        return
+
+    futures = [
+        executor.submit(compact_dataset, catalog=catalog, path=path, **kwargs) for path in paths
+    ]
+    for future in as_completed(futures):
+        future.result()
@@ -13,7 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from typing import Dict
+import posixpath
+from typing import Dict, Iterable, List, Optional
 
 import fsspec
 import orjson
@@ -21,6 +22,8 @@ from fsspec.utils import infer_storage_options
 
 
 PARTITION_MAPPINGS_FN = "_partition_mappings.json"
+TS_INDEX_FN = "_ts_index.json"
+COMPACTED_FN = "_compacted.json"
 
 
 def load_mappings(fs, path) -> Dict:
@@ -35,6 +38,81 @@ def write_partition_column_mappings(fs, path, mappings) -> None:
         f.write(orjson.dumps(mappings))
 
 
+def load_ts_index(fs, path) -> Dict[str, List]:
+    """
+    Load the `ts_init` index of the partition directory at `path`.
+
+    The index maps each parquet file name in the directory to the ``[min, max]``
+    `ts_init` of each of its row groups.
+    """
+    if not fs.exists(f"{path}/{TS_INDEX_FN}"):
+        return {}
+    with fs.open(f"{path}/{TS_INDEX_FN}", "rb") as f:
+        return orjson.loads(f.read())
+
+
+def write_ts_index(fs, path, index: Dict[str, List]) -> None:
+    with fs.open(f"{path}/{TS_INDEX_FN}", "wb") as f:
+        f.write(orjson.dumps(index))
+
+
+def update_ts_index(fs, ranges: Dict[str, List], removed: Iterable[str] = ()) -> None:
+    """
+    Update the `ts_init` indexes with the row group `ranges` of written files,
+    and drop the entries of `removed` files.
+    """
+    removed = list(removed)
+    for path in {posixpath.dirname(fn) for fn in [*ranges, *removed]}:
+        index = load_ts_index(fs=fs, path=path)
+        for fn in removed:
+            if posixpath.dirname(fn) == path:
+                index.pop(posixpath.basename(fn), None)
+        for fn, file_ranges in ranges.items():
+            if posixpath.dirname(fn) == path:
+                index[posixpath.basename(fn)] = file_ranges
+        write_ts_index(fs=fs, path=path, index=index)
+
+
+def ts_index_row_groups(
+    fs,
+    fn: str,
+    start: int,
+    end: int,
+    cache: Optional[Dict] = None,
+) -> Optional[List[int]]:
+    """
+    Return the row groups of the file `fn` which overlap the `ts_init` range
+    ``[start, end]``, or ``None`` if the file is not indexed.
+    """
+    path = posixpath.dirname(fn)
+    if cache is None:
+        cache = {}
+    if path not in cache:
+        cache[path] = load_ts_index(fs=fs, path=path)
+    ranges = cache[path].get(posixpath.basename(fn))
+    if ranges is None:
+        return None
+    return [i for i, (ts_min, ts_max) in enumerate(ranges) if ts_min <= end and ts_max >= start]
+
+
+def load_compacted(fs, path) -> Dict[str, str]:
+    """
+    Load the compaction record of the partition directory at `path`.
+
+    The record maps each compacted parquet file name in the directory to the
+    time partition it holds.
+    """
+    if not fs.exists(f"{path}/{COMPACTED_FN}"):
+        return {}
+    with fs.open(f"{path}/{COMPACTED_FN}", "rb") as f:
+        return orjson.loads(f.read())
+
+
+def write_compacted(fs, path, compacted: Dict[str, str]) -> None:
+    with fs.open(f"{path}/{COMPACTED_FN}", "wb") as f:
+        f.write(orjson.dumps(compacted))
+
+
 def _glob_path_to_fs(glob_path):
     inferred = infer_storage_options(glob_path)
     inferred.pop("path", None)
@@ -0,0 +1,72 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import warnings
+
+import fsspec
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from nautilus_trader.model.data.bar import Bar
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.persistence.catalog import DataCatalog
+from nautilus_trader.persistence.external.core import write_objects
+from nautilus_trader.serialization.arrow.util import class_to_filename
+
+
+FROM = "1.147.1"
+TO = "1.148.0"
+
+
+def main(catalog: DataCatalog):
+    """Store tick and bar prices and sizes as fixed-point integers rather than strings"""
+    fs: fsspec.AbstractFileSystem = catalog.fs
+    for cls, column in ((QuoteTick, "bid"), (TradeTick, "price"), (Bar, "open")):
+        path = f"{catalog.path}/data/{class_to_filename(cls)}.parquet"
+        if not fs.exists(path):
+            continue
+
+        dataset = ds.dataset(path, partitioning="hive", filesystem=fs)
+        if dataset.schema.field(column).type != pa.string():
+            continue  # Already migrated
+
+        # Create temp parquet in case of error
+        fs.move(path, f"{path}_tmp", recursive=True)
+
+        try:
+            dataset = ds.dataset(f"{path}_tmp", partitioning="hive", filesystem=fs)
+            mappings = catalog.load_inverse_mappings(path=f"{path}_tmp")
+            instrument_ids = dataset.to_table(columns=["instrument_id"])["instrument_id"]
+
+            # Rewrite one instrument at a time to bound memory usage
+            for instrument_id in instrument_ids.unique().to_pylist():
+                table = dataset.to_table(
+                    filter=ds.field("instrument_id").cast("string") == instrument_id,
+                )
+                objects = catalog._handle_table_nautilus(table=table, cls=cls, mappings=mappings)
+                write_objects(catalog, objects)
+
+            # Ensure we can query again
+            dataset = ds.dataset(path, partitioning="hive", filesystem=fs)
+            assert dataset.schema.field(column).type == pa.int64()
+
+            # Clear temp parquet
+            fs.rm(f"{path}_tmp", recursive=True)
+        except Exception:
+            warnings.warn(f"Failed to write or read data type {cls}")
+            if fs.exists(path):
+                fs.rm(path, recursive=True)
+            fs.move(f"{path}_tmp", path, recursive=True)
@@ -13,9 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import datetime
 import pathlib
-from typing import BinaryIO, Dict, Optional, Set, Tuple
+import time
+from typing import BinaryIO, Dict, List, Optional, Set, Tuple
 
 import fsspec
 import pyarrow as pa
@@ -36,7 +36,6 @@ from nautilus_trader.serialization.arrow.serializer import get_cls_table
 from nautilus_trader.serialization.arrow.serializer import list_schemas
 from nautilus_trader.serialization.arrow.serializer import register_parquet
 from nautilus_trader.serialization.arrow.util import GENERIC_DATA_PREFIX
-from nautilus_trader.serialization.arrow.util import list_dicts_to_dict_lists
 
 
 class StreamingFeatherWriter:
@@ -55,6 +54,9 @@ class StreamingFeatherWriter:
         The flush interval (milliseconds) for writing chunks.
     replace : bool, default False
         If existing files at the given `path` should be replaced.
+    batch_size : int, default 1000
+        The maximum number of rows buffered per table before a record batch is
+        written (buffered rows are also written on each flush interval).
     """
 
     def __init__(
@@ -65,7 +67,9 @@ class StreamingFeatherWriter:
         flush_interval_ms: Optional[int] = None,
         replace: bool = False,
         include_types: Optional[Tuple[type]] = None,
+        batch_size: int = 1000,
     ):
+        PyCondition.positive_int(batch_size, "batch_size")
         self.fs: fsspec.AbstractFileSystem = fsspec.filesystem(fs_protocol)
         self.path = self._check_path(path)
         self.include_types = include_types
@@ -85,9 +89,14 @@ class StreamingFeatherWriter:
         self.logger = logger
         self._files: Dict[type, BinaryIO] = {}
         self._writers: Dict[type, RecordBatchStreamWriter] = {}
+        self._buffers: Dict[str, Dict[str, List]] = {}
+        self._buffer_schemas: Dict[str, pa.Schema] = {}
+        self._buffer_rows: Dict[str, int] = {}
         self._create_writers()
-        self.flush_interval_ms = datetime.timedelta(milliseconds=flush_interval_ms or 1000)
-        self._last_flush = datetime.datetime(1970, 1, 1)  # Default value to begin
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms or 1000
+        self._flush_interval_ns = self.flush_interval_ms * 1_000_000
+        self._last_flush_ns = time.monotonic_ns()
         self.missing_writers: Set[type] = set()
 
     def _check_path(self, p: str) -> str:
@@ -170,37 +179,63 @@ class StreamingFeatherWriter:
                 return
             else:
                 return
-        writer: RecordBatchStreamWriter = self._writers[table]
         serialized = ParquetSerializer.serialize(obj)
         if isinstance(serialized, dict):
             serialized = [serialized]
-        original = list_dicts_to_dict_lists(
-            serialized,
-            keys=self._schemas[cls].names,
-        )
-        data = list(original.values())
+
+        # Buffer the rows by column, record batches are written once `batch_size` is reached
+        buffer = self._buffers.get(table)
+        if buffer is None:
+            schema = self._schemas[cls]
+            buffer = {name: [] for name in schema.names}
+            self._buffers[table] = buffer
+            self._buffer_schemas[table] = schema
+            self._buffer_rows[table] = 0
+        for name, values in buffer.items():
+            values.extend([row.get(name) for row in serialized])
+        self._buffer_rows[table] += len(serialized)
+
+        if self._buffer_rows[table] >= self.batch_size:
+            self._write_buffer(table)
+        self.check_flush()
+
+    def _write_buffer(self, table: str) -> None:
+        buffer = self._buffers.pop(table, None)
+        rows = self._buffer_rows.pop(table, 0)
+        if not rows:
+            return
+        schema = self._buffer_schemas[table]
+        writer: RecordBatchStreamWriter = self._writers[table]
         try:
-            batch = pa.record_batch(data, schema=self._schemas[cls])
-            writer.write_batch(batch)
-            self.check_flush()
-        except Exception as ex:
-            self.logger.error(f"Failed to serialize {cls=}")
-            self.logger.error(f"ERROR = `{ex}`")
-            self.logger.debug(f"data = {original}")
+            writer.write_batch(pa.record_batch(list(buffer.values()), schema=schema))
+        except Exception:
+            # Retry row by row, so only the rows which fail to serialize are dropped
+            for i in range(rows):
+                row = {name: values[i] for name, values in buffer.items()}
+                try:
+                    writer.write_batch(
+                        pa.record_batch([[v] for v in row.values()], schema=schema),
+                    )
+                except Exception as ex:
+                    self.logger.error(f"Failed to serialize {table=}")
+                    self.logger.error(f"ERROR = `{ex}`")
+                    self.logger.debug(f"data = {row}")
 
     def check_flush(self) -> None:
         """
         Flush all stream writers if current time greater than the next flush interval.
         """
-        now = datetime.datetime.now()
-        if now - self._last_flush > self.flush_interval_ms:
+        now_ns = time.monotonic_ns()
+        if now_ns - self._last_flush_ns > self._flush_interval_ns:
             self.flush()
-            self._last_flush = now
+            self._last_flush_ns = now_ns
 
     def flush(self) -> None:
         """
-        Flush all stream writers.
+        Write all buffered rows, then flush all stream writers.
         """
+        for table in tuple(self._buffers):
+            self._write_buffer(table)
         for cls in self._files:
             self._files[cls].flush()
 
@@ -0,0 +1,202 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+"""Defines builders of Nautilus objects directly from fixed-point `pyarrow.Table` columns."""
+
+import numpy as np
+import pyarrow as pa
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.model.c_enums.aggressor_side cimport AggressorSideParser
+from nautilus_trader.model.data.bar cimport Bar
+from nautilus_trader.model.data.bar cimport BarType
+from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.data.tick cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport TradeId
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
+
+
+cdef tuple _dictionary_column(table, str name, parse):
+    # Parse each unique value once, returning the parsed values and row indices
+    column = table.column(name).combine_chunks()
+    if not pa.types.is_dictionary(column.type):
+        column = column.dictionary_encode()
+    cdef list values = [parse(v) for v in column.dictionary.to_pylist()]
+    indices = np.ascontiguousarray(column.indices.to_numpy(zero_copy_only=False), dtype=np.int64)
+    return values, indices
+
+
+cdef _numeric_column(table, str name, dtype):
+    return np.ascontiguousarray(table.column(name).to_numpy(), dtype=dtype)
+
+
+cpdef list quote_ticks_from_arrow(table: pa.Table):
+    """
+    Return quote ticks built from the columns of the given table.
+
+    Parameters
+    ----------
+    table : pa.Table
+        The table in the `QuoteTick` fixed-point schema.
+
+    Returns
+    -------
+    list[QuoteTick]
+
+    """
+    if table.num_rows == 0:
+        return []
+
+    cdef list instrument_ids
+    cdef int64_t[:] instrument_idx
+    instrument_ids, instrument_idx = _dictionary_column(table, "instrument_id", InstrumentId.from_str)
+
+    cdef int64_t[:] bids = _numeric_column(table, "bid", np.int64)
+    cdef int64_t[:] asks = _numeric_column(table, "ask", np.int64)
+    cdef uint64_t[:] bid_sizes = _numeric_column(table, "bid_size", np.uint64)
+    cdef uint64_t[:] ask_sizes = _numeric_column(table, "ask_size", np.uint64)
+    cdef uint8_t[:] price_precisions = _numeric_column(table, "price_precision", np.uint8)
+    cdef uint8_t[:] size_precisions = _numeric_column(table, "size_precision", np.uint8)
+    cdef uint64_t[:] ts_events = _numeric_column(table, "ts_event", np.uint64)
+    cdef uint64_t[:] ts_inits = _numeric_column(table, "ts_init", np.uint64)
+
+    cdef list ticks = []
+    cdef int i
+    for i in range(table.num_rows):
+        ticks.append(
+            QuoteTick.from_raw_c(
+                instrument_ids[instrument_idx[i]],
+                bids[i],
+                asks[i],
+                price_precisions[i],
+                bid_sizes[i],
+                ask_sizes[i],
+                size_precisions[i],
+                ts_events[i],
+                ts_inits[i],
+            )
+        )
+
+    return ticks
+
+
+cpdef list trade_ticks_from_arrow(table: pa.Table):
+    """
+    Return trade ticks built from the columns of the given table.
+
+    Parameters
+    ----------
+    table : pa.Table
+        The table in the `TradeTick` fixed-point schema.
+
+    Returns
+    -------
+    list[TradeTick]
+
+    """
+    if table.num_rows == 0:
+        return []
+
+    cdef list instrument_ids
+    cdef int64_t[:] instrument_idx
+    instrument_ids, instrument_idx = _dictionary_column(table, "instrument_id", InstrumentId.from_str)
+
+    cdef list aggressor_sides
+    cdef int64_t[:] aggressor_side_idx
+    aggressor_sides, aggressor_side_idx = _dictionary_column(table, "aggressor_side", AggressorSideParser.from_str_py)
+
+    cdef int64_t[:] prices = _numeric_column(table, "price", np.int64)
+    cdef uint64_t[:] sizes = _numeric_column(table, "size", np.uint64)
+    cdef uint8_t[:] price_precisions = _numeric_column(table, "price_precision", np.uint8)
+    cdef uint8_t[:] size_precisions = _numeric_column(table, "size_precision", np.uint8)
+    cdef list trade_ids = table.column("trade_id").to_pylist()
+    cdef uint64_t[:] ts_events = _numeric_column(table, "ts_event", np.uint64)
+    cdef uint64_t[:] ts_inits = _numeric_column(table, "ts_init", np.uint64)
+
+    cdef list ticks = []
+    cdef int i
+    for i in range(table.num_rows):
+        ticks.append(
+            TradeTick.from_raw_c(
+                instrument_ids[instrument_idx[i]],
+                prices[i],
+                price_precisions[i],
+                sizes[i],
+                size_precisions[i],
+                aggressor_sides[aggressor_side_idx[i]],
+                TradeId(trade_ids[i]),
+                ts_events[i],
+                ts_inits[i],
+            )
+        )
+
+    return ticks
+
+
+cpdef list bars_from_arrow(table: pa.Table):
+    """
+    Return bars built from the columns of the given table.
+
+    Parameters
+    ----------
+    table : pa.Table
+        The table in the `Bar` fixed-point schema.
+
+    Returns
+    -------
+    list[Bar]
+
+    """
+    if table.num_rows == 0:
+        return []
+
+    cdef list bar_types
+    cdef int64_t[:] bar_type_idx
+    bar_types, bar_type_idx = _dictionary_column(table, "bar_type", BarType.from_str)
+
+    cdef int64_t[:] opens = _numeric_column(table, "open", np.int64)
+    cdef int64_t[:] highs = _numeric_column(table, "high", np.int64)
+    cdef int64_t[:] lows = _numeric_column(table, "low", np.int64)
+    cdef int64_t[:] closes = _numeric_column(table, "close", np.int64)
+    cdef uint64_t[:] volumes = _numeric_column(table, "volume", np.uint64)
+    cdef uint8_t[:] price_precisions = _numeric_column(table, "price_precision", np.uint8)
+    cdef uint8_t[:] size_precisions = _numeric_column(table, "size_precision", np.uint8)
+    cdef uint64_t[:] ts_events = _numeric_column(table, "ts_event", np.uint64)
+    cdef uint64_t[:] ts_inits = _numeric_column(table, "ts_init", np.uint64)
+
+    cdef list bars = []
+    cdef int i
+    cdef uint8_t price_precision
+    for i in range(table.num_rows):
+        price_precision = price_precisions[i]
+        bars.append(
+            Bar(
+                bar_types[bar_type_idx[i]],
+                Price.from_raw_c(opens[i], price_precision),
+                Price.from_raw_c(highs[i], price_precision),
+                Price.from_raw_c(lows[i], price_precision),
+                Price.from_raw_c(closes[i], price_precision),
+                Quantity.from_raw_c(volumes[i], size_precisions[i]),
+                ts_events[i],
+                ts_inits[i],
+            )
+        )
+
+    return bars
@@ -20,3 +20,4 @@ from nautilus_trader.serialization.arrow.implementations import instruments  # n
 from nautilus_trader.serialization.arrow.implementations import order_book  # noqa: F401
 from nautilus_trader.serialization.arrow.implementations import order_events  # noqa: F401
 from nautilus_trader.serialization.arrow.implementations import position_events  # noqa: F401
+from nautilus_trader.serialization.arrow.implementations import ticks  # noqa: F401
@@ -13,26 +13,62 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from typing import Dict
+from typing import Dict, List
+
+import pyarrow as pa
 
 from nautilus_trader.model.data.bar import Bar
+from nautilus_trader.model.data.bar import BarType
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.serialization.arrow.columnar import bars_from_arrow
 from nautilus_trader.serialization.arrow.serializer import register_parquet
 
 
 def serialize(bar: Bar):
-    data = bar.to_dict(bar)
-    data["instrument_id"] = bar.type.instrument_id.value
-    return data
+    return {
+        "bar_type": str(bar.type),
+        "instrument_id": bar.type.instrument_id.value,
+        "open": bar.open.raw,
+        "high": bar.high.raw,
+        "low": bar.low.raw,
+        "close": bar.close.raw,
+        "volume": bar.volume.raw,
+        "price_precision": bar.open.precision,
+        "size_precision": bar.volume.precision,
+        "ts_event": bar.ts_event,
+        "ts_init": bar.ts_init,
+    }
 
 
 def deserialize(data: Dict) -> Bar:
-    ignore = ("instrument_id",)
-    bar = Bar.from_dict({k: v for k, v in data.items() if k not in ignore})
-    return bar
+    if isinstance(data["open"], str):
+        # Catalog written with the legacy decimal string schema
+        ignore = ("instrument_id",)
+        return Bar.from_dict({k: v for k, v in data.items() if k not in ignore})
+    price_precision = data["price_precision"]
+    return Bar(
+        bar_type=BarType.from_str(data["bar_type"]),
+        open=Price.from_raw(data["open"], price_precision),
+        high=Price.from_raw(data["high"], price_precision),
+        low=Price.from_raw(data["low"], price_precision),
+        close=Price.from_raw(data["close"], price_precision),
+        volume=Quantity.from_raw(data["volume"], data["size_precision"]),
+        ts_event=data["ts_event"],
+        ts_init=data["ts_init"],
+    )
+
+
+def deserialize_table(table: pa.Table) -> List[Bar]:
+    if pa.types.is_string(table.schema.field("open").type):
+        # Catalog written with the legacy decimal string schema
+        return [deserialize(d) for d in table.to_pylist()]
+    return bars_from_arrow(table)
 
 
 register_parquet(
     Bar,
     serializer=serialize,
     deserializer=deserialize,
+    table_deserializer=deserialize_table,
 )
@@ -17,9 +17,13 @@ import itertools
 from itertools import repeat
 from typing import Dict, List
 
+import pyarrow as pa
+
 from nautilus_trader.model.enums import BookAction
+from nautilus_trader.model.enums import BookActionParser
 from nautilus_trader.model.enums import BookTypeParser
 from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import OrderSideParser
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.orderbook.data import Order
 from nautilus_trader.model.orderbook.data import OrderBookData
@@ -131,11 +135,83 @@ def deserialize(data: List[Dict]):
     return sorted(results, key=lambda x: x.ts_event)
 
 
+def deserialize_table(table: pa.Table) -> List[OrderBookData]:
+    if table.num_rows == 0:
+        return []
+
+    # Read each column once rather than building a dict per row
+    instrument_ids = table.column("instrument_id").to_pylist()
+    ts_events = table.column("ts_event").to_pylist()
+    ts_inits = table.column("ts_init").to_pylist()
+    actions = table.column("action").to_pylist()
+    sides = table.column("order_side").to_pylist()
+    prices = table.column("order_price").to_pylist()
+    sizes = table.column("order_size").to_pylist()
+    order_ids = table.column("order_id").to_pylist()
+    book_types = table.column("book_type").to_pylist()
+    types = table.column("_type").to_pylist()
+    assert not set(sides).difference((None, "BUY", "SELL")), "Wrong sides"
+
+    def _key(i: int):
+        return instrument_ids[i], ts_events[i]
+
+    results = []
+    for (instrument_id, ts_event), rows in itertools.groupby(
+        sorted(range(table.num_rows), key=_key),
+        key=_key,
+    ):
+        rows = list(rows)  # type: ignore
+        first = rows[0]
+        if types[first] == "OrderBookSnapshot":
+            # First row is a CLEAR message, which we ignore
+            assert len(rows) >= 2, f"Not enough values passed! {rows}"  # type: ignore
+            results.append(
+                OrderBookSnapshot(
+                    instrument_id=InstrumentId.from_str(instrument_id),
+                    book_type=BookTypeParser.from_str_py(book_types[rows[1]]),
+                    bids=[(prices[i], sizes[i]) for i in rows[1:] if sides[i] == "BUY"],
+                    asks=[(prices[i], sizes[i]) for i in rows[1:] if sides[i] == "SELL"],
+                    ts_event=ts_event,
+                    ts_init=ts_inits[rows[1]],
+                )
+            )
+        else:
+            book_type = BookTypeParser.from_str_py(book_types[first])
+            results.append(
+                OrderBookDeltas(
+                    instrument_id=InstrumentId.from_str(instrument_id),
+                    book_type=book_type,
+                    deltas=[
+                        OrderBookDelta(
+                            instrument_id=InstrumentId.from_str(instrument_id),
+                            book_type=book_type,
+                            action=BookActionParser.from_str_py(actions[i]),
+                            order=Order(
+                                price=prices[i],
+                                size=sizes[i],
+                                side=OrderSideParser.from_str_py(sides[i]),
+                                id=order_ids[i],
+                            )
+                            if actions[i] != "CLEAR"
+                            else None,
+                            ts_event=ts_events[i],
+                            ts_init=ts_inits[i],
+                        )
+                        for i in rows
+                    ],
+                    ts_event=ts_event,
+                    ts_init=ts_inits[first],
+                )
+            )
+    return sorted(results, key=lambda x: x.ts_event)
+
+
 for cls in [OrderBookData] + OrderBookData.__subclasses__():
     register_parquet(
         cls=cls,
         serializer=serialize,
         deserializer=deserialize,
+        table_deserializer=deserialize_table,
         table=OrderBookData,
         chunk=True,
     )
@@ -0,0 +1,117 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from typing import Dict, List
+
+import pyarrow as pa
+
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.enums import AggressorSideParser
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.serialization.arrow.columnar import quote_ticks_from_arrow
+from nautilus_trader.serialization.arrow.columnar import trade_ticks_from_arrow
+from nautilus_trader.serialization.arrow.serializer import register_parquet
+
+
+def serialize_quote_tick(tick: QuoteTick) -> Dict:
+    return {
+        "instrument_id": tick.instrument_id.value,
+        "bid": tick.bid.raw,
+        "bid_size": tick.bid_size.raw,
+        "ask": tick.ask.raw,
+        "ask_size": tick.ask_size.raw,
+        "price_precision": tick.bid.precision,
+        "size_precision": tick.bid_size.precision,
+        "ts_event": tick.ts_event,
+        "ts_init": tick.ts_init,
+    }
+
+
+def deserialize_quote_tick(data: Dict) -> QuoteTick:
+    if isinstance(data["bid"], str):
+        # Catalog written with the legacy decimal string schema
+        return QuoteTick.from_dict(data)
+    return QuoteTick.from_raw(
+        InstrumentId.from_str(data["instrument_id"]),
+        data["bid"],
+        data["ask"],
+        data["price_precision"],
+        data["bid_size"],
+        data["ask_size"],
+        data["size_precision"],
+        data["ts_event"],
+        data["ts_init"],
+    )
+
+
+def serialize_trade_tick(tick: TradeTick) -> Dict:
+    return {
+        "instrument_id": tick.instrument_id.value,
+        "price": tick.price.raw,
+        "size": tick.size.raw,
+        "price_precision": tick.price.precision,
+        "size_precision": tick.size.precision,
+        "aggressor_side": AggressorSideParser.to_str_py(tick.aggressor_side),
+        "trade_id": tick.trade_id.value,
+        "ts_event": tick.ts_event,
+        "ts_init": tick.ts_init,
+    }
+
+
+def deserialize_trade_tick(data: Dict) -> TradeTick:
+    if isinstance(data["price"], str):
+        # Catalog written with the legacy decimal string schema
+        return TradeTick.from_dict(data)
+    return TradeTick.from_raw(
+        InstrumentId.from_str(data["instrument_id"]),
+        data["price"],
+        data["price_precision"],
+        data["size"],
+        data["size_precision"],
+        AggressorSideParser.from_str_py(data["aggressor_side"]),
+        TradeId(data["trade_id"]),
+        data["ts_event"],
+        data["ts_init"],
+    )
+
+
+def deserialize_quote_tick_table(table: pa.Table) -> List[QuoteTick]:
+    if pa.types.is_string(table.schema.field("bid").type):
+        # Catalog written with the legacy decimal string schema
+        return [deserialize_quote_tick(d) for d in table.to_pylist()]
+    return quote_ticks_from_arrow(table)
+
+
+def deserialize_trade_tick_table(table: pa.Table) -> List[TradeTick]:
+    if pa.types.is_string(table.schema.field("price").type):
+        # Catalog written with the legacy decimal string schema
+        return [deserialize_trade_tick(d) for d in table.to_pylist()]
+    return trade_ticks_from_arrow(table)
+
+
+register_parquet(
+    QuoteTick,
+    serializer=serialize_quote_tick,
+    deserializer=deserialize_quote_tick,
+    table_deserializer=deserialize_quote_tick_table,
+)
+register_parquet(
+    TradeTick,
+    serializer=serialize_trade_tick,
+    deserializer=deserialize_trade_tick,
+    table_deserializer=deserialize_trade_tick_table,
+)
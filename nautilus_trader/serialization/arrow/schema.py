@@ -52,6 +52,7 @@ from nautilus_trader.model.instruments.currency_pair import CurrencyPair
 from nautilus_trader.model.instruments.equity import Equity
 from nautilus_trader.model.instruments.future import Future
 from nautilus_trader.model.instruments.option import Option
+from nautilus_trader.model.objects import RAW_PRECISION
 from nautilus_trader.model.orderbook.data import OrderBookData
 from nautilus_trader.serialization.arrow.serializer import register_parquet
 
@@ -85,39 +86,46 @@ NAUTILUS_PARQUET_SCHEMA = {
     QuoteTick: pa.schema(
         {
             "instrument_id": pa.dictionary(pa.int64(), pa.string()),
-            "bid": pa.string(),
-            "bid_size": pa.string(),
-            "ask": pa.string(),
-            "ask_size": pa.string(),
+            "bid": pa.int64(),
+            "bid_size": pa.uint64(),
+            "ask": pa.int64(),
+            "ask_size": pa.uint64(),
+            "price_precision": pa.uint8(),
+            "size_precision": pa.uint8(),
             "ts_event": pa.uint64(),
             "ts_init": pa.uint64(),
         },
-        metadata={"type": "QuoteTick"},
+        metadata={"type": "QuoteTick", "fixed_precision": str(RAW_PRECISION)},
     ),
     TradeTick: pa.schema(
         {
             "instrument_id": pa.dictionary(pa.int64(), pa.string()),
-            "price": pa.string(),
-            "size": pa.string(),
+            "price": pa.int64(),
+            "size": pa.uint64(),
+            "price_precision": pa.uint8(),
+            "size_precision": pa.uint8(),
             "aggressor_side": pa.dictionary(pa.int8(), pa.string()),
             "trade_id": pa.string(),
             "ts_event": pa.uint64(),
             "ts_init": pa.uint64(),
         },
-        metadata={"type": "TradeTick"},
+        metadata={"type": "TradeTick", "fixed_precision": str(RAW_PRECISION)},
     ),
     Bar: pa.schema(
         {
             "bar_type": pa.dictionary(pa.int8(), pa.string()),
             "instrument_id": pa.dictionary(pa.int64(), pa.string()),
-            "open": pa.string(),
-            "high": pa.string(),
-            "low": pa.string(),
-            "close": pa.string(),
-            "volume": pa.string(),
+            "open": pa.int64(),
+            "high": pa.int64(),
+            "low": pa.int64(),
+            "close": pa.int64(),
+            "volume": pa.uint64(),
+            "price_precision": pa.uint8(),
+            "size_precision": pa.uint8(),
             "ts_event": pa.uint64(),
             "ts_init": pa.uint64(),
-        }
+        },
+        metadata={"type": "Bar", "fixed_precision": str(RAW_PRECISION)},
     ),
     VenueStatusUpdate: pa.schema(
         {
@@ -25,6 +25,7 @@ from nautilus_trader.serialization.base cimport _OBJECT_TO_DICT_MAP
 
 cdef dict _PARQUET_TO_DICT_MAP = {}    # type: dict[type, object]
 cdef dict _PARQUET_FROM_DICT_MAP = {}  # type: dict[type, object]
+cdef dict _PARQUET_FROM_TABLE_MAP = {}  # type: dict[type, object]
 cdef dict _PARTITION_KEYS = {}
 cdef dict _SCHEMAS = {}
 cdef dict _CLS_TO_TABLE = {}  # type: dict[type, type]
@@ -64,6 +65,7 @@ def register_parquet(
     schema: Optional[pa.Schema] = None,
     bint chunk=False,
     type table=None,
+    table_deserializer: Optional[Callable] = None,
     **kwargs,
 ):
     """
@@ -90,10 +92,14 @@ def register_parquet(
         transformed and stored in a table other than
         its own. (for example, `OrderBookSnapshots` are stored as
         `OrderBookDeltas`, so we use `table=OrderBookDeltas`).
+    table_deserializer : Callable, optional
+        The callable to deserialize a whole `pyarrow.Table` into a list of
+        `cls_type` directly from its columns (avoids building a dict per row).
 
     """
     Condition.type_or_none(serializer, Callable, "serializer")
     Condition.type_or_none(deserializer, Callable, "deserializer")
+    Condition.type_or_none(table_deserializer, Callable, "table_deserializer")
     Condition.type_or_none(schema, pa.Schema, "schema")
     Condition.type_or_none(table, type, "table")
 
@@ -112,6 +118,8 @@ def register_parquet(
         _PARQUET_TO_DICT_MAP[cls] = serializer
     if deserializer is not None:
         _PARQUET_FROM_DICT_MAP[cls] = deserializer
+    if table_deserializer is not None:
+        _PARQUET_FROM_TABLE_MAP[cls] = table_deserializer
     if schema is not None:
         _SCHEMAS[table or cls] = schema
     if chunk:
@@ -194,3 +202,34 @@ cdef class ParquetSerializer:
             return delegate(chunk)
         else:
             return [delegate(c) for c in chunk]
+
+    @staticmethod
+    def deserialize_table(type cls, table: pa.Table):
+        """
+        Deserialize the given `pyarrow.Table` to a list of objects.
+
+        Uses the columnar deserializer registered for `cls` (if found), otherwise
+        falls back to deserializing the table rows as dicts.
+
+        Parameters
+        ----------
+        cls : type
+            The type to deserialize to.
+        table : pa.Table
+            The table to deserialize.
+
+        Returns
+        -------
+        list[object]
+
+        Raises
+        ------
+        TypeError
+            If `table` cannot be deserialized.
+
+        """
+        delegate = _PARQUET_FROM_TABLE_MAP.get(cls)
+        if delegate is not None:
+            return delegate(table)
+
+        return ParquetSerializer.deserialize(cls=cls, chunk=table.to_pylist())
@@ -19,12 +19,19 @@ from typing import Any, Dict, List, Optional
 import pandas as pd
 
 from nautilus_trader.core.inspect import is_nautilus_class
+from nautilus_trader.model.objects import RAW_PRECISION
 
 
 INVALID_WINDOWS_CHARS = r'<>:"/\|?* '
 
 GENERIC_DATA_PREFIX = "genericdata_"
 
+# The fixed-point price and size columns of tick and bar tables, by precision column
+FIXED_PRECISION_COLUMNS = {
+    "price_precision": ("bid", "ask", "price", "open", "high", "low", "close"),
+    "size_precision": ("bid_size", "ask_size", "size", "volume"),
+}
+
 
 def list_dicts_to_dict_lists(dicts: List[Dict], keys=None) -> Dict[Any, List]:
     """
@@ -133,3 +140,35 @@ def class_to_filename(cls: type) -> str:
     if not is_nautilus_class(cls):
         name = f"{GENERIC_DATA_PREFIX}{camel_to_snake_case(cls.__name__)}"
     return name
+
+
+def fixed_columns_to_str(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the fixed-point price and size columns of `df` to decimal strings.
+
+    Tick and bar prices and sizes are stored as raw fixed-point integers along
+    with their precisions, this restores the decimal string columns (and drops
+    the precision columns) of the original string schema.
+    """
+    precision_cols = [col for col in FIXED_PRECISION_COLUMNS if col in df.columns]
+    for precision_col in precision_cols:
+        for col in FIXED_PRECISION_COLUMNS[precision_col]:
+            if col in df.columns and pd.api.types.is_integer_dtype(df[col]):
+                df[col] = _raw_to_decimal_str(raw=df[col], precision=df[precision_col])
+    return df.drop(columns=precision_cols)
+
+
+def _raw_to_decimal_str(raw: pd.Series, precision: pd.Series) -> pd.Series:
+    # Format each precision (usually one per instrument) with integer arithmetic
+    result = pd.Series(index=raw.index, dtype=object)
+    for value in precision.unique():
+        mask = precision == value
+        p = int(value)
+        units = raw[mask].astype("int64") // 10 ** (RAW_PRECISION - p)
+        sign = units.lt(0).map({True: "-", False: ""})
+        units = units.abs()
+        strings = sign + (units // 10**p).astype(str)
+        if p > 0:
+            strings += "." + (units % 10**p).astype(str).str.zfill(p)
+        result[mask] = strings
+    return result
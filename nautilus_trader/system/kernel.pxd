@@ -58,6 +58,8 @@ cdef class NautilusKernel:
     """The kernels message bus.\n\n:returns: `MessageBus`"""
     cdef readonly CacheFacade cache
     """The kernels read-only cache instance.\n\n:returns: `CacheFacade`"""
+    cdef readonly object cache_db
+    """The kernels cache database.\n\n:returns: `CacheDatabase` or ``None``"""
     cdef readonly PortfolioFacade portfolio
     """The kernels read-only portfolio instance.\n\n:returns: `PortfolioFacade`"""
     cdef readonly DataEngine data_engine
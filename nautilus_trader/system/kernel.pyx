@@ -243,6 +243,7 @@ cdef class NautilusKernel:
             logger=self.logger,
         )
 
+        self.cache_db = cache_db
         self.cache = Cache(
             database=cache_db,
             logger=self.logger,
@@ -391,6 +392,7 @@ cdef class NautilusKernel:
             fs_protocol=config.fs_protocol,
             flush_interval_ms=config.flush_interval_ms,
             include_types=config.include_types,
+            batch_size=config.batch_size,
             logger=self.log
         )
         self.trader.subscribe("*", self.writer.write)
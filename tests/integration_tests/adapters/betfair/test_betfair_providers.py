@@ -122,6 +122,34 @@ class TestBetfairInstrumentProvider:
         instrument = self.provider.get_betting_instrument(**kw)
         assert instrument is None
 
+    def test_get_betting_instrument_uses_index_for_added_instruments(self):
+        # Arrange
+        update = BetfairStreaming.market_definition_runner_removed()
+        market_def = update["mc"][0]["marketDefinition"]
+        market_def["marketId"] = update["mc"][0]["id"]
+        instruments = make_instruments(market_definition=market_def, currency="GBP")
+        kw = dict(
+            market_id=instruments[0].market_id,
+            selection_id=instruments[0].selection_id,
+            handicap=instruments[0].selection_handicap,
+        )
+
+        # Act
+        missing = self.provider.get_betting_instrument(**kw)
+        self.provider.add_bulk(instruments)
+        result = [
+            self.provider.get_betting_instrument(
+                market_id=ins.market_id,
+                selection_id=ins.selection_id,
+                handicap=ins.selection_handicap,
+            )
+            for ins in instruments
+        ]
+
+        # Assert
+        assert missing is None
+        assert result == instruments
+
     def test_market_update_runner_removed(self):
         update = BetfairStreaming.market_definition_runner_removed()
 
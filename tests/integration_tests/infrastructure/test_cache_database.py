@@ -177,6 +177,105 @@ class TestRedisCacheDatabase:
         # Assert
         assert self.database.load_order(order.client_order_id) == order
 
+    def test_add_order_with_write_behind_then_flush_writes(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            config=CacheDatabaseConfig(type="redis", write_behind=True),
+        )
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        # Act
+        database.add_order(order)
+        database.flush_writes()
+
+        # Assert
+        assert database.pending_writes == 0
+        assert self.test_redis.llen(f"Trader-{self.trader_id}:Orders:{order.client_order_id}") == 1
+        assert database.load_order(order.client_order_id) == order
+        database.close()
+
+    def test_close_with_write_behind_writes_pending_operations(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            config=CacheDatabaseConfig(type="redis", write_behind=True),
+        )
+
+        # Act
+        database.add_instrument(AUDUSD_SIM)
+        database.close()
+
+        # Assert
+        assert self.database.load_instrument(AUDUSD_SIM.id) == AUDUSD_SIM
+
+    def test_flush_writes_with_failed_write_behind_batch_does_not_block(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            config=CacheDatabaseConfig(type="redis", write_behind=True),
+        )
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+        key = f"Trader-{self.trader_id}:Orders:{order.client_order_id}"
+        self.test_redis.set(key, "not-a-list")  # RPUSH fails with WRONGTYPE
+
+        # Act
+        database.add_order(order)
+        database.flush_writes()
+        database.add_instrument(AUDUSD_SIM)
+        database.close()
+
+        # Assert
+        assert database.pending_writes == 0
+        assert self.test_redis.get(key) == b"not-a-list"
+        assert self.database.load_instrument(AUDUSD_SIM.id) == AUDUSD_SIM
+
+    def test_write_behind_batch_failing_after_exec_is_not_replayed(self, monkeypatch):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            config=CacheDatabaseConfig(type="redis", write_behind=True),
+        )
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+        execute = redis.client.Pipeline.execute
+
+        def execute_then_drop_connection(pipe, *args, **kwargs):
+            execute(pipe, *args, **kwargs)  # The server applies the batch
+            raise redis.ConnectionError("connection lost after EXEC")
+
+        monkeypatch.setattr(redis.client.Pipeline, "execute", execute_then_drop_connection)
+
+        # Act
+        database.add_order(order)
+        database.flush_writes()
+        monkeypatch.undo()
+        database.close()
+
+        # Assert
+        assert database.pending_writes == 0
+        assert self.test_redis.llen(f"Trader-{self.trader_id}:Orders:{order.client_order_id}") == 1
+        assert self.database.load_order(order.client_order_id) == order
+
     def test_add_position(self):
         # Arrange
         order = self.strategy.order_factory.market(
@@ -660,6 +759,25 @@ class TestRedisCacheDatabase:
         # Assert
         assert result == {order.client_order_id: order}
 
+    def test_load_orders_cache_when_orders_span_multiple_batches(self):
+        # Arrange
+        orders = [
+            self.strategy.order_factory.market(
+                AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100000),
+            )
+            for _ in range(2500)
+        ]
+        for order in orders:
+            self.database.add_order(order)
+
+        # Act
+        result = self.database.load_orders()
+
+        # Assert
+        assert result == {order.client_order_id: order for order in orders}
+
     def test_load_positions_cache_when_no_positions(self):
         # Arrange, Act
         self.database.load_positions()
@@ -0,0 +1,147 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import random
+from decimal import Decimal
+
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.backtest.exchange import SimulatedExchange
+from nautilus_trader.backtest.execution_client import BacktestExecClient
+from nautilus_trader.backtest.models import FillModel
+from nautilus_trader.backtest.models import LatencyModel
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.execution.engine import ExecutionEngine
+from nautilus_trader.execution.messages import CancelOrder
+from nautilus_trader.execution.messages import ModifyOrder
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OMSType
+from nautilus_trader.model.identifiers import ClientOrderId
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.msgbus.bus import MessageBus
+from tests.test_kit.stubs.component import TestComponentStubs
+from tests.test_kit.stubs.identifiers import TestIdStubs
+
+
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+
+
+def setup_exchange():
+    clock = TestClock()
+    logger = Logger(clock=clock, bypass=True)
+    msgbus = MessageBus(
+        trader_id=TestIdStubs.trader_id(),
+        clock=clock,
+        logger=logger,
+    )
+    cache = TestComponentStubs.cache()
+    cache.add_instrument(USDJPY_SIM)
+
+    exec_engine = ExecutionEngine(
+        msgbus=msgbus,
+        cache=cache,
+        clock=clock,
+        logger=logger,
+    )
+
+    exchange = SimulatedExchange(
+        venue=Venue("SIM"),
+        oms_type=OMSType.HEDGING,
+        account_type=AccountType.MARGIN,
+        base_currency=USD,
+        starting_balances=[Money(1_000_000, USD)],
+        default_leverage=Decimal(50),
+        leverages={},
+        is_frozen_account=False,
+        instruments=[USDJPY_SIM],
+        modules=[],
+        fill_model=FillModel(),
+        cache=cache,
+        clock=clock,
+        logger=logger,
+        latency_model=LatencyModel(
+            base_latency_nanos=1_000_000,
+            update_latency_nanos=500_000,
+            cancel_latency_nanos=250_000,
+        ),
+    )
+
+    exec_client = BacktestExecClient(
+        exchange=exchange,
+        msgbus=msgbus,
+        cache=cache,
+        clock=clock,
+        logger=logger,
+    )
+
+    exec_engine.register_client(exec_client)
+    exchange.register_client(exec_client)
+    exchange.reset()
+    exec_engine.start()
+
+    return exchange
+
+
+def inflight_commands(count: int):
+    rng = random.Random(0)
+    commands = []
+    for i in range(count):
+        client_order_id = ClientOrderId(f"O-{i % 1000}")
+        ts_init = rng.randint(0, 1_000_000_000)
+        if i % 2 == 0:
+            command = ModifyOrder(
+                trader_id=TestIdStubs.trader_id(),
+                strategy_id=TestIdStubs.strategy_id(),
+                instrument_id=USDJPY_SIM.id,
+                client_order_id=client_order_id,
+                venue_order_id=None,
+                quantity=Quantity.from_int(100_000),
+                price=None,
+                trigger_price=None,
+                command_id=UUID4(),
+                ts_init=ts_init,
+            )
+        else:
+            command = CancelOrder(
+                trader_id=TestIdStubs.trader_id(),
+                strategy_id=TestIdStubs.strategy_id(),
+                instrument_id=USDJPY_SIM.id,
+                client_order_id=client_order_id,
+                venue_order_id=None,
+                command_id=UUID4(),
+                ts_init=ts_init,
+            )
+        commands.append(command)
+    return commands
+
+
+def test_process_inflight_modify_and_cancel_commands(benchmark):
+    commands = inflight_commands(100_000)
+
+    def setup():
+        return (setup_exchange(), commands), {}
+
+    def run(exchange, commands):
+        for command in commands:
+            exchange.send(command)
+        # Drain the inflight queue in stages as time advances
+        for now_ns in range(100_000_000, 1_200_000_000, 100_000_000):
+            exchange.process(now_ns)
+
+    benchmark.pedantic(run, setup=setup, rounds=5, iterations=1, warmup_rounds=1)
@@ -13,12 +13,17 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+import pandas as pd
+
 from nautilus_trader.backtest.data.providers import TestDataProvider
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.backtest.data.wranglers import BarDataWrangler
 from nautilus_trader.backtest.data.wranglers import QuoteTickDataWrangler
 from nautilus_trader.backtest.data.wranglers import TradeTickDataWrangler
 from tests.test_kit.performance import PerformanceBench
 from tests.test_kit.performance import PerformanceHarness
+from tests.test_kit.stubs.data import TestDataStubs
 
 
 class TestDataWranglersPerformance(PerformanceHarness):
@@ -57,3 +62,26 @@ class TestDataWranglersPerformance(PerformanceHarness):
             iterations=1,
         )
         # ~500.2ms / ~500210.6μs / 500210608ns minimum of 10 runs @ 1 iteration each run.
+
+    def test_bar_data_wrangler_process_10m_rows(self):
+        gbpusd = TestInstrumentProvider.default_fx_ccy("GBP/USD")
+        wrangler = BarDataWrangler(
+            bar_type=TestDataStubs.bartype_gbpusd_1min_bid(),
+            instrument=gbpusd,
+        )
+
+        rows = 10_000_000
+        prices = np.full(rows, 1.57597)
+        data = pd.DataFrame(
+            {"open": prices, "high": prices, "low": prices, "close": prices},
+            index=pd.date_range("2012-01-01", periods=rows, freq="1min", tz="UTC"),
+        )
+
+        def wrangler_process():
+            wrangler.process(data=data, default_volume=1000000)
+
+        PerformanceBench.profile_function(
+            target=wrangler_process,
+            runs=1,
+            iterations=1,
+        )
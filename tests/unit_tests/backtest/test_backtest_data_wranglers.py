@@ -246,6 +246,20 @@ class TestBarDataWrangler:
         assert bars[0].ts_event == 1328054400000000000
         assert bars[0].ts_init == 1328054400001000500  # <-- delta diff
 
+    def test_process_with_nanosecond_index(self):
+        # Arrange
+        provider = TestDataProvider()
+        data = provider.read_csv_bars("fxcm-gbpusd-m1-bid-2012.csv")[:1000]
+        expected = self.wrangler.process(data.copy())
+        data.index = data.index.view("int64")
+
+        # Act
+        bars = self.wrangler.process(data)
+
+        # Assert
+        assert bars == expected
+        assert bars[0].ts_event == 1328054400000000000
+
 
 class TestBarDataWranglerHeaderless:
     def setup(self):
@@ -17,6 +17,7 @@ import tempfile
 from decimal import Decimal
 
 import pandas as pd
+import pytest
 
 from nautilus_trader.backtest.data.providers import TestDataProvider
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
@@ -59,7 +60,6 @@ from tests.test_kit.stubs.component import TestComponentStubs
 from tests.test_kit.stubs.config import TestConfigStubs
 from tests.test_kit.stubs.data import TestDataStubs
 
-
 ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
 AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
 GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
@@ -129,6 +129,45 @@ class TestBacktestEngine:
         # Assert
         assert self.engine.iteration == 8000
 
+    def test_run_with_data_iterator(self):
+        # Arrange
+        data = self.engine.data
+        self.engine.clear_data()
+        self.engine.add_data_iterator(iter(data[:4000]))
+        self.engine.add_data_iterator(iter(data[4000:]))
+
+        # Act
+        self.engine.run()
+
+        # Assert
+        assert self.engine.iteration == 8000
+        assert self.engine.data == []
+
+    def test_add_data_iterator_with_unknown_instrument_raises_on_run(self):
+        # Arrange
+        self.engine.clear_data()
+        tick = TestDataStubs.quote_tick_3decimal(instrument_id=GBPUSD_SIM.id)
+        self.engine.add_data_iterator(iter([tick]))
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.run()
+
+    def test_add_data_iterator_with_generic_data_registers_client(self):
+        # Arrange
+        self.engine.clear_data()
+        data = [
+            GenericData(DataType(MyData), MyData("a", ts_init=ts_init)) for ts_init in (1, 2, 3)
+        ]
+
+        # Act
+        self.engine.add_data_iterator(iter(data), client_id=ClientId("News"))
+        self.engine.run()
+
+        # Assert
+        assert ClientId("News") in self.engine.kernel.data_engine.registered_clients
+        assert self.engine.iteration == 3
+
     def test_run(self):
         # Arrange, Act
         self.engine.add_strategy(Strategy())
@@ -210,6 +249,38 @@ class TestBacktestEngineData:
         # Assert
         assert len(engine.data) == 5
 
+    def test_add_data_merges_streams_in_timestamp_order(self):
+        # Arrange
+        engine = BacktestEngine()
+
+        data_type = DataType(MyData, metadata={"news_wire": "hacks"})
+
+        generic_data1 = [
+            GenericData(data_type, MyData("AAPL hacked", 0, 0)),
+            GenericData(data_type, MyData("AMZN hacked", 2000, 2000)),
+            GenericData(data_type, MyData("NFLX hacked", 4000, 4000)),
+        ]
+
+        generic_data2 = [
+            GenericData(data_type, MyData("FB hacked", 1000, 1000)),
+            GenericData(data_type, MyData("MSFT hacked", 2000, 2000)),
+            GenericData(data_type, MyData("TSLA hacked", 3000, 3000)),
+        ]
+
+        # Act
+        engine.add_data(generic_data1, ClientId("NEWS_CLIENT"))
+        engine.add_data(generic_data2, ClientId("NEWS_CLIENT"))
+
+        # Assert
+        assert engine.data == [
+            generic_data1[0],
+            generic_data2[0],
+            generic_data1[1],  # <-- equal timestamps retain order added
+            generic_data2[1],
+            generic_data2[2],
+            generic_data1[2],
+        ]
+
     def test_add_instrument_adds_to_engine(self, capsys):
         # Arrange
         engine = BacktestEngine()
@@ -1913,6 +1913,28 @@ class TestSimulatedExchange:
         assert entry.status == OrderStatus.ACCEPTED
         assert entry.quantity == 100000
 
+    def test_latency_model_processes_commands_with_equal_timestamps_in_order_sent(self):
+        # Arrange
+        self.exchange.set_latency_model(LatencyModel(secs_to_nanos(1)))
+        entry = self.strategy.order_factory.limit(
+            instrument_id=USDJPY_SIM.id,
+            order_side=OrderSide.BUY,
+            price=Price.from_int(100),
+            quantity=Quantity.from_int(200000),
+        )
+
+        # Act
+        self.strategy.submit_order(entry)
+        self.exchange.process(secs_to_nanos(1))
+        self.strategy.modify_order(entry, quantity=Quantity.from_int(100000))
+        self.strategy.modify_order(entry, quantity=Quantity.from_int(150000))
+        self.strategy.modify_order(entry, quantity=Quantity.from_int(120000))
+        self.exchange.process(secs_to_nanos(2))
+
+        # Assert
+        assert entry.status == OrderStatus.ACCEPTED
+        assert entry.quantity == 120000
+
 
 XBTUSD_BITMEX = TestInstrumentProvider.xbtusd_bitmex()
 
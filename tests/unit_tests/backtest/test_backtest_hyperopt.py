@@ -91,3 +91,59 @@ class TestHyperoptBacktestNode:
                 ),
                 max_evals=2,
             )
+
+    def test_hyperopt_search_with_invalid_n_workers_raises_value_error(self):
+        # Arrange
+        node = HyperoptBacktestNode(base_config=self.base_config)
+        node.set_strategy_config(
+            strategy_path="nautilus_trader.examples.strategies.ema_cross:EMACross",
+            config_path="nautilus_trader.examples.strategies.ema_cross:EMACrossConfig",
+        )
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            node.hyperopt_search(
+                params=dict(fast_ema_period=10, slow_ema_period=20),
+                max_evals=2,
+                n_workers=0,
+            )
+
+    def test_hyperopt_search_with_workers_returns_best_trial(self, tmp_path, monkeypatch):
+        # Arrange
+        catalog_path = str(tmp_path / "catalog")
+        self.catalog.fs.get("/.nautilus/catalog", catalog_path, recursive=True)
+        data_config = self.data_config.replace(
+            catalog_path=catalog_path,
+            catalog_fs_protocol="file",
+        )
+        node = HyperoptBacktestNode(base_config=self.base_config.replace(data=[data_config]))
+        node.set_strategy_config(
+            strategy_path="nautilus_trader.examples.strategies.ema_cross:EMACross",
+            config_path="nautilus_trader.examples.strategies.ema_cross:EMACrossConfig",
+        )
+
+        # Rank trials by their number of orders (objectives are evaluated in this process)
+        def objective_result(self, result, minimum_positions, logger_adapter):
+            return {"status": hyperopt.STATUS_OK, "loss": result.total_orders}
+
+        monkeypatch.setattr(HyperoptBacktestNode, "_objective_result", objective_result)
+
+        # Act
+        result = node.hyperopt_search(
+            params=dict(
+                instrument_id="AUD/USD.SIM",
+                bar_type="AUD/USD.SIM-100-TICK-MID-INTERNAL",
+                fast_ema_period=hyperopt.hp.choice("fast_ema_period", [5, 10]),
+                slow_ema_period=20,
+                trade_size=Decimal(1_000_000),
+                order_id_tag="001",
+            ),
+            max_evals=2,
+            n_workers=2,
+            log_dir=str(tmp_path / "logs"),
+        )
+
+        # Assert
+        assert list(result) == ["fast_ema_period"]
+        assert result["fast_ema_period"] in (0, 1)
+        assert list((tmp_path / "logs").glob("backtest-worker-*.log"))
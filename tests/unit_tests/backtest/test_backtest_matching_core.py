@@ -0,0 +1,266 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from datetime import timedelta
+
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.backtest.matching_core import MatchingCore
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import TimeInForce
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from tests.test_kit.stubs import UNIX_EPOCH
+from tests.test_kit.stubs.identifiers import TestIdStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestMatchingCore:
+    def setup(self):
+        # Fixture Setup
+        self.order_factory = OrderFactory(
+            trader_id=TestIdStubs.trader_id(),
+            strategy_id=TestIdStubs.strategy_id(),
+            clock=TestClock(),
+        )
+
+        self.core = MatchingCore(AUDUSD_SIM.id)
+
+    def limit(self, side: OrderSide, price: str, **kwargs):
+        return self.order_factory.limit(
+            AUDUSD_SIM.id,
+            side,
+            Quantity.from_int(100000),
+            Price.from_str(price),
+            **kwargs,
+        )
+
+    def stop(self, side: OrderSide, trigger_price: str):
+        return self.order_factory.stop_market(
+            AUDUSD_SIM.id,
+            side,
+            Quantity.from_int(100000),
+            Price.from_str(trigger_price),
+        )
+
+    def test_instantiate_core(self):
+        # Arrange, Act, Assert
+        assert self.core.instrument_id == AUDUSD_SIM.id
+        assert len(self.core) == 0
+        assert self.core.get_bid_orders() == []
+        assert self.core.get_ask_orders() == []
+
+    def test_add_orders_returns_orders_in_price_then_time_priority(self):
+        # Arrange
+        bid1 = self.limit(OrderSide.BUY, "0.99000")
+        bid2 = self.limit(OrderSide.BUY, "1.00000")
+        bid3 = self.limit(OrderSide.BUY, "1.00000")
+        ask1 = self.limit(OrderSide.SELL, "1.02000")
+        ask2 = self.limit(OrderSide.SELL, "1.01000")
+
+        # Act
+        for order in (bid1, bid2, bid3, ask1, ask2):
+            self.core.add(order)
+
+        # Assert
+        assert len(self.core) == 5
+        assert self.core.get_bid_orders() == [bid2, bid3, bid1]
+        assert self.core.get_ask_orders() == [ask2, ask1]
+
+    def test_delete_order(self):
+        # Arrange
+        bid1 = self.limit(OrderSide.BUY, "1.00000")
+        bid2 = self.limit(OrderSide.BUY, "1.00000")
+        self.core.add(bid1)
+        self.core.add(bid2)
+
+        # Act
+        result1 = self.core.delete(bid1)
+        result2 = self.core.delete(bid1)
+
+        # Assert
+        assert result1
+        assert not result2
+        assert not self.core.contains(bid1)
+        assert self.core.contains(bid2)
+        assert self.core.get_bid_orders() == [bid2]
+
+    def test_orders_to_match_returns_only_crossed_orders(self):
+        # Arrange
+        buy_limit_crossed = self.limit(OrderSide.BUY, "1.00010")
+        buy_limit_touched = self.limit(OrderSide.BUY, "1.00000")
+        buy_limit_resting = self.limit(OrderSide.BUY, "0.99990")
+        buy_stop_triggered = self.stop(OrderSide.BUY, "0.99990")
+        buy_stop_resting = self.stop(OrderSide.BUY, "1.00010")
+        sell_limit_crossed = self.limit(OrderSide.SELL, "0.99980")
+        sell_limit_resting = self.limit(OrderSide.SELL, "1.00010")
+        sell_stop_triggered = self.stop(OrderSide.SELL, "1.00010")
+        sell_stop_resting = self.stop(OrderSide.SELL, "0.99980")
+
+        for order in (
+            buy_limit_crossed,
+            buy_limit_touched,
+            buy_limit_resting,
+            buy_stop_triggered,
+            buy_stop_resting,
+            sell_limit_crossed,
+            sell_limit_resting,
+            sell_stop_triggered,
+            sell_stop_resting,
+        ):
+            self.core.add(order)
+
+        # Act
+        result = self.core.orders_to_match(
+            Price.from_str("0.99990"),
+            Price.from_str("1.00000"),
+            0,
+        )
+
+        # Assert
+        assert result == [
+            buy_limit_crossed,
+            buy_limit_touched,
+            buy_stop_triggered,
+            sell_limit_crossed,
+            sell_stop_triggered,
+        ]
+
+    def test_orders_to_match_with_no_market_returns_expired_orders(self):
+        # Arrange
+        gtc = self.limit(OrderSide.BUY, "1.00000")
+        gtd = self.limit(
+            OrderSide.SELL,
+            "1.00010",
+            time_in_force=TimeInForce.GTD,
+            expire_time=UNIX_EPOCH + timedelta(minutes=1),
+        )
+        self.core.add(gtc)
+        self.core.add(gtd)
+
+        # Act
+        result1 = self.core.orders_to_match(None, None, 0)
+        result2 = self.core.orders_to_match(None, None, gtd.expire_time_ns)
+
+        # Assert
+        assert result1 == []
+        assert result2 == [gtd]
+
+    def test_is_touched_when_no_orders_returns_false(self):
+        # Arrange
+        low = Price.from_str("0.99000")
+        high = Price.from_str("1.01000")
+
+        # Act, Assert
+        assert not self.core.is_touched(low, high, low, high, 0)
+
+    def test_is_touched_when_orders_outside_range_returns_false(self):
+        # Arrange
+        self.core.add(self.limit(OrderSide.BUY, "0.98990"))
+        self.core.add(self.stop(OrderSide.BUY, "1.01010"))
+        self.core.add(self.limit(OrderSide.SELL, "1.01010"))
+        self.core.add(self.stop(OrderSide.SELL, "0.98990"))
+
+        low = Price.from_str("0.99000")
+        high = Price.from_str("1.01000")
+
+        # Act, Assert
+        assert not self.core.is_touched(low, high, low, high, 0)
+
+    def test_is_touched_when_order_inside_range_returns_true(self):
+        # Arrange
+        self.core.add(self.limit(OrderSide.BUY, "0.98990"))
+        self.core.add(self.stop(OrderSide.SELL, "0.99000"))
+
+        low = Price.from_str("0.99000")
+        high = Price.from_str("1.01000")
+
+        # Act, Assert
+        assert self.core.is_touched(low, high, low, high, 0)
+
+    def test_is_touched_when_order_expired_returns_true(self):
+        # Arrange
+        gtd = self.limit(
+            OrderSide.BUY,
+            "0.98000",
+            time_in_force=TimeInForce.GTD,
+            expire_time=UNIX_EPOCH + timedelta(minutes=1),
+        )
+        self.core.add(gtd)
+
+        low = Price.from_str("0.99000")
+        high = Price.from_str("1.01000")
+
+        # Act, Assert
+        assert not self.core.is_touched(low, high, low, high, 0)
+        assert self.core.is_touched(low, high, low, high, gtd.expire_time_ns)
+
+    def test_orders_to_match_returns_only_due_expiring_orders(self):
+        # Arrange
+        gtds = [
+            self.limit(
+                OrderSide.SELL,
+                "1.00010",
+                time_in_force=TimeInForce.GTD,
+                expire_time=UNIX_EPOCH + timedelta(minutes=minutes),
+            )
+            for minutes in (3, 1, 2)
+        ]
+        for order in gtds:
+            self.core.add(order)
+        self.core.delete(gtds[1])
+
+        # Act
+        result1 = self.core.orders_to_match(None, None, gtds[1].expire_time_ns)
+        result2 = self.core.orders_to_match(None, None, gtds[2].expire_time_ns)
+        result3 = self.core.orders_to_match(None, None, gtds[0].expire_time_ns)
+
+        # Assert
+        assert result1 == []
+        assert result2 == [gtds[2]]
+        assert result3 == [gtds[0], gtds[2]]  # Time priority at the same price
+
+    def test_is_touched_when_expired_order_deleted_returns_false(self):
+        # Arrange
+        gtd = self.limit(
+            OrderSide.BUY,
+            "0.98000",
+            time_in_force=TimeInForce.GTD,
+            expire_time=UNIX_EPOCH + timedelta(minutes=1),
+        )
+        self.core.add(gtd)
+        self.core.delete(gtd)
+
+        low = Price.from_str("0.99000")
+        high = Price.from_str("1.01000")
+
+        # Act, Assert
+        assert not self.core.is_touched(low, high, low, high, gtd.expire_time_ns)
+
+    def test_clear(self):
+        # Arrange
+        self.core.add(self.limit(OrderSide.BUY, "1.00000"))
+        self.core.add(self.stop(OrderSide.SELL, "0.99000"))
+
+        # Act
+        self.core.clear()
+
+        # Assert
+        assert len(self.core) == 0
+        assert self.core.get_bid_orders() == []
+        assert self.core.get_ask_orders() == []
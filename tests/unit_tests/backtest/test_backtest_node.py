@@ -16,6 +16,8 @@
 import json
 from decimal import Decimal
 
+import pytest
+
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.backtest.node import BacktestNode
 from nautilus_trader.config import BacktestDataConfig
@@ -84,6 +86,57 @@ class TestBacktestNode:
         # Assert
         assert len(results) == 1
 
+    def test_run_with_invalid_n_workers_raises_value_error(self):
+        # Arrange
+        node = BacktestNode(configs=self.backtest_configs)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            node.run(n_workers=0)
+
+    def test_run_with_workers_matches_serial_run_in_config_order(self, tmp_path):
+        # Arrange
+        catalog_path = str(tmp_path / "catalog")
+        self.catalog.fs.get("/.nautilus/catalog", catalog_path, recursive=True)
+        configs = [
+            BacktestRunConfig(
+                engine=BacktestEngineConfig(strategies=self.strategies),
+                venues=[self.venue_config],
+                data=[
+                    BacktestDataConfig(
+                        catalog_path=catalog_path,
+                        catalog_fs_protocol="file",
+                        data_cls=QuoteTick,
+                        instrument_id="AUD/USD.SIM",
+                        start_time=1580398089820000000,
+                        end_time=end_time,
+                    )
+                ],
+            )
+            for end_time in (1580504394501000000, 1580450000000000000)
+        ]
+        log_dir = tmp_path / "logs"
+
+        # Act
+        parallel = BacktestNode(configs=configs).run(n_workers=2, log_dir=str(log_dir))
+        serial = BacktestNode(configs=configs).run()
+
+        # Assert
+        def summary(result):
+            return (
+                result.run_config_id,
+                result.iterations,
+                result.total_events,
+                result.total_orders,
+                result.total_positions,
+            )
+
+        assert [summary(r) for r in parallel] == [summary(r) for r in serial]
+        assert parallel[0].iterations > parallel[1].iterations
+        log_files = list(log_dir.glob("backtest-worker-*.log"))
+        assert log_files
+        assert any(f.stat().st_size > 0 for f in log_files)
+
     def test_backtest_run_streaming_sync(self):
         # Arrange
         config = BacktestRunConfig(
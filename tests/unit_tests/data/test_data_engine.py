@@ -1249,6 +1249,42 @@ class TestDataEngine:
         # Assert
         assert handler == [tick]
 
+    def test_process_quote_ticks_after_reset_then_sends_to_registered_handler(self):
+        # Arrange
+        self.data_engine.register_client(self.binance_client)
+
+        handler = []
+        self.msgbus.subscribe(topic="data.quotes.BINANCE.ETHUSDT", handler=handler.append)
+
+        tick1 = QuoteTick(
+            instrument_id=ETHUSDT_BINANCE.id,
+            bid=Price.from_str("100.003"),
+            ask=Price.from_str("100.003"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        tick2 = QuoteTick(
+            instrument_id=ETHUSDT_BINANCE.id,
+            bid=Price.from_str("100.004"),
+            ask=Price.from_str("100.004"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=1,
+            ts_init=1,
+        )
+
+        # Act
+        self.data_engine.process(tick1)
+        self.data_engine.reset()
+        self.data_engine.process(tick1)
+        self.data_engine.process(tick2)
+
+        # Assert
+        assert handler == [tick1, tick1, tick2]
+
     def test_process_quote_tick_when_subscribers_then_sends_to_registered_handlers(
         self,
     ):
@@ -15,6 +15,8 @@
 
 import sys
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
@@ -171,3 +173,61 @@ class TestAverageTrueRange:
         # Assert
         assert not self.atr.initialized
         assert self.atr.value == 0
+
+    def test_update_many_bars_matches_sequential_updates(self):
+        # Arrange
+        rng = np.random.default_rng(42)
+        close = 1.0 + rng.random(1_000) / 100
+        high = close + rng.random(1_000) / 1000
+        low = close - rng.random(1_000) / 1000
+        sequential = AverageTrueRange(10)
+        for i in range(len(close)):
+            sequential.update_raw(high[i], low[i], close[i])
+
+        # Act
+        self.atr.update_many_bars(
+            open=close,
+            high=high,
+            low=low,
+            close=close,
+            volume=np.ones(len(close)),
+            ts_init=np.arange(len(close), dtype=np.uint64),
+        )
+
+        # Assert
+        assert self.atr.initialized
+        assert self.atr.value == sequential.value
+
+    def test_update_many_bars_with_mismatched_lengths_raises_value_error(self):
+        # Arrange
+        close = np.ones(10)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.atr.update_many_bars(
+                open=close,
+                high=close,
+                low=close[:5],
+                close=close,
+                volume=close,
+                ts_init=np.arange(10, dtype=np.uint64),
+            )
+
+    def test_update_many_bars_with_read_only_arrays_and_int64_timestamps(self):
+        # Arrange
+        close = np.linspace(1.0, 1.1, 20)
+        close.setflags(write=False)
+        ts_init = pd.date_range("2020-01-01", periods=20, freq="1min").asi8
+
+        # Act
+        self.atr.update_many_bars(
+            open=close,
+            high=close,
+            low=close,
+            close=close,
+            volume=close,
+            ts_init=ts_init,
+        )
+
+        # Assert
+        assert self.atr.initialized
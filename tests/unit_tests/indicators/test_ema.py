@@ -15,6 +15,8 @@
 
 from decimal import Decimal
 
+import numpy as np
+
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
 from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
 from nautilus_trader.model.enums import PriceType
@@ -136,3 +138,30 @@ class TestExponentialMovingAverage:
         # Assert
         assert not self.ema.initialized
         assert self.ema.value == 0.0
+
+    def test_update_many_matches_sequential_updates(self):
+        # Arrange
+        values = 1.0 + np.random.default_rng(42).random(1_000) / 100
+        sequential = ExponentialMovingAverage(10)
+        for value in values:
+            sequential.update_raw(value)
+
+        # Act
+        self.ema.update_many(values)
+
+        # Assert
+        assert self.ema.initialized
+        assert self.ema.count == sequential.count
+        assert self.ema.value == sequential.value
+
+    def test_update_many_with_read_only_array(self):
+        # Arrange
+        values = np.arange(1.0, 11.0)
+        values.setflags(write=False)
+
+        # Act
+        self.ema.update_many(values)
+
+        # Assert
+        assert self.ema.initialized
+        assert self.ema.count == 10
@@ -0,0 +1,124 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from nautilus_trader.indicators.base.rolling_window import RollingWindow
+
+
+class TestRollingWindow:
+    def test_instantiate_with_invalid_capacity_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            RollingWindow(0)
+
+    def test_empty_window_returns_zero_statistics(self):
+        # Arrange
+        window = RollingWindow(5)
+
+        # Act, Assert
+        assert len(window) == 0
+        assert window.sum == 0
+        assert window.mean() == 0
+        assert window.variance(1.0) == 0
+        assert window.mad(1.0) == 0
+        assert window.to_array().tolist() == []
+
+    def test_min_max_on_empty_window_raises_value_error(self):
+        # Arrange
+        window = RollingWindow(5)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            window.max()
+        with pytest.raises(ValueError):
+            window.min()
+
+    def test_append_evicts_oldest_value_when_full(self):
+        # Arrange
+        window = RollingWindow(3)
+
+        # Act
+        for value in (1.0, 2.0, 3.0, 4.0, 5.0):
+            window.append(value)
+
+        # Assert
+        assert window.count == 3
+        assert window.to_array().tolist() == [3.0, 4.0, 5.0]
+        assert window.last() == 5.0
+        assert window.sum == 12.0
+        assert window.sum_xy == 3.0 + 8.0 + 15.0
+        assert window.mean() == 4.0
+        assert window.max() == 5.0
+        assert window.min() == 3.0
+
+    def test_clear_resets_window(self):
+        # Arrange
+        window = RollingWindow(3)
+        for value in (1.0, 2.0, 3.0, 4.0):
+            window.append(value)
+
+        # Act
+        window.clear()
+        window.append(10.0)
+
+        # Assert
+        assert window.to_array().tolist() == [10.0]
+        assert window.sum == 10.0
+        assert window.max() == 10.0
+        assert window.min() == 10.0
+
+    @pytest.mark.parametrize("capacity", [1, 2, 7, 50])
+    def test_statistics_match_direct_calculation_over_window(self, capacity):
+        # Arrange
+        rng = np.random.default_rng(42)
+        prices = 1.1 * np.cumprod(1 + rng.normal(0, 0.001, 1_000))
+        window = RollingWindow(capacity)
+        x = np.arange(1, capacity + 1, dtype=np.float64)
+
+        for i, price in enumerate(prices):
+            # Act
+            window.append(price)
+
+            # Assert
+            values = prices[max(0, i + 1 - capacity) : i + 1]
+            mean = values.mean()
+            assert window.max() == values.max()
+            assert window.min() == values.min()
+            assert window.mean() == pytest.approx(mean, rel=1e-12)
+            assert window.sum_xy == pytest.approx((x[: len(values)] * values).sum(), rel=1e-12)
+            assert window.variance(mean) == pytest.approx(values.var(), rel=1e-6, abs=1e-18)
+            assert window.mad(mean) == pytest.approx(np.abs(values - mean).mean(), rel=1e-9)
+            assert window.sum_sq_dev() == pytest.approx(
+                ((values - mean) ** 2).sum(),
+                rel=1e-6,
+                abs=1e-18,
+            )
+
+    def test_sum_sq_residuals_matches_direct_calculation(self):
+        # Arrange
+        window = RollingWindow(4)
+        for value in (3.0, 1.0, 4.0, 1.0, 5.0, 9.0):
+            window.append(value)
+
+        values = window.to_array()
+        x = np.arange(1, 5, dtype=np.float64)
+
+        # Act
+        result = window.sum_sq_residuals(2.0, -1.0)
+
+        # Assert
+        assert result == pytest.approx(((2.0 * x - 1.0 - values) ** 2).sum())
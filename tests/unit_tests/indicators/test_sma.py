@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
 from nautilus_trader.indicators.average.sma import SimpleMovingAverage
 from nautilus_trader.model.enums import PriceType
@@ -171,3 +173,18 @@ class TestSimpleMovingAverage:
         # Assert
         assert not self.sma.initialized
         assert self.sma.value == 0
+
+    def test_update_many_matches_sequential_updates(self):
+        # Arrange
+        values = 1.0 + np.random.default_rng(42).random(1_000) / 100
+        sequential = SimpleMovingAverage(10)
+        for value in values:
+            sequential.update_raw(value)
+
+        # Act
+        self.sma.update_many(values)
+
+        # Assert
+        assert self.sma.initialized
+        assert self.sma.count == sequential.count
+        assert self.sma.value == sequential.value
@@ -305,6 +305,56 @@ def test_orderbook_snapshot(empty_l2_book):
     assert empty_l2_book.best_ask_price() == 1552.15
 
 
+def test_orderbook_snapshot_with_duplicate_levels_keeps_last(empty_l2_book):
+    snapshot = OrderBookSnapshot(
+        instrument_id=empty_l2_book.instrument_id,
+        book_type=BookType.L2_MBP,
+        bids=[[1550.15, 0.51], [1580.00, 1.20], [1570.00, 1.00], [1580.00, 3.00]],
+        asks=[[1582.00, 2.20], [1552.15, 1.51]],
+        ts_event=0,
+        ts_init=0,
+    )
+    empty_l2_book.apply_snapshot(snapshot)
+    assert empty_l2_book.bids.prices() == [1580.00, 1570.00, 1550.15]
+    assert empty_l2_book.bids.volumes() == [3.00, 1.00, 0.51]
+    assert empty_l2_book.asks.prices() == [1552.15, 1582.00]
+    assert empty_l2_book.last_update_id == 6
+    empty_l2_book.check_integrity()
+
+
+def test_orderbook_apply_deltas_batches_adds(empty_l2_book, clock):
+    deltas = OrderBookDeltas(
+        instrument_id=TestIdStubs.audusd_id(),
+        book_type=BookType.L2_MBP,
+        deltas=[
+            OrderBookDelta(
+                instrument_id=TestIdStubs.audusd_id(),
+                book_type=BookType.L2_MBP,
+                action=action,
+                order=Order(price=price, size=size, side=side),
+                ts_event=clock.timestamp(),
+                ts_init=clock.timestamp(),
+            )
+            for action, price, size, side in [
+                (BookAction.ADD, 0.9, 10.0, OrderSide.BUY),
+                (BookAction.ADD, 0.8, 20.0, OrderSide.BUY),
+                (BookAction.ADD, 1.1, 30.0, OrderSide.SELL),
+                (BookAction.DELETE, 0.9, 0.0, OrderSide.BUY),
+                (BookAction.ADD, 1.0, 40.0, OrderSide.SELL),
+                (BookAction.UPDATE, 0.8, 25.0, OrderSide.BUY),
+            ]
+        ],
+        ts_event=clock.timestamp(),
+        ts_init=clock.timestamp(),
+    )
+    empty_l2_book.apply_deltas(deltas)
+    assert empty_l2_book.bids.prices() == [0.8]
+    assert empty_l2_book.bids.volumes() == [25.0]
+    assert empty_l2_book.asks.prices() == [1.0, 1.1]
+    assert empty_l2_book.last_update_id == 7
+    empty_l2_book.check_integrity()
+
+
 def test_orderbook_operation_update(empty_l2_book, clock):
     delta = OrderBookDelta(
         instrument_id=TestIdStubs.audusd_id(),
@@ -64,6 +64,20 @@ def test_insert():
     assert result == expected
 
 
+def test_insert_reverse():
+    orders = [
+        Order(price=101.0, size=10.0, side=OrderSide.BUY, id="1"),
+        Order(price=105.0, size=20.0, side=OrderSide.BUY, id="2"),
+        Order(price=100.0, size=5.0, side=OrderSide.BUY, id="3"),
+        Order(price=103.0, size=5.0, side=OrderSide.BUY, id="4"),
+        Order(price=102.0, size=5.0, side=OrderSide.BUY, id="5"),
+    ]
+    ladder = TestDataStubs.ladder(reverse=True, orders=orders)
+    ladder.delete(orders[3])
+    assert ladder.prices() == [105.0, 102.0, 101.0, 100.0]
+    assert ladder.top().price == 105.0
+
+
 def test_delete_individual_order(asks):
     orders = [
         Order(price=100.0, size=10.0, side=OrderSide.BUY, id="1"),
@@ -108,7 +122,7 @@ def test_exposure():
         Order(price=105.0, size=5.0, side=OrderSide.SELL),
     ]
     ladder = TestDataStubs.ladder(reverse=True, orders=orders)
-    assert tuple(ladder.exposures()) == (525.0, 1000.0, 1010.0)
+    assert tuple(ladder.exposures()) == (525.0, 1010.0, 1000.0)
 
 
 def test_repr(asks):
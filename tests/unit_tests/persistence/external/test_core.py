@@ -15,7 +15,10 @@
 
 import asyncio
 import pickle
+import posixpath
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 
 import fsspec
 import numpy as np
@@ -35,6 +38,8 @@ from nautilus_trader.persistence.catalog import DataCatalog
 from nautilus_trader.persistence.catalog import resolve_path
 from nautilus_trader.persistence.external.core import RawFile
 from nautilus_trader.persistence.external.core import _validate_dataset
+from nautilus_trader.persistence.external.core import compact_data_catalog
+from nautilus_trader.persistence.external.core import compact_dataset
 from nautilus_trader.persistence.external.core import dicts_to_dataframes
 from nautilus_trader.persistence.external.core import process_files
 from nautilus_trader.persistence.external.core import process_raw_file
@@ -44,7 +49,10 @@ from nautilus_trader.persistence.external.core import validate_data_catalog
 from nautilus_trader.persistence.external.core import write_objects
 from nautilus_trader.persistence.external.core import write_parquet
 from nautilus_trader.persistence.external.core import write_tables
+from nautilus_trader.persistence.external.metadata import load_compacted
+from nautilus_trader.persistence.external.metadata import load_ts_index
 from nautilus_trader.persistence.external.readers import CSVReader
+from nautilus_trader.serialization.arrow.util import class_to_filename
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 from tests.test_kit import PACKAGE_ROOT
 from tests.test_kit.mocks.data import MockReader
@@ -224,6 +232,75 @@ class TestPersistenceCore:
         assert dataset.files[0].startswith("/.nautilus/catalog/sample.parquet/instrument_id=a/")
         assert dataset.files[1].startswith("/.nautilus/catalog/sample.parquet/instrument_id=b/")
 
+    def test_write_parquet_writes_sorted_files_with_indexed_row_groups(self):
+        # Arrange
+        catalog = DataCatalog.from_env()
+        fs = catalog.fs
+        root = catalog.path
+        ts_init = np.random.default_rng(42).permutation(10).astype(np.uint64)
+        df = pd.DataFrame(
+            {
+                "value": np.arange(10, dtype=np.float64),
+                "instrument_id": ["a", "b"] * 5,
+                "ts_init": ts_init,
+            }
+        )
+
+        # Act
+        result = write_parquet(
+            fs=fs,
+            path=root / "sample.parquet",
+            df=df,
+            schema=pa.schema(
+                {"value": pa.float64(), "instrument_id": pa.string(), "ts_init": pa.uint64()}
+            ),
+            partition_cols=["instrument_id"],
+        )
+
+        # Assert
+        dataset = ds.dataset(resolve_path(root / "sample.parquet", fs=fs), filesystem=fs)
+        assert len(dataset.files) == 2
+        for fn in dataset.files:
+            values = pq.read_table(fs.open(fn)).column("ts_init").to_pylist()
+            assert values == sorted(values)
+            index = load_ts_index(fs=fs, path=posixpath.dirname(fn))
+            assert index[posixpath.basename(fn)] == [[values[0], values[-1]]]
+        assert sorted(posixpath.basename(fn) for fn in result["ts_ranges"]) == sorted(
+            posixpath.basename(fn) for fn in dataset.files
+        )
+
+    def test_write_objects_to_unmigrated_string_dataset_raises(self):
+        # Arrange
+        path = resolve_path(self.catalog.path / "data" / "quote_tick.parquet", fs=self.fs)
+        self.fs.mkdir(path)
+        legacy_schema = pa.schema(
+            {
+                "instrument_id": pa.dictionary(pa.int64(), pa.string()),
+                "bid": pa.string(),
+                "bid_size": pa.string(),
+                "ask": pa.string(),
+                "ask_size": pa.string(),
+                "ts_event": pa.uint64(),
+                "ts_init": pa.uint64(),
+            },
+            metadata={"type": "QuoteTick"},
+        )
+        pq.write_metadata(legacy_schema, f"{path}/_common_metadata", filesystem=self.fs)
+        quote = QuoteTick(
+            instrument_id=TestIdStubs.audusd_id(),
+            bid=Price.from_str("0.80"),
+            ask=Price.from_str("0.81"),
+            bid_size=Quantity.from_int(1000),
+            ask_size=Quantity.from_int(1000),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            write_objects(catalog=self.catalog, chunk=[quote])
+        assert not self.fs.glob(f"{path}/**/*.parquet")
+
     def test_write_parquet_determine_partitions_writes_instrument_id(
         self,
     ):
@@ -433,6 +510,117 @@ class TestPersistenceCore:
         ]
         assert new_partitions == expected
 
+    @staticmethod
+    def _write_sample(catalog, start_date, periods=5):
+        df = pd.DataFrame(
+            {
+                "value": np.arange(periods, dtype=np.float64),
+                "instrument_id": ["a"] * periods,
+                "ts_init": [
+                    int(ts.to_datetime64())
+                    for ts in pd.date_range(start_date, periods=periods, freq="12H", tz="UTC")
+                ],
+            }
+        )
+        write_parquet(
+            fs=catalog.fs,
+            path=catalog.path / "sample.parquet",
+            df=df,
+            schema=pa.schema(
+                {"value": pa.float64(), "instrument_id": pa.string(), "ts_init": pa.uint64()}
+            ),
+            partition_cols=["instrument_id"],
+        )
+
+    def test_compact_dataset_merges_sorts_and_deduplicates(self):
+        # Arrange
+        catalog = DataCatalog.from_env()
+        fs = catalog.fs
+        path = resolve_path(catalog.path / "sample.parquet", fs=fs)
+        partition = f"{path}/instrument_id=a"
+
+        # Write out of order and overlapping blocks, with duplicated rows
+        self._write_sample(catalog=catalog, start_date="2020-01-03 12:00")
+        self._write_sample(catalog=catalog, start_date="2020-01-01")
+        self._write_sample(catalog=catalog, start_date="2020-01-01", periods=3)
+
+        # Act
+        compact_dataset(catalog=catalog, path=path, dedup_cols=["value"])
+
+        # Assert
+        files = sorted(fs.glob(f"{partition}/*.parquet"))
+        assert files == [
+            f"{partition}/20200101.parquet",
+            f"{partition}/20200102.parquet",
+            f"{partition}/20200103.parquet",
+            f"{partition}/20200104.parquet",
+            f"{partition}/20200105.parquet",
+        ]
+        ts_init = [pq.read_table(fs.open(fn)).column("ts_init").to_pylist() for fn in files]
+        assert [len(values) for values in ts_init] == [2, 2, 2, 2, 2]
+        assert sum(ts_init, []) == sorted(set(sum(ts_init, [])))
+        assert load_compacted(fs=fs, path=partition) == {
+            "20200101.parquet": "20200101",
+            "20200102.parquet": "20200102",
+            "20200103.parquet": "20200103",
+            "20200104.parquet": "20200104",
+            "20200105.parquet": "20200105",
+        }
+        assert sorted(load_ts_index(fs=fs, path=partition)) == [
+            posixpath.basename(fn) for fn in files
+        ]
+
+    def test_compact_dataset_only_rewrites_partitions_with_new_data(self):
+        # Arrange
+        catalog = DataCatalog.from_env()
+        fs = catalog.fs
+        path = resolve_path(catalog.path / "sample.parquet", fs=fs)
+        partition = f"{path}/instrument_id=a"
+        self._write_sample(catalog=catalog, start_date="2020-01-01")
+        compact_dataset(catalog=catalog, path=path)
+        untouched = fs.cat(f"{partition}/20200101.parquet")
+
+        # Act
+        self._write_sample(catalog=catalog, start_date="2020-01-03 06:00", periods=1)
+        compact_dataset(catalog=catalog, path=path)
+
+        # Assert
+        assert fs.cat(f"{partition}/20200101.parquet") == untouched
+        assert len(fs.glob(f"{partition}/*.parquet")) == 3
+        assert pq.read_table(fs.open(f"{partition}/20200103.parquet")).num_rows == 2
+
+    def test_compact_dataset_splits_files_by_target_size(self):
+        # Arrange
+        catalog = DataCatalog.from_env()
+        fs = catalog.fs
+        path = resolve_path(catalog.path / "sample.parquet", fs=fs)
+        partition = f"{path}/instrument_id=a"
+        self._write_sample(catalog=catalog, start_date="2020-01-01", periods=2)
+
+        # Act
+        compact_dataset(catalog=catalog, path=path, target_file_size=1)
+
+        # Assert
+        assert sorted(fs.glob(f"{partition}/*.parquet")) == [
+            f"{partition}/20200101-1.parquet",
+            f"{partition}/20200101.parquet",
+        ]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Currently flaky on Windows")
+    def test_compact_data_catalog_with_executor(self):
+        # Arrange
+        self._loaded_data_into_catalog()
+        expected = self.catalog.trade_ticks()
+
+        # Act
+        with ThreadPoolExecutor() as executor:
+            compact_data_catalog(catalog=self.catalog, executor=executor)
+
+        # Assert
+        path = resolve_path(self.catalog.path / "data" / "trade_tick.parquet", fs=self.fs)
+        assert all(fn.endswith("/20191220.parquet") for fn in self.fs.glob(f"{path}/**/*.parquet"))
+        assert len(self.catalog.trade_ticks()) == len(expected)
+
     def test_split_and_serialize_generic_data_gets_correct_class(self):
         # Arrange
         TestPersistenceStubs.setup_news_event_persistence()
@@ -482,3 +670,34 @@ class TestPersistenceCore:
 
         write_objects(catalog=self.catalog, chunk=chunk2)
         assert len(self.catalog.generic_data(NewsEventData)) == 15
+
+    def test_process_files_with_process_pool_writes_data_and_merged_metadata(self, tmp_path):
+        # Arrange
+        TestPersistenceStubs.setup_news_event_persistence()
+        catalog = DataCatalog(path=str(tmp_path))
+        expected = process_files(
+            glob_path=f"{TEST_DATA_DIR}/news_events.csv",
+            reader=CSVReader(block_parser=TestPersistenceStubs.news_event_parser),
+            catalog=self.catalog,
+        )
+
+        # Act
+        result = process_files(
+            glob_path=f"{TEST_DATA_DIR}/news_events.csv",
+            reader=CSVReader(block_parser=TestPersistenceStubs.news_event_parser),
+            catalog=catalog,
+            executor=ProcessPoolExecutor(
+                max_workers=2,
+                # Spawned workers (macOS, Windows) do not inherit the registration
+                initializer=TestPersistenceStubs.setup_news_event_persistence,
+            ),
+        )
+
+        # Assert
+        name = f"{class_to_filename(NewsEventData)}.parquet"
+        path = resolve_path(catalog.path / "data" / name, fs=catalog.fs)
+        assert list(result.values()) == list(expected.values())
+        assert len(catalog.generic_data(NewsEventData)) == len(
+            self.catalog.generic_data(NewsEventData)
+        )
+        assert catalog.fs.exists(f"{path}/_common_metadata")
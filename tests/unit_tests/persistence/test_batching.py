@@ -15,18 +15,27 @@
 
 
 import fsspec
+import pytest
 
 from nautilus_trader.adapters.betfair.providers import BetfairInstrumentProvider
 from nautilus_trader.backtest.node import BacktestNode
 from nautilus_trader.config import BacktestDataConfig
 from nautilus_trader.config import BacktestEngineConfig
 from nautilus_trader.config import BacktestRunConfig
+from nautilus_trader.model.data.tick import TradeTick
 from nautilus_trader.model.data.venue import InstrumentStatusUpdate
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.orderbook.data import OrderBookData
 from nautilus_trader.persistence.batching import batch_files
+from nautilus_trader.persistence.batching import prefetch
 from nautilus_trader.persistence.catalog import DataCatalog
 from nautilus_trader.persistence.catalog import resolve_path
 from nautilus_trader.persistence.external.core import process_files
+from nautilus_trader.persistence.external.core import write_objects
 from nautilus_trader.persistence.external.readers import CSVReader
 from nautilus_trader.persistence.funcs import parse_bytes
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
@@ -86,6 +95,124 @@ class TestPersistenceBatching:
             latest_timestamp = max(timestamps)
             assert timestamps == sorted(timestamps)
 
+    def test_batch_files_merges_all_rows_in_order(self):
+        # Arrange
+        instrument_ids = self.catalog.instruments()["id"].unique().tolist()
+        base = BacktestDataConfig(
+            catalog_path=str(self.catalog.path),
+            catalog_fs_protocol=self.catalog.fs.protocol,
+            data_cls=TradeTick,
+        )
+
+        # Act
+        batches = list(
+            batch_files(
+                catalog=self.catalog,
+                data_configs=[base.replace(instrument_id=i) for i in instrument_ids],
+                target_batch_size_bytes=parse_bytes("1kib"),
+                read_num_rows=50,
+            )
+        )
+
+        # Assert
+        ticks = [tick for batch in batches for tick in batch]
+        assert len(batches) > 1
+        assert len(ticks) == len(self.catalog.trade_ticks())
+        assert [t.ts_init for t in ticks] == sorted(t.ts_init for t in ticks)
+
+    def test_batch_files_with_staggered_files_merges_all_rows(self):
+        # Arrange
+        ranges = {"A.SIM": range(1, 6), "B.SIM": range(3, 8), "C.SIM": range(4, 10)}
+        ticks = [
+            TradeTick(
+                instrument_id=InstrumentId.from_str(instrument_id),
+                price=Price.from_str("1.00001"),
+                size=Quantity.from_int(100_000),
+                aggressor_side=AggressorSide.BUY,
+                trade_id=TradeId(str(ts)),
+                ts_event=ts,
+                ts_init=ts,
+            )
+            for instrument_id, timestamps in ranges.items()
+            for ts in timestamps
+        ]
+        write_objects(catalog=self.catalog, chunk=ticks)
+        base = BacktestDataConfig(
+            catalog_path=str(self.catalog.path),
+            catalog_fs_protocol=self.catalog.fs.protocol,
+            data_cls=TradeTick,
+        )
+
+        # Act
+        batches = list(
+            batch_files(
+                catalog=self.catalog,
+                data_configs=[base.replace(instrument_id=i) for i in ranges],
+                read_num_rows=10,
+            )
+        )
+
+        # Assert
+        result = [tick.ts_init for batch in batches for tick in batch]
+        assert result == sorted(tick.ts_init for tick in ticks)
+
+    def test_prefetch_yields_all_items_in_order(self):
+        # Arrange, Act
+        result = list(prefetch(iter(range(100)), size=2))
+
+        # Assert
+        assert result == list(range(100))
+
+    @pytest.mark.parametrize("size", [0, -1])
+    def test_prefetch_with_non_positive_size_raises_value_error(self, size):
+        # Arrange
+        iterator = prefetch(iter(range(10)), size=size)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            next(iterator)
+
+    def test_prefetch_reraises_producer_exception(self):
+        # Arrange
+        def items():
+            yield 1
+            raise ValueError("No data found, check data_configs")
+
+        # Act
+        iterator = prefetch(items(), size=2)
+
+        # Assert
+        assert next(iterator) == 1
+        with pytest.raises(ValueError):
+            next(iterator)
+
+    def test_prefetch_reraises_producer_base_exception(self):
+        # Arrange
+        class Interrupt(BaseException):
+            pass
+
+        def items():
+            yield 1
+            raise Interrupt()
+
+        # Act
+        iterator = prefetch(items(), size=2)
+
+        # Assert
+        assert next(iterator) == 1
+        with pytest.raises(Interrupt):
+            next(iterator)
+
+    def test_prefetch_yields_exception_items(self):
+        # Arrange
+        items = [ValueError("item"), 2]
+
+        # Act
+        result = list(prefetch(iter(items), size=1))
+
+        # Assert
+        assert result == items
+
     def test_batch_generic_data(self):
         # Arrange
         TestPersistenceStubs.setup_news_event_persistence()
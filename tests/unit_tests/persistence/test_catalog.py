@@ -19,6 +19,7 @@ import sys
 from decimal import Decimal
 
 import fsspec
+import pandas as pd
 import pyarrow.dataset as ds
 import pytest
 
@@ -188,6 +189,53 @@ class TestPersistenceCatalog:
         # this instrument_id should be AUD/USD not AUD-USD
         assert df.iloc[0]["instrument_id"] == instrument.id.value
 
+    def test_data_catalog_quote_ticks_df_has_decimal_string_prices(self):
+        # Arrange
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        tick = QuoteTick(
+            instrument_id=instrument.id,
+            bid=Price.from_str("0.70001"),
+            ask=Price.from_str("0.70003"),
+            bid_size=Quantity.from_int(1_000_000),
+            ask_size=Quantity.from_str("2.5"),
+            ts_init=0,
+            ts_event=0,
+        )
+        write_objects(catalog=self.catalog, chunk=[tick])
+
+        # Act
+        df = self.catalog.quote_ticks()
+
+        # Assert
+        row = df.iloc[0]
+        assert (row["bid"], row["ask"]) == ("0.70001", "0.70003")
+        assert (row["bid_size"], row["ask_size"]) == ("1000000", "2.5")
+        assert "price_precision" not in df.columns
+
+    def test_handle_table_nautilus_deserializes_dataframe_rows(self):
+        # Arrange
+        TestPersistenceStubs.setup_news_event_persistence()
+        df = pd.DataFrame(
+            {
+                "name": ["CPI", "NFP"],
+                "impact": ["HIGH", "LOW"],
+                "currency": ["USD", "EUR-x"],
+                "ts_event": [0, 1],
+                "ts_init": [0, 1],
+            }
+        )
+
+        # Act
+        events = DataCatalog._handle_table_nautilus(
+            table=df,
+            cls=NewsEventData,
+            mappings={"currency": {"EUR-x": "EUR"}},
+        )
+
+        # Assert
+        assert [e.name for e in events] == ["CPI", "NFP"]
+        assert [e.currency.code for e in events] == ["USD", "EUR"]
+
     def test_data_catalog_filter(self):
         # Arrange, Act
         deltas = self.catalog.order_book_deltas()
@@ -216,6 +264,21 @@ class TestPersistenceCatalog:
         filtered_deltas = self.catalog.order_book_deltas(filter_expr=ds.field("action") == "DELETE")
         assert len(filtered_deltas) == 351
 
+    def test_data_catalog_query_time_range_skips_files_outside_range(self):
+        # Arrange
+        full_path = self.catalog._make_path(cls=TradeTick)
+        dataset = ds.dataset(full_path, partitioning="hive", filesystem=self.fs)
+
+        # Act
+        in_range = self.catalog._prune_dataset(dataset, start=0, end=sys.maxsize)
+        out_of_range = self.catalog._prune_dataset(dataset, start=0, end=1)
+        ticks = self.catalog.trade_ticks(end=1, as_nautilus=True)
+
+        # Assert
+        assert len(in_range.files) == len(dataset.files)
+        assert len(out_of_range.files) == 0
+        assert len(ticks) == 0
+
     def test_data_catalog_generic_data(self):
         TestPersistenceStubs.setup_news_event_persistence()
         process_files(
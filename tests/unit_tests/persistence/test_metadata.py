@@ -16,10 +16,13 @@
 import fsspec
 
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.model.data.tick import TradeTick
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.persistence.catalog import DataCatalog
 from nautilus_trader.persistence.external.core import write_objects
 from nautilus_trader.persistence.external.metadata import load_mappings
+from nautilus_trader.persistence.external.metadata import load_ts_index
+from nautilus_trader.persistence.external.metadata import ts_index_row_groups
 from tests.test_kit.mocks.data import data_catalog_setup
 from tests.test_kit.stubs.data import TestDataStubs
 
@@ -49,3 +52,24 @@ class TestPersistenceBatching:
             }
         }
         assert meta == expected
+
+    def test_write_objects_indexes_row_group_ts_init(self):
+        # Arrange
+        audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD", Venue("OANDA"))
+        trade1 = TestDataStubs.trade_tick_3decimal(instrument_id=audusd.id)
+        trade2 = TradeTick.from_dict(
+            {**TradeTick.to_dict(trade1), "ts_event": 1_000, "ts_init": 1_000},
+        )
+
+        # Act
+        write_objects(self.catalog, [trade1, trade2])
+
+        # Assert
+        path = "/.nautilus/catalog/data/trade_tick.parquet/instrument_id=AUD-USD.OANDA"
+        index = load_ts_index(fs=self.fs, path=path)
+        [(name, ranges)] = index.items()
+        assert ranges == [[0, 1_000]]
+        fn = f"{path}/{name}"
+        assert ts_index_row_groups(fs=self.fs, fn=fn, start=500, end=2_000) == [0]
+        assert ts_index_row_groups(fs=self.fs, fn=fn, start=2_000, end=3_000) == []
+        assert ts_index_row_groups(fs=self.fs, fn=f"{path}/other.parquet", start=0, end=1) is None
@@ -16,10 +16,14 @@
 import sys
 from collections import Counter
 
+import pyarrow as pa
 import pytest
 
 from nautilus_trader.adapters.betfair.providers import BetfairInstrumentProvider
 from nautilus_trader.backtest.node import BacktestNode
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.common.logging import LoggerAdapter
 from nautilus_trader.config import BacktestDataConfig
 from nautilus_trader.config import BacktestEngineConfig
 from nautilus_trader.config import BacktestRunConfig
@@ -29,11 +33,13 @@ from nautilus_trader.persistence.catalog import DataCatalog
 from nautilus_trader.persistence.catalog import resolve_path
 from nautilus_trader.persistence.external.core import process_files
 from nautilus_trader.persistence.external.readers import CSVReader
+from nautilus_trader.persistence.streaming import StreamingFeatherWriter
 from nautilus_trader.persistence.streaming import generate_signal_class
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 from tests.test_kit import PACKAGE_ROOT
 from tests.test_kit.mocks.data import NewsEventData
 from tests.test_kit.mocks.data import data_catalog_setup
+from tests.test_kit.stubs.data import TestDataStubs
 from tests.test_kit.stubs.persistence import TestPersistenceStubs
 
 
@@ -158,6 +164,27 @@ class TestPersistenceStreaming:
         result = Counter([r.__class__.__name__ for r in result])
         assert result["NewsEventData"] == 86985
 
+    def test_feather_writer_writes_record_batches_of_batch_size(self):
+        # Arrange
+        writer = StreamingFeatherWriter(
+            path=str(self.catalog.path / "stream"),
+            fs_protocol=self.catalog.fs_protocol,
+            logger=LoggerAdapter(component_name="Writer", logger=Logger(TestClock(), bypass=True)),
+            flush_interval_ms=60_000,
+            batch_size=3,
+        )
+
+        # Act
+        for _ in range(5):
+            writer.write(TestDataStubs.trade_tick_5decimal())
+        writer.close()
+
+        # Assert
+        path = str(self.catalog.path / "stream" / "TradeTick.feather")
+        with self.fs.open(path, "rb") as f:
+            batches = list(pa.ipc.open_stream(f))
+        assert [batch.num_rows for batch in batches] == [3, 2]
+
     def test_generate_signal_class(self):
         # Arrange
         cls = generate_signal_class(name="test")
@@ -17,6 +17,7 @@ import copy
 import os
 from typing import Any
 
+import pyarrow as pa
 import pytest
 from fsspec.implementations.memory import MemoryFileSystem
 
@@ -41,6 +42,7 @@ from nautilus_trader.model.position import Position
 from nautilus_trader.persistence.catalog import DataCatalog
 from nautilus_trader.persistence.external.core import write_objects
 from nautilus_trader.serialization.arrow.serializer import ParquetSerializer
+from nautilus_trader.serialization.arrow.serializer import get_schema
 from tests.test_kit.stubs.data import TestDataStubs
 from tests.test_kit.stubs.events import TestEventStubs
 from tests.test_kit.stubs.execution import TestExecStubs
@@ -126,6 +128,38 @@ class TestParquetSerializer:
         bar = TestDataStubs.bar_5decimal()
         self._test_serialization(obj=bar)
 
+    def test_serialize_quote_tick_stores_fixed_point_values(self):
+        # Arrange
+        tick = TestDataStubs.quote_tick_5decimal()
+
+        # Act
+        result = ParquetSerializer.serialize(tick)
+
+        # Assert
+        assert result["bid"] == tick.bid.raw
+        assert result["ask_size"] == tick.ask_size.raw
+        assert result["price_precision"] == 5
+        assert result["size_precision"] == tick.bid_size.precision
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            TestDataStubs.quote_tick_5decimal(),
+            TestDataStubs.trade_tick_5decimal(),
+            TestDataStubs.bar_5decimal(),
+        ],
+    )
+    def test_deserialize_legacy_string_values(self, obj):
+        # Arrange
+        cls = type(obj)
+        legacy = cls.to_dict(obj)  # Decimal string values
+
+        # Act
+        [result] = ParquetSerializer.deserialize(cls=cls, chunk=[legacy])
+
+        # Assert
+        assert result == obj
+
     def test_serialize_and_deserialize_order_book_delta(self):
         delta = OrderBookDelta(
             instrument_id=TestIdStubs.audusd_id(),
@@ -261,6 +295,39 @@ class TestParquetSerializer:
         assert deserialized == [book]
         write_objects(catalog=self.catalog, chunk=[book])
 
+    @pytest.mark.parametrize(
+        "objs",
+        [
+            [TestDataStubs.quote_tick_5decimal(), TestDataStubs.quote_tick_3decimal()],
+            [TestDataStubs.trade_tick_5decimal(), TestDataStubs.trade_tick_3decimal()],
+            [TestDataStubs.bar_5decimal(), TestDataStubs.bar_5decimal()],
+        ],
+    )
+    def test_deserialize_table_matches_row_deserialization(self, objs):
+        # Arrange
+        cls = type(objs[0])
+        rows = [ParquetSerializer.serialize(obj) for obj in objs]
+        table = pa.Table.from_pylist(rows, schema=get_schema(cls))
+
+        # Act
+        result = ParquetSerializer.deserialize_table(cls=cls, table=table)
+
+        # Assert
+        assert result == objs
+        assert result == ParquetSerializer.deserialize(cls=cls, chunk=rows)
+
+    def test_deserialize_table_order_book_snapshot(self):
+        # Arrange
+        book = TestDataStubs.order_book_snapshot()
+        rows = ParquetSerializer.serialize(book)
+        table = pa.Table.from_pylist(rows)
+
+        # Act
+        result = ParquetSerializer.deserialize_table(cls=OrderBookSnapshot, table=table)
+
+        # Assert
+        assert result == [book]
+
     def test_serialize_and_deserialize_component_state_changed(self):
         event = TestEventStubs.component_state_changed()
 